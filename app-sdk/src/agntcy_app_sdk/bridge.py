@@ -4,15 +4,30 @@
 from agntcy_app_sdk.transports.transport import BaseTransport
 from agntcy_app_sdk.protocols.message import Message
 from agntcy_app_sdk.common.logging_config import get_logger
-from typing import Callable
+from agntcy_app_sdk.transports.pending import correlate
+from agntcy_app_sdk.transports.streaming import frame_stream, is_stream
+from typing import Callable, Optional
 import asyncio
 
 logger = get_logger(__name__)
 
+# Default number of messages handled concurrently by a bridge
+DEFAULT_MAX_CONCURRENCY = 16
+
+# Default number of messages waiting for a handler before the transport is held back
+DEFAULT_QUEUE_SIZE = 256
+
+# Default seconds a cancelled bridge waits for its messages to be handled
+DEFAULT_DRAIN_TIMEOUT = 10.0
+
 
 class MessageBridge:
     """
     Bridge connecting message transport with request handlers.
+
+    Messages delivered by the transport are put on a bounded ingress queue and
+    handled by a fixed number of worker tasks. When the queue is full, the
+    transport callback waits, applying backpressure to the transport.
     """
 
     def __init__(
@@ -20,37 +35,149 @@ class MessageBridge:
         transport: BaseTransport,
         handler: Callable[[Message], Message],
         topic: str,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        queue_group: Optional[str] = None,
     ):
+        """
+        :param transport: The transport messages are received from.
+        :param handler: Coroutine function handling a message and returning the response.
+        :param topic: The topic to subscribe to.
+        :param max_concurrency: Number of messages handled concurrently.
+        :param queue_size: Number of messages waiting for a handler, 0 for unbounded.
+        :param queue_group: Optional queue group of the subscription, bridges
+            sharing it share the messages of the topic, for transports
+            supporting it.
+        """
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be greater than 0")
+
         self.transport = transport
         self.handler = handler
         self.topic = topic
+        self.max_concurrency = max_concurrency
+        self.queue_group = queue_group
+
+        self._queue: asyncio.Queue[tuple[Message, asyncio.Future]] = asyncio.Queue(
+            maxsize=queue_size
+        )
+        self._workers: list[asyncio.Task] = []
+        self._accepting = False
+        self._stopped = asyncio.Event()
 
     async def start(self, blocking: bool = False):
         """Start all components of the bridge."""
-        # Set up message handling flow
-        self.transport.set_callback(self._process_message)
+        if not self._workers:
+            self._accepting = True
+            self._stopped.clear()
+            self._workers = [
+                asyncio.create_task(self._worker()) for _ in range(self.max_concurrency)
+            ]
 
-        # Start all components
-        await self.transport.subscribe(self.topic)
+            # Set up message handling flow
+            self.transport.set_callback(self._enqueue)
+
+            # Start all components
+            if self.queue_group:
+                await self.transport.subscribe(self.topic, queue_group=self.queue_group)
+            else:
+                await self.transport.subscribe(self.topic)
 
-        logger.info("Message bridge started.")
+            logger.info(f"Message bridge started with {self.max_concurrency} workers.")
 
         if blocking:
             # Run the loop forever if blocking is True
             await self.loop_forever()
 
-    async def loop_forever(self):
-        """Run the bridge indefinitely."""
+    async def loop_forever(
+        self, drain_timeout: Optional[float] = DEFAULT_DRAIN_TIMEOUT
+    ):
+        """
+        Run the bridge until it is stopped, draining it if cancelled.
+
+        :param drain_timeout: Seconds to wait for the drain once cancelled, the
+            cancellation being raised again afterwards.
+        """
         logger.info("Message bridge is running. Waiting for messages...")
+        try:
+            await self._stopped.wait()
+        except asyncio.CancelledError:
+            logger.info("Message bridge loop cancelled.")
+            await self.stop(timeout=drain_timeout)
+            raise
+
+    async def stop(self, timeout: Optional[float] = None):
+        """
+        Stop the bridge gracefully: stop accepting messages, wait for the queued
+        and in-flight ones to be handled, then stop the workers.
+
+        :param timeout: Seconds to wait for the drain, None to wait until done.
+        """
+        if not self._workers:
+            return
+
+        self._accepting = False
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Message bridge stopped with {self._queue.qsize()} messages unhandled."
+            )
+
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+        # fail whatever was left behind by the timeout
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            self._queue.task_done()
+            if not future.done():
+                future.set_exception(RuntimeError("Message bridge stopped"))
+
+        self._stopped.set()
+        logger.info("Message bridge stopped.")
+
+    async def _enqueue(self, message: Message):
+        """
+        Transport callback, queue the message for the workers.
+
+        When the bridge replies itself, the transport is released as soon as the
+        message is queued. Otherwise the response is returned to the transport.
+        """
+        if not self._accepting:
+            error = RuntimeError("Message bridge is stopping")
+            if not message.reply_to:
+                # let the transport deliver the message again, if it can
+                raise error
+            await self._send_error(message, error)
+            return None
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((message, future))
+
+        if message.reply_to:
+            return None
+        return await future
+
+    async def _worker(self):
         while True:
+            message, future = await self._queue.get()
             try:
-                # Wait for messages to be processed
-                await asyncio.sleep(0.1)
+                # the transport may have given up on the message meanwhile
+                if not future.done():
+                    future.set_result(await self._process_message(message))
             except asyncio.CancelledError:
-                logger.info("Message bridge loop cancelled.")
-                break
+                # stopped by the drain timeout, release whoever waits for it
+                if not future.done():
+                    future.set_exception(RuntimeError("Message bridge stopped"))
+                raise
             except Exception as e:
-                logger.error(f"Error in message bridge loop: {e}")
+                if not future.done():
+                    future.set_exception(e)
+            finally:
+                self._queue.task_done()
 
     async def _process_message(self, message: Message):
         """Process an incoming message through the handler and send response."""
@@ -63,27 +190,46 @@ class MessageBridge:
                 return
 
             # Send response if reply is expected
-            if message.reply_to:
-                response.reply_to = message.reply_to
-
-                # Send the response back through the transport using publish
-                await self.transport.publish(
-                    topic=response.reply_to,
-                    message=response,
-                    respond=False,
-                )
-            else:
+            if not message.reply_to:
                 return response
 
+            if is_stream(response):
+                # each chunk of a streamed response is sent as it is produced
+                async for chunk in frame_stream(response):
+                    await self._reply(message, chunk)
+            else:
+                await self._reply(message, response)
+
         except Exception as e:
             logger.error(f"Error processing message: {e}")
-            # Send error response if reply is expected
-            if message.reply_to:
-                error_response = Message(
-                    type="error", payload=str(e), reply_to=message.reply_to
-                )
-                await self.transport.publish(
-                    topic=message.reply_to,
-                    message=error_response,
-                    respond=False,
-                )
+            await self._send_error(message, e)
+
+    async def _reply(self, message: Message, response: Message):
+        """Send a response to the reply topic of a message."""
+        response.reply_to = message.reply_to
+        correlate(response, message, self.transport.sender_id)
+        # answer in the wire format the request was sent in
+        response.wire_format = response.wire_format or message.wire_format
+
+        # Send the response back through the transport using publish
+        await self.transport.publish(
+            topic=response.reply_to,
+            message=response,
+            respond=False,
+        )
+
+    async def _send_error(self, message: Message, error: Exception):
+        """Send an error response if reply is expected."""
+        if message.reply_to:
+            error_response = Message(
+                type="error",
+                payload=str(error),
+                reply_to=message.reply_to,
+                wire_format=message.wire_format,
+            )
+            correlate(error_response, message, self.transport.sender_id)
+            await self.transport.publish(
+                topic=message.reply_to,
+                message=error_response,
+                respond=False,
+            )
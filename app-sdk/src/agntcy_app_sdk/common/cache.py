@@ -0,0 +1,110 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterator, Optional
+import time
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    A size-bounded LRU mapping whose entries optionally expire after a time-to-live.
+
+    Expired entries are dropped lazily, when they are looked up or when room is
+    needed for a new entry. The cache is not thread-safe; it is meant to be used
+    from a single asyncio event loop.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: Optional[float] = None,
+        on_evict: Optional[Callable[[Hashable, Any], None]] = None,
+    ):
+        """
+        :param maxsize: Maximum number of entries, the least recently used is evicted first.
+        :param ttl: Default time-to-live in seconds, None for entries that never expire.
+        :param on_evict: Optional callback invoked with (key, value) when an entry is
+            evicted or expires. It is not invoked by pop() or clear().
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be greater than 0")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._on_evict = on_evict
+        # key -> (value, expiry timestamp or None)
+        self._data: OrderedDict[Hashable, tuple[Any, Optional[float]]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(list(self._data.keys()))
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value for key if present and not expired, marking it as recently used."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            self._evicted(key, value)
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = _MISSING) -> None:
+        """
+        Insert or replace an entry.
+
+        :param ttl: Time-to-live in seconds for this entry, defaults to the cache ttl.
+        """
+        if ttl is _MISSING:
+            ttl = self.ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+
+        self._data[key] = (value, expires_at)
+        self._data.move_to_end(key)
+
+        if len(self._data) > self.maxsize:
+            self.expire()
+        while len(self._data) > self.maxsize:
+            old_key, (old_value, _) = self._data.popitem(last=False)
+            self._evicted(old_key, old_value)
+
+    __setitem__ = set
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove an entry and return its value, without invoking on_evict."""
+        entry = self._data.pop(key, None)
+        return default if entry is None else entry[0]
+
+    def expire(self) -> list[Hashable]:
+        """Drop all expired entries and return their keys."""
+        now = time.monotonic()
+        expired = [
+            key
+            for key, (_, expires_at) in self._data.items()
+            if expires_at is not None and expires_at <= now
+        ]
+        for key in expired:
+            value, _ = self._data.pop(key)
+            self._evicted(key, value)
+        return expired
+
+    def clear(self) -> None:
+        """Remove all entries, without invoking on_evict."""
+        self._data.clear()
+
+    def _evicted(self, key: Hashable, value: Any) -> None:
+        if self._on_evict is not None:
+            self._on_evict(key, value)
@@ -0,0 +1,124 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Any, Awaitable, Callable, Hashable, Optional
+import asyncio
+import inspect
+
+from agntcy_app_sdk.common.logging_config import configure_logging, get_logger
+
+configure_logging()
+logger = get_logger(__name__)
+
+
+async def close_client(client: Any) -> None:
+    """Close a client, if it holds anything to close."""
+    close = getattr(client, "close", None)
+    if close is None:
+        return
+
+    try:
+        result = close()
+        if inspect.isawaitable(result):
+            await result
+    except Exception as e:
+        logger.warning(f"Failed to close client {client}: {e}")
+
+
+class _Entry:
+    def __init__(self, client: Any):
+        self.client = client
+        self.refs = 0
+        self.idle_timer: Optional[asyncio.TimerHandle] = None
+
+
+class ClientCache:
+    """
+    Reference-counted cache of clients, shared by the callers asking for the
+    same key.
+
+    A client is created on the first acquire() of its key, concurrent ones
+    waiting for it, and closed once it has not been acquired for idle_timeout
+    seconds after its last release().
+    """
+
+    def __init__(self, idle_timeout: Optional[float] = 300.0):
+        """
+        :param idle_timeout: Seconds an unused client is kept, None to keep
+            clients until the cache is closed.
+        """
+        self.idle_timeout = idle_timeout
+        self._entries: dict[Hashable, _Entry] = {}
+        self._creating: dict[Hashable, asyncio.Future] = {}
+        self._closing: set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    async def acquire(self, key: Hashable, create: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the client of key, creating it with create() if there is none.
+        Each call must be matched by a release() of the client.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            creating = self._creating.get(key)
+            if creating is None:
+                creating = asyncio.ensure_future(self._create(key, create))
+                self._creating[key] = creating
+            # a caller giving up must not fail the others
+            entry = await asyncio.shield(creating)
+
+        entry.refs += 1
+        if entry.idle_timer is not None:
+            entry.idle_timer.cancel()
+            entry.idle_timer = None
+        return entry.client
+
+    def release(self, client: Any) -> None:
+        """Give back a client, scheduling its closing if it is no longer used."""
+        for key, entry in self._entries.items():
+            if entry.client is client:
+                break
+        else:
+            logger.warning(f"Releasing a client that is not cached: {client}")
+            return
+
+        entry.refs = max(entry.refs - 1, 0)
+        if entry.refs == 0 and self.idle_timeout is not None:
+            entry.idle_timer = asyncio.get_running_loop().call_later(
+                self.idle_timeout, self._evict, key, entry
+            )
+
+    async def close(self) -> None:
+        """Close all clients, whether in use or not."""
+        entries, self._entries = self._entries, {}
+        for entry in entries.values():
+            if entry.idle_timer is not None:
+                entry.idle_timer.cancel()
+            await close_client(entry.client)
+
+        if self._closing:
+            await asyncio.gather(*self._closing)
+
+    async def _create(
+        self, key: Hashable, create: Callable[[], Awaitable[Any]]
+    ) -> _Entry:
+        try:
+            entry = self._entries[key] = _Entry(await create())
+            return entry
+        finally:
+            del self._creating[key]
+
+    def _evict(self, key: Hashable, entry: _Entry) -> None:
+        if self._entries.get(key) is not entry or entry.refs > 0:
+            return
+
+        del self._entries[key]
+        logger.debug(f"Closing idle client {key}")
+        task = asyncio.create_task(close_client(entry.client))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
@@ -0,0 +1,83 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Awaitable, Callable, Hashable, Optional
+import asyncio
+
+from agntcy_app_sdk.common.logging_config import configure_logging, get_logger
+
+configure_logging()
+logger = get_logger(__name__)
+
+
+class KeyedTaskRunner:
+    """
+    Runs coroutines concurrently, with a bound on the number of them in flight
+    and in submission order for coroutines submitted with the same key.
+
+    A coroutine waiting for a predecessor with the same key counts against the
+    bound, so that submit() holds the caller back once the bound is reached.
+    """
+
+    def __init__(self, max_concurrency: int = 16):
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be greater than 0")
+
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        # last task submitted for each key, the next one with that key awaits it
+        self._tails: dict[Hashable, asyncio.Task] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    async def submit(
+        self, func: Callable[[], Awaitable], key: Optional[Hashable] = None
+    ) -> asyncio.Task:
+        """
+        Schedule func(), waiting first if max_concurrency coroutines are in flight.
+
+        :param func: Coroutine function to run, its errors are logged.
+        :param key: Coroutines with the same key run one after the other, None
+            for no ordering.
+        """
+        await self._semaphore.acquire()
+
+        previous = self._tails.get(key) if key is not None else None
+        task = asyncio.create_task(self._run(func, key, previous))
+        self._tasks.add(task)
+        if key is not None:
+            self._tails[key] = task
+        return task
+
+    async def join(self) -> None:
+        """Wait for the submitted coroutines to finish."""
+        while self._tasks:
+            await asyncio.wait(set(self._tasks))
+
+    def cancel(self) -> None:
+        """Cancel the submitted coroutines."""
+        for task in self._tasks:
+            task.cancel()
+
+    async def _run(
+        self,
+        func: Callable[[], Awaitable],
+        key: Optional[Hashable],
+        previous: Optional[asyncio.Task],
+    ) -> None:
+        task = asyncio.current_task()
+        try:
+            if previous is not None:
+                await asyncio.wait({previous})
+            await func()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error running task for key {key}: {e}")
+        finally:
+            self._semaphore.release()
+            self._tasks.discard(task)
+            if key is not None and self._tails.get(key) is task:
+                del self._tails[key]
@@ -0,0 +1,42 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Optional
+import importlib.util
+
+import httpx
+
+from agntcy_app_sdk.common.logging_config import configure_logging, get_logger
+
+configure_logging()
+logger = get_logger(__name__)
+
+# Connections kept to HTTP agents, shared by all the clients of a factory
+DEFAULT_HTTP_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0
+)
+# The httpx default, requests to agents not to wait forever
+DEFAULT_HTTP_TIMEOUT = httpx.Timeout(5.0)
+
+
+def create_http_client(
+    limits: Optional[httpx.Limits] = None,
+    timeout: httpx.Timeout | float | None = DEFAULT_HTTP_TIMEOUT,
+    http2: bool = False,
+) -> httpx.AsyncClient:
+    """
+    Create an HTTP client with a connection pool meant to be shared.
+
+    :param limits: Connection pool limits, DEFAULT_HTTP_LIMITS if None.
+    :param timeout: Request timeout, None to wait forever.
+    :param http2: Negotiate HTTP/2, which needs the h2 package.
+    """
+    if http2 and importlib.util.find_spec("h2") is None:
+        logger.warning(
+            "HTTP/2 needs the h2 package, e.g. pip install 'httpx[http2]', using HTTP/1.1"
+        )
+        http2 = False
+
+    return httpx.AsyncClient(
+        limits=limits or DEFAULT_HTTP_LIMITS, timeout=timeout, http2=http2
+    )
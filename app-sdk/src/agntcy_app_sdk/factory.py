@@ -1,10 +1,12 @@
 # Copyright AGNTCY Contributors (https://github.com/agntcy)
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Dict, Type
+from typing import Dict, Optional, Type
 from enum import Enum
 import os
 
+import httpx
+
 from agntcy_app_sdk.transports.transport import BaseTransport
 from agntcy_app_sdk.protocols.protocol import BaseAgentProtocol
 
@@ -15,9 +17,17 @@ from agntcy_app_sdk.transports.streamable_http.transport import StreamableHTTPTr
 from agntcy_app_sdk.protocols.a2a.protocol import A2AProtocol
 from agntcy_app_sdk.protocols.mcp.protocol import MCPProtocol
 from a2a.server.apps import A2AStarletteApplication
+from mcp.server.fastmcp import FastMCP
+from mcp.server.lowlevel import Server
 
-from agntcy_app_sdk.bridge import MessageBridge
+from agntcy_app_sdk.bridge import (
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_QUEUE_SIZE,
+    MessageBridge,
+)
 
+from agntcy_app_sdk.common.client_cache import ClientCache
+from agntcy_app_sdk.common.http import DEFAULT_HTTP_TIMEOUT, create_http_client
 from agntcy_app_sdk.common.logging_config import configure_logging, get_logger
 
 configure_logging()
@@ -49,7 +59,19 @@ class AgntcyFactory:
         name="AgntcyFactory",
         enable_tracing: bool = False,
         log_level: str = "DEBUG",
+        http_limits: Optional[httpx.Limits] = None,
+        http_timeout: httpx.Timeout | float | None = DEFAULT_HTTP_TIMEOUT,
+        http2: bool = False,
+        client_idle_timeout: Optional[float] = 300.0,
     ):
+        """
+        :param http_limits: Connection pool limits of the HTTP client shared by
+            the clients of HTTP agents.
+        :param http_timeout: Request timeout of the shared HTTP client.
+        :param http2: Use HTTP/2 with HTTP agents, which needs the h2 package.
+        :param client_idle_timeout: Seconds a client no longer in use is kept
+            for reuse before it is closed, None to keep it until close().
+        """
         self.name = name
         self.enable_tracing = enable_tracing
 
@@ -65,8 +87,15 @@ class AgntcyFactory:
         self._transport_registry: Dict[str, Type[BaseTransport]] = {}
         self._protocol_registry: Dict[str, Type[BaseAgentProtocol]] = {}
 
-        self._clients = {}
+        # clients shared by identical create_client(share=True) calls
+        self._clients = ClientCache(idle_timeout=client_idle_timeout)
         self._bridges = {}
+        self._transports: list[BaseTransport] = []
+
+        self._http_limits = http_limits
+        self._http_timeout = http_timeout
+        self._http2 = http2
+        self._http_client: Optional[httpx.AsyncClient] = None
 
         self._register_wellknown_transports()
         self._register_wellknown_protocols()
@@ -82,16 +111,56 @@ class AgntcyFactory:
 
             logger.info(f"Tracing enabled for {self.name} via ioa_observe.sdk")
 
-    def create_client(
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """The HTTP client shared by the clients of this factory, created on first use."""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = create_http_client(
+                limits=self._http_limits,
+                timeout=self._http_timeout,
+                http2=self._http2,
+            )
+        return self._http_client
+
+    async def close(self) -> None:
+        """
+        Stop the bridges, then close the clients, the transports and the HTTP
+        client created by the factory.
+        """
+        bridges, self._bridges = self._bridges, {}
+        for bridge in bridges.values():
+            await bridge.stop()
+
+        await self._clients.close()
+
+        transports, self._transports = self._transports, []
+        for transport in transports:
+            try:
+                await transport.close()
+            except Exception as e:
+                logger.warning(f"Failed to close {transport.type()} transport: {e}")
+
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    async def create_client(
         self,
         protocol: str,
         agent_url: str | None = None,
         agent_topic: str | None = None,
         transport: BaseTransport | None = None,
+        share: bool = False,
         **kwargs,
     ):
         """
         Create a client for the specified transport and protocol.
+
+        With share=True, the same client is returned for the same protocol,
+        agent, transport and options, which must then be hashable. Give it back
+        with release_client() once done with it, to let the factory close it
+        when it is no longer in use. Only share clients that hold no per-caller
+        state, e.g. not an MCP session nor an A2A client bound to a context.
         """
 
         if agent_url is None and agent_topic is None:
@@ -100,30 +169,58 @@ class AgntcyFactory:
         # get the protocol class
         protocol_instance = self.create_protocol(protocol)
 
-        # create the client
-        client = protocol_instance.create_client(
-            url=agent_url, topic=agent_topic, transport=transport
-        )
+        async def create():
+            return await protocol_instance.create_client(
+                url=agent_url,
+                topic=agent_topic,
+                transport=transport,
+                httpx_client=self.http_client,
+                **kwargs,
+            )
 
-        key = agent_url if agent_url else agent_topic
-        self._clients[key] = client
+        if not share:
+            return await create()
 
-        return client
+        key = (protocol, agent_url, agent_topic, transport, *sorted(kwargs.items()))
+        try:
+            hash(key)
+        except TypeError:
+            logger.warning(
+                f"Not sharing the {protocol} client, its options are not hashable"
+            )
+            return await create()
+
+        return await self._clients.acquire(key, create)
+
+    def release_client(self, client) -> None:
+        """Give back a client obtained from create_client(share=True)."""
+        self._clients.release(client)
 
     def create_bridge(
         self,
-        server,  # add type hints for server, e.g., A2AStarletteApplication
+        server,  # A2AStarletteApplication, FastMCP or a low-level MCP Server
         transport: BaseTransport,
         topic: str | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        queue_group: str | None = None,
     ) -> MessageBridge:
         """
         Create a bridge/receiver for the specified transport and protocol.
         """
+        if queue_group is not None and transport.type() != TransportTypes.NATS.value:
+            raise ValueError(
+                f"{transport.type()} transport does not support queue groups"
+            )
 
         if isinstance(server, A2AStarletteApplication):
             if topic is None:
                 topic = A2AProtocol.create_agent_topic(server.agent_card)
             handler = self.create_protocol("A2A").create_ingress_handler(server)
+        elif isinstance(server, (FastMCP, Server)):
+            if topic is None:
+                topic = MCPProtocol.create_server_topic(server)
+            handler = self.create_protocol("MCP").create_ingress_handler(server)
         else:
             raise ValueError("Unsupported server type")
 
@@ -131,16 +228,22 @@ class AgntcyFactory:
             transport=transport,
             handler=handler,
             topic=topic,
+            max_concurrency=max_concurrency,
+            queue_size=queue_size,
+            queue_group=queue_group,
         )
 
         self._bridges[topic] = bridge
 
         return bridge
 
-    def create_transport(self, transport: str, client=None, endpoint: str = None):
+    def create_transport(
+        self, transport: str, client=None, endpoint: str = None, **kwargs
+    ):
         """
         Get the transport class for the specified transport type. Enables users to
         instantiate a transport class with a string name or a client instance.
+        Additional keyword arguments (e.g. wire_format) are passed to the transport.
         """
         if not client and not endpoint:
             raise ValueError("Either client or endpoint must be provided")
@@ -152,10 +255,11 @@ class AgntcyFactory:
 
         if client:
             # create the transport instance from the client
-            transport = gateway_class.from_client(client)
+            transport = gateway_class.from_client(client, **kwargs)
         else:
-            transport = gateway_class.from_config(endpoint)
+            transport = gateway_class.from_config(endpoint, **kwargs)
 
+        self._transports.append(transport)
         return transport
 
     def create_protocol(self, protocol: str):
@@ -0,0 +1,178 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Awaitable, Callable, Optional
+import asyncio
+import hashlib
+import json
+import os
+import time
+
+from a2a.types import AgentCard
+
+from agntcy_app_sdk.common.cache import TTLCache
+from agntcy_app_sdk.common.logging_config import configure_logging, get_logger
+
+configure_logging()
+logger = get_logger(__name__)
+
+# Loads the agent card of a key, given the etag of the cached card if any. It
+# returns the card body and its etag, or None as body if the card is unchanged.
+CardLoader = Callable[[Optional[str]], Awaitable[tuple[Optional[bytes], Optional[str]]]]
+
+
+def card_etag(body: bytes) -> str:
+    """Return the etag of an agent card body."""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+class CachedAgentCard:
+    """An agent card with the etag it was served with and its expiry time."""
+
+    def __init__(self, card: AgentCard, etag: str, expires_at: Optional[float]):
+        self.card = card
+        self.etag = etag
+        # wall clock time, so that it keeps its meaning on disk
+        self.expires_at = expires_at
+
+    def fresh(self) -> bool:
+        return self.expires_at is None or self.expires_at > time.time()
+
+
+class AgentCardCache:
+    """
+    Cache of the agent cards fetched by A2A clients.
+
+    Cards are used as-is until their time-to-live expired, then revalidated
+    with their etag: an unchanged card is neither sent again by responders
+    supporting it nor validated again. Concurrent fetches of the same card
+    share one request. The cache is optionally persisted to a JSON file, so
+    that new processes start with the cards fetched by previous ones.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        ttl: Optional[float] = 300.0,
+        path: Optional[str] = None,
+    ):
+        """
+        :param maxsize: Maximum number of cards, the least recently used is evicted first.
+        :param ttl: Seconds a card is used without revalidation, None to never
+            revalidate it.
+        :param path: Optional JSON file the cache is loaded from and saved to.
+        """
+        self.ttl = ttl
+        self.path = path
+        # stale cards are kept, to be revalidated rather than fetched again
+        self._cards = TTLCache(maxsize=maxsize)
+        self._fetches: dict[str, asyncio.Future] = {}
+        self._loaded = path is None
+
+    def __len__(self) -> int:
+        self._load()
+        return len(self._cards)
+
+    def get(self, key: str) -> Optional[CachedAgentCard]:
+        """Return the cached card of key, fresh or not."""
+        self._load()
+        return self._cards.get(key)
+
+    def invalidate(self, key: str) -> None:
+        """Forget the card of key."""
+        self._load()
+        self._cards.pop(key)
+
+    def clear(self) -> None:
+        """Forget all cards."""
+        self._cards.clear()
+        self._fetches.clear()
+
+    async def fetch(self, key: str, load: CardLoader) -> AgentCard:
+        """
+        Return the card of key, loading or revalidating it if it is not fresh.
+
+        :param key: The key of the card, e.g. the topic of the agent.
+        :param load: Coroutine function loading the card.
+        """
+        entry = self.get(key)
+        if entry is not None and entry.fresh():
+            return entry.card
+
+        fetch = self._fetches.get(key)
+        if fetch is None:
+            fetch = asyncio.ensure_future(self._fetch(key, entry, load))
+            self._fetches[key] = fetch
+            fetch.add_done_callback(lambda _: self._fetches.pop(key, None))
+
+        # a waiter giving up must not fail the others
+        return await asyncio.shield(fetch)
+
+    async def _fetch(
+        self, key: str, entry: Optional[CachedAgentCard], load: CardLoader
+    ) -> AgentCard:
+        body, etag = await load(entry.etag if entry else None)
+
+        if body is None:
+            if entry is None:
+                raise ValueError(f"No agent card was returned for {key}")
+            logger.debug(f"Agent card of {key} is unchanged")
+            card = entry.card
+            etag = entry.etag
+        else:
+            etag = etag or card_etag(body)
+            if entry is not None and entry.etag == etag:
+                # the responder does not revalidate, but the card is the same
+                card = entry.card
+            else:
+                card = AgentCard.model_validate_json(body)
+
+        expires_at = time.time() + self.ttl if self.ttl is not None else None
+        self._cards[key] = CachedAgentCard(card, etag, expires_at)
+        await self._save()
+        return card
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+            for key, value in stored.items():
+                self._cards[key] = CachedAgentCard(
+                    AgentCard.model_validate(value["card"]),
+                    value["etag"],
+                    value["expires_at"],
+                )
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring agent card cache {self.path}: {e}")
+
+    async def _save(self) -> None:
+        if self.path is None:
+            return
+
+        stored = {
+            key: {
+                "card": entry.card.model_dump(mode="json", exclude_none=True),
+                "etag": entry.etag,
+                "expires_at": entry.expires_at,
+            }
+            for key in self._cards
+            if (entry := self._cards.get(key)) is not None
+        }
+        try:
+            await asyncio.to_thread(_write_json, self.path, stored)
+        except Exception as e:
+            logger.warning(f"Failed to save agent card cache {self.path}: {e}")
+
+
+def _write_json(path: str, value) -> None:
+    # replace the file at once, so that concurrent readers never see it half written
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(value, f)
+    os.replace(tmp, path)
@@ -2,19 +2,30 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from starlette.types import Scope
-from typing import Dict, Any, Callable
+from typing import Dict, Any, AsyncIterator, Callable
+import asyncio
+import functools
 import json
 from uuid import uuid4
 import httpx
 import os
 
 from a2a.client import A2AClient, A2ACardResolver
+from a2a.client.middleware import ClientCallContext
 from a2a.server.apps import A2AStarletteApplication
-from a2a.types import AgentCard, SendMessageRequest, SendMessageResponse
+from a2a.types import (
+    AgentCard,
+    SendMessageRequest,
+    SendMessageResponse,
+    SendStreamingMessageRequest,
+    SendStreamingMessageResponse,
+)
 
 from agntcy_app_sdk.protocols.protocol import BaseAgentProtocol
+from agntcy_app_sdk.protocols.a2a.card_cache import AgentCardCache, card_etag
 from agntcy_app_sdk.transports.transport import BaseTransport
 from agntcy_app_sdk.protocols.message import Message
+from agntcy_app_sdk.transports.streaming import accepts_stream
 from opentelemetry.instrumentation.starlette import StarletteInstrumentor
 
 from agntcy_app_sdk.common.logging_config import configure_logging, get_logger
@@ -24,6 +35,9 @@ logger = get_logger(__name__)
 
 
 class A2AProtocol(BaseAgentProtocol):
+    # agent cards fetched over transports, shared by all clients of the process
+    card_cache = AgentCardCache(path=os.environ.get("AGENT_CARD_CACHE_PATH"))
+
     def type(self):
         return "A2A"
 
@@ -34,6 +48,18 @@ class A2AProtocol(BaseAgentProtocol):
         """
         return f"{agent_card.name}_{agent_card.version}"
 
+    @staticmethod
+    def context_id(message: Message) -> str | None:
+        """
+        Return the A2A context id of a request, e.g. as the ordering_key of a
+        transport so that the messages of a conversation are handled in order.
+        """
+        try:
+            request = json.loads(message.payload)
+            return request["params"]["message"].get("contextId")
+        except (ValueError, TypeError, KeyError, AttributeError):
+            return None
+
     async def get_client_from_agent_card_topic(
         self, topic: str, transport: BaseTransport
     ) -> A2AClient:
@@ -45,21 +71,26 @@ class A2AProtocol(BaseAgentProtocol):
         path = ".well-known/agent.json"
         method = "GET"
 
-        request = Message(
-            type="A2ARequest",
-            payload=json.dumps({"path": path, "method": method}),
-            route_path=path,
-            method=method,
-        )
+        async def load(etag: str | None) -> tuple[bytes | None, str | None]:
+            request = Message(
+                type="A2ARequest",
+                payload=json.dumps({"path": path, "method": method}),
+                route_path=path,
+                method=method,
+                headers={"if-none-match": etag} if etag else {},
+            )
 
-        response = await transport.publish(
-            topic,
-            request,
-            respond=True,
-        )
+            response = await transport.publish(
+                topic,
+                request,
+                respond=True,
+            )
+
+            if response.status_code == 304:
+                return None, etag
+            return response.payload, response.headers.get("etag")
 
-        response.payload = json.loads(response.payload.decode("utf-8"))
-        card = AgentCard.model_validate(response.payload)
+        card = await self.card_cache.fetch(f"{transport.type()}/{topic}", load)
 
         cl = A2AClient(
             agent_card=card,
@@ -79,6 +110,9 @@ class A2AProtocol(BaseAgentProtocol):
         """
         Create an A2A client, overriding the default client _send_request method to
         use the provided transport.
+
+        :param httpx_client: Optional HTTP client used to reach the agent by url,
+            e.g. the one shared by the clients of a factory.
         """
         if os.environ.get("TRACING_ENABLED", "false").lower() == "true":
             # Initialize tracing if enabled
@@ -94,7 +128,8 @@ class A2AProtocol(BaseAgentProtocol):
         if topic and transport:
             client = await self.get_client_from_agent_card_topic(topic, transport)
         else:
-            httpx_client = httpx.AsyncClient()
+            # a client of our own would never be closed, prefer a shared one
+            httpx_client = kwargs.get("httpx_client") or httpx.AsyncClient()
             client = await A2AClient.get_client_from_agent_card_url(httpx_client, url)
             # ensure the client has an agent card
             if not hasattr(client, "agent_card"):
@@ -191,9 +226,70 @@ class A2AProtocol(BaseAgentProtocol):
 
             return broadcast_responses
 
+        async def broadcast_message_streaming(
+            request: SendMessageRequest,
+            expected_responses: int = 1,
+            timeout: float = 10.0,
+            quorum: int | None = None,
+        ) -> AsyncIterator[SendMessageResponse]:
+            """
+            Broadcast a request using the provided transport and yield the
+            responses as they arrive, until expected_responses were received or
+            the timeout expired.
+            """
+            if not request.id:
+                request.id = str(uuid4())
+
+            msg = self.message_translator(
+                request=request.model_dump(mode="json", exclude_none=True)
+            )
+
+            async for raw_resp in transport.broadcast_stream(
+                topic,
+                msg,
+                expected_responses=expected_responses,
+                timeout=timeout,
+                quorum=quorum,
+            ):
+                try:
+                    resp = json.loads(raw_resp.payload.decode("utf-8"))
+                except Exception as e:
+                    logger.error(f"Error decoding JSON response: {e}")
+                    continue
+                yield SendMessageResponse(resp)
+
+        async def send_message_streaming(
+            request: SendStreamingMessageRequest,
+            *,
+            http_kwargs: dict[str, Any] | None = None,
+            context: ClientCallContext | None = None,
+        ) -> AsyncIterator[SendStreamingMessageResponse]:
+            """
+            Send a streaming request using the provided transport and yield the
+            events of the response as they arrive.
+            """
+            if not request.id:
+                request.id = str(uuid4())
+
+            payload, modified_kwargs = await client._apply_interceptors(
+                "message/stream",
+                request.model_dump(mode="json", exclude_none=True),
+                http_kwargs,
+                context,
+            )
+            msg = self.message_translator(
+                request=payload, headers=modified_kwargs.get("headers", {})
+            )
+
+            async for chunk in transport.request_stream(topic, msg):
+                for data in _stream_events(chunk.payload):
+                    yield SendStreamingMessageResponse.model_validate(json.loads(data))
+
         # override the _send_request method to use the provided transport
         client._send_request = _send_request
+        client.send_message_streaming = send_message_streaming
         client.broadcast_message = broadcast_message
+        client.broadcast_message_streaming = broadcast_message_streaming
 
     def message_translator(
         self, request: dict[str, Any], headers: dict[str, Any] | None = None
@@ -234,19 +330,17 @@ class A2AProtocol(BaseAgentProtocol):
 
         return self.handle_incoming_request
 
-    async def handle_incoming_request(self, message: Message) -> Message:
+    async def handle_incoming_request(
+        self, message: Message
+    ) -> Message | AsyncIterator[Message]:
         """
-        Handle an incoming request and return a response.
+        Handle an incoming request and return a response. If the sender accepts
+        streamed responses and the app answers with server-sent events, a stream
+        of responses is returned instead, one per event.
         """
         assert self._app is not None, "ASGI app is not set up"
 
-        body = message.payload
-        route_path = (
-            message.route_path
-            if message.route_path.startswith("/")
-            else f"/{message.route_path}"
-        )
-        method = message.method
+        path, raw_path = _request_path(message.route_path)
 
         headers = []
         for key, value in message.headers.items():
@@ -259,62 +353,229 @@ class A2AProtocol(BaseAgentProtocol):
 
         # Set up ASGI scope
         scope: Scope = {
-            "type": "http",
-            "asgi": {"version": "3.0", "spec_version": "2.1"},
-            "http_version": "1.1",
-            "method": method,
-            "scheme": "http",
-            "path": route_path,
-            "raw_path": route_path.encode("utf-8"),
-            "query_string": b"",
+            **_SCOPE_TEMPLATE,
+            "method": message.method,
+            "path": path,
+            "raw_path": raw_path,
             "headers": headers,
-            "client": ("agntcy-bridge", 0),
-            "server": ("agntcy-bridge", 0),
         }
 
-        # Create the receive channel that will yield request body
+        # Create the receive channel that will yield request body, then
+        # report a disconnect once the response is no longer wanted
+        request = {
+            "type": "http.request",
+            "body": message.payload,
+            "more_body": False,
+        }
+        received = False
+        disconnected = asyncio.Event()
+
         async def receive() -> Dict[str, Any]:
-            return {
-                "type": "http.request",
-                "body": body,
-                "more_body": False,
-            }
+            nonlocal received
+            if not received:
+                received = True
+                return request
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        if accepts_stream(message):
+            return await self._handle_streaming_request(
+                message, scope, receive, disconnected
+            )
 
         # Create the send channel that will receive responses
-        response_data = {
-            "status": None,
-            "headers": None,
-            "body": bytearray(),
-        }
+        status = None
+        response_headers = []
+        chunks = []
 
         async def send(message: Dict[str, Any]) -> None:
+            nonlocal status
             message_type = message["type"]
 
             if message_type == "http.response.start":
-                response_data["status"] = message["status"]
-                response_data["headers"] = message.get("headers", [])
+                status = message.get("status")
+                response_headers.extend(message.get("headers", []))
 
             elif message_type == "http.response.body":
-                if "body" in message:
-                    response_data["body"].extend(message["body"])
+                chunk = message.get("body")
+                if chunk:
+                    chunks.append(chunk)
 
         # Call the ASGI application with our scope, receive, and send
         await self._app(scope, receive, send)
 
+        return _response(message, status, response_headers, chunks)
+
+    async def _handle_streaming_request(
+        self,
+        message: Message,
+        scope: Scope,
+        receive: Callable,
+        disconnected: asyncio.Event,
+    ) -> Message | AsyncIterator[Message]:
+        """
+        Run the ASGI app in the background and, once it started responding,
+        either stream its server-sent events or buffer its response.
+        """
+        events: asyncio.Queue = asyncio.Queue()
+
+        async def send(event: Dict[str, Any]) -> None:
+            await events.put(event)
+
+        app = asyncio.create_task(self._app(scope, receive, send))
+        # None marks the end of the response
+        app.add_done_callback(lambda _: events.put_nowait(None))
+
+        start = await events.get()
+        if start is None:
+            # the app failed before responding
+            app.result()
+            return _response(message, None, [], [])
+
+        response_headers = start.get("headers", [])
+        if not _is_event_stream(response_headers):
+            chunks = []
+            while (event := await events.get()) is not None:
+                chunk = event.get("body")
+                if chunk:
+                    chunks.append(chunk)
+            app.result()
+            return _response(message, start.get("status"), response_headers, chunks)
+
+        async def stream() -> AsyncIterator[Message]:
+            buffer = b""
+            try:
+                while (event := await events.get()) is not None:
+                    buffer += event.get("body", b"")
+                    data, buffer = _split_sse(buffer)
+                    for payload in data:
+                        yield Message(
+                            type="A2AResponse",
+                            payload=payload,
+                            reply_to=message.reply_to,
+                        )
+                app.result()
+            finally:
+                # the consumer may stop early, let the app wind down
+                disconnected.set()
+                if not app.done():
+                    app.cancel()
+
+        return stream()
+
+
+def _response(
+    message: Message,
+    status: int | None,
+    response_headers: list[tuple[bytes, bytes]],
+    chunks: list[bytes],
+) -> Message:
+    """Build the response to a request out of the ASGI response body."""
+    # a single chunk, the common case, is handed through without copy
+    body = chunks[0] if len(chunks) == 1 else b"".join(chunks)
+    if isinstance(body, (bytearray, memoryview)):
+        body = bytes(body)
+
+    if _is_json(response_headers):
+        payload = body
+    else:
         # Parse the body
-        body = bytes(response_data["body"])
         try:
             body_obj = json.loads(body.decode("utf-8"))
             payload = json.dumps(body_obj).encode("utf-8")  # re-encode as bytes
         except (json.JSONDecodeError, UnicodeDecodeError):
             payload = body  # raw bytes
 
+    if message.method == "GET" and status == 200:
+        # let clients caching the response, e.g. the agent card, revalidate it
+        etag = card_etag(payload)
+        if message.headers.get("if-none-match") == etag:
+            return Message(
+                type="A2AResponse",
+                payload=b"",
+                reply_to=message.reply_to,
+                headers={"etag": etag},
+                status_code=304,
+            )
         return Message(
             type="A2AResponse",
             payload=payload,
             reply_to=message.reply_to,
+            headers={"etag": etag},
         )
 
+    return Message(
+        type="A2AResponse",
+        payload=payload,
+        reply_to=message.reply_to,
+    )
+
+
+# The parts of the ASGI scope that are the same for every request
+_SCOPE_TEMPLATE: Scope = {
+    "type": "http",
+    "asgi": {"version": "3.0", "spec_version": "2.1"},
+    "http_version": "1.1",
+    "scheme": "http",
+    "query_string": b"",
+    "client": ("agntcy-bridge", 0),
+    "server": ("agntcy-bridge", 0),
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _request_path(route_path: str) -> tuple[str, bytes]:
+    """Return the ASGI path and raw path of a route path."""
+    path = route_path if route_path.startswith("/") else f"/{route_path}"
+    return path, path.encode("utf-8")
+
+
+def _content_type(headers: list[tuple[bytes, bytes]]) -> bytes | None:
+    """Return the media type declared by ASGI response headers."""
+    for key, value in headers:
+        if key.lower() == b"content-type":
+            return value.split(b";", 1)[0].strip().lower()
+    return None
+
+
+def _is_json(headers: list[tuple[bytes, bytes]]) -> bool:
+    """Whether ASGI response headers declare a JSON body."""
+    return _content_type(headers) == b"application/json"
+
+
+def _is_event_stream(headers: list[tuple[bytes, bytes]]) -> bool:
+    """Whether ASGI response headers declare a stream of server-sent events."""
+    return _content_type(headers) == b"text/event-stream"
+
+
+def _split_sse(buffer: bytes) -> tuple[list[bytes], bytes]:
+    """
+    Split the complete server-sent events off a buffer, returning the data of
+    each event and the incomplete remainder.
+    """
+    *events, rest = buffer.replace(b"\r\n", b"\n").split(b"\n\n")
+    data = []
+    for event in events:
+        # comments and other fields, e.g. keep-alive pings, carry no data
+        lines = [
+            line[5:].removeprefix(b" ")
+            for line in event.split(b"\n")
+            if line.startswith(b"data:")
+        ]
+        if lines:
+            data.append(b"\n".join(lines))
+    return data, rest
+
+
+def _stream_events(payload: bytes) -> list[bytes]:
+    """
+    Return the events of a streamed response chunk: the chunk itself, or the
+    data of the server-sent events of a response that was sent whole.
+    """
+    if payload.lstrip()[:1] == b"{":
+        return [payload]
+    return _split_sse(payload + b"\n\n")[0]
+
 
 def get_trace_id_from_traceparent(traceparent_header: str) -> str | None:
     import re
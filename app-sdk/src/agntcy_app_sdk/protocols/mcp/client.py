@@ -0,0 +1,156 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import anyio
+from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+from mcp import ClientSession
+from mcp.shared.message import SessionMessage
+from mcp.types import (
+    INTERNAL_ERROR,
+    ErrorData,
+    JSONRPCError,
+    JSONRPCMessage,
+    JSONRPCRequest,
+)
+
+from agntcy_app_sdk.common.logging_config import configure_logging, get_logger
+from agntcy_app_sdk.protocols.message import Message
+from agntcy_app_sdk.transports.transport import BaseTransport
+
+configure_logging()
+logger = get_logger(__name__)
+
+# Message types of the MCP messages sent over transports
+MCP_REQUEST_TYPE = "MCPRequest"
+MCP_RESPONSE_TYPE = "MCPResponse"
+
+
+def encode(message: JSONRPCMessage) -> bytes:
+    """Serialize a JSON-RPC message the way MCP transports do."""
+    return message.model_dump_json(by_alias=True, exclude_none=True).encode("utf-8")
+
+
+@asynccontextmanager
+async def transport_streams(
+    transport: BaseTransport, topic: str, timeout: Optional[float] = 60.0
+) -> AsyncIterator[
+    tuple[
+        MemoryObjectReceiveStream[SessionMessage | Exception],
+        MemoryObjectSendStream[SessionMessage],
+    ]
+]:
+    """
+    Open the read and write streams of an MCP client session whose messages
+    are sent to the MCP server subscribed to topic.
+
+    Requests are sent concurrently, each with its own streamed response, so
+    that the notifications the server sends while handling a request, e.g. its
+    progress, are received before the result. As the server is stateless,
+    notifications from the client are not sent.
+
+    :param timeout: Seconds to wait for each message of a response, None to
+        wait forever.
+    """
+    read_writer, read_stream = anyio.create_memory_object_stream[
+        SessionMessage | Exception
+    ](0)
+    write_stream, write_reader = anyio.create_memory_object_stream[SessionMessage](0)
+
+    async def send(session_message: SessionMessage) -> None:
+        request = session_message.message.root
+        if not isinstance(request, JSONRPCRequest):
+            logger.debug(f"Not sending {type(request).__name__} to stateless server")
+            return
+
+        message = Message(
+            type=MCP_REQUEST_TYPE,
+            payload=encode(session_message.message),
+            route_path="/",
+            method="POST",
+        )
+        try:
+            async for chunk in transport.request_stream(topic, message, timeout):
+                response = JSONRPCMessage.model_validate_json(chunk.payload)
+                await read_writer.send(SessionMessage(response))
+        except Exception as e:
+            logger.error(f"MCP request {request.method} to {topic} failed: {e}")
+            error = JSONRPCError(
+                jsonrpc="2.0",
+                id=request.id,
+                error=ErrorData(code=INTERNAL_ERROR, message=str(e)),
+            )
+            await read_writer.send(SessionMessage(JSONRPCMessage(error)))
+
+    async def write() -> None:
+        async with write_reader, anyio.create_task_group() as requests:
+            async for session_message in write_reader:
+                requests.start_soon(send, session_message)
+
+    async with read_writer, anyio.create_task_group() as tasks:
+        tasks.start_soon(write)
+        try:
+            yield read_stream, write_stream
+        finally:
+            tasks.cancel_scope.cancel()
+
+
+class TransportMCPClient:
+    """
+    An MCP client session with an MCP server reached through a transport, e.g.
+    SLIM or NATS, rather than over HTTP.
+    """
+
+    def __init__(
+        self,
+        transport: BaseTransport,
+        topic: str,
+        timeout: Optional[float] = 60.0,
+    ):
+        """
+        :param transport: The transport the MCP server is reached through.
+        :param topic: The topic the MCP server is subscribed to.
+        :param timeout: Seconds to wait for each message of a response.
+        """
+        self.transport = transport
+        self.topic = topic
+        self.timeout = timeout
+        self.session: Optional[ClientSession] = None
+        self._exit_stack = AsyncExitStack()
+
+    def type(self) -> str:
+        return self.transport.type()
+
+    async def connect(self) -> None:
+        """Open the session and initialize it."""
+        if self.session is not None:
+            logger.info(f"Already connected to MCP server on {self.topic}.")
+            return
+
+        try:
+            read_stream, write_stream = await self._exit_stack.enter_async_context(
+                transport_streams(self.transport, self.topic, self.timeout)
+            )
+            session = await self._exit_stack.enter_async_context(
+                ClientSession(read_stream, write_stream)
+            )
+            await session.initialize()
+        except BaseException:
+            await self._exit_stack.aclose()
+            raise
+
+        self.session = session
+        logger.info(
+            f"Connected to MCP server on {self.topic} over {self.transport.type()}"
+        )
+
+    async def close(self) -> None:
+        """Close the session, the transport is left open."""
+        self.session = None
+        await self._exit_stack.aclose()
+
+    # Same as close(), for compatibility with StreamableHTTPTransport
+    async def cleanup(self) -> None:
+        await self.close()
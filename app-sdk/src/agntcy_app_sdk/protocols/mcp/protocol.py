@@ -1,15 +1,26 @@
 # Copyright AGNTCY Contributors (https://github.com/agntcy)
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Any
+from typing import Any, AsyncIterator, Callable, Optional
+import asyncio
 
-from mcp.client.streamable_http import streamablehttp_client
+import anyio
+from mcp.server.lowlevel import Server
+from mcp.shared.message import SessionMessage
+from mcp.types import JSONRPCError, JSONRPCMessage, JSONRPCRequest, JSONRPCResponse
 
 from agntcy_app_sdk.common.logging_config import configure_logging, get_logger
 from agntcy_app_sdk.protocols.message import Message
+from agntcy_app_sdk.protocols.mcp.client import (
+    MCP_REQUEST_TYPE,
+    MCP_RESPONSE_TYPE,
+    TransportMCPClient,
+    encode,
+)
 from agntcy_app_sdk.transports.transport import BaseTransport
 from agntcy_app_sdk.protocols.protocol import BaseAgentProtocol
 from agntcy_app_sdk.transports.streamable_http.transport import StreamableHTTPTransport
+from agntcy_app_sdk.transports.streaming import accepts_stream
 
 configure_logging()
 logger = get_logger(__name__)
@@ -17,54 +28,172 @@ logger = get_logger(__name__)
 
 class MCPProtocol(BaseAgentProtocol):
     """
-    MCPProtocol is a placeholder for the MCP protocol implementation.
-    It should define methods to create clients, receivers, and handle messages.
+    MCP protocol implementation: clients of MCP servers reached over streamable
+    HTTP or through a transport, and the ingress handler serving an MCP server
+    behind a message bridge.
     """
 
     def type(self):
         return "MCP"
 
+    @staticmethod
+    def create_server_topic(server: Any) -> str:
+        """
+        A standard way to create the topic of an MCP server, FastMCP or low-level.
+        """
+        return server.name
+
     async def create_client(
         self,
         url: str = None,
         transport: BaseTransport = None,
+        topic: str = None,
+        pool_size: int = 1,
+        warm_up: bool = True,
+        health_check_interval: Optional[float] = 30.0,
+        acquire_timeout: Optional[float] = None,
         **kwargs,
-    ) -> StreamableHTTPTransport:
+    ) -> StreamableHTTPTransport | TransportMCPClient:
         """
-        Create a client for the MCP protocol.
+        Create a client for the MCP protocol, over HTTP or, given a transport
+        and the topic of the MCP server, over that transport.
+
+        Over HTTP, the client is a pool of sessions, see StreamableHTTPTransport:
+        acquire one for each call with client.acquire().
+
+        :param pool_size: Maximum number of HTTP sessions.
+        :param warm_up: Open all the HTTP sessions upfront.
+        :param health_check_interval: Seconds between pings of the idle HTTP
+            sessions, None to not check them.
+        :param acquire_timeout: Seconds to wait for an HTTP session when all
+            are busy, None to wait forever.
         """
+        if transport is not None and not isinstance(transport, StreamableHTTPTransport):
+            if not topic:
+                raise ValueError(
+                    f"MCP server topic must be provided to create an MCP client "
+                    f"over {transport.type()}"
+                )
+
+            logger.info(f"Creating MCP client with topic: {topic}")
+            client = TransportMCPClient(transport, topic)
+            await client.connect()
+            return client
+
         logger.info(f"Creating MCP client with URL: {url}")
         if not url:
             raise ValueError("MCP Server URL must be provided to create an MCP client")
 
         # overrides the transport to use StreamableHTTPTransport
-        transport = StreamableHTTPTransport(endpoint=url)
+        transport = StreamableHTTPTransport(
+            endpoint=url,
+            pool_size=pool_size,
+            warm_up=warm_up,
+            health_check_interval=health_check_interval,
+            acquire_timeout=acquire_timeout,
+        )
 
-        # Create a streamable HTTP client for MCP
         try:
-            client = streamablehttp_client(url=url)
-            await transport.connect(client)
+            await transport.connect()
             return transport
         except Exception as e:
             await transport.close()
             logger.error(f"Failed to create MCP client: {e}")
             raise
 
-    def message_translator(self, request: Any) -> Message:
+    def message_translator(self, request: dict[str, Any]) -> Message:
         """
-        Translate a request into a Message object.
-        This method should be implemented to convert the request format
-        into the Message format used by the MCP protocol.
+        Translate an MCP JSON-RPC request into the internal Message object.
         """
-        raise NotImplementedError(
-            "Message translation is not implemented for MCP protocol"
+        return Message(
+            type=MCP_REQUEST_TYPE,
+            payload=encode(JSONRPCMessage.model_validate(request)),
+            route_path="/",
+            method="POST",
         )
 
-    def create_ingress_handler(self, *args, **kwargs) -> Any:
+    def create_ingress_handler(self, server: Any) -> Callable[[Message], Any]:
+        """
+        Create an ingress handler serving the requests received by a bridge with
+        an MCP server, FastMCP or low-level.
+
+        Each request is handled by a session of its own, as stateless streamable
+        HTTP servers do, so that requests can be spread over several replicas.
+        """
+        # FastMCP wraps a low-level server
+        self._server: Server = getattr(server, "_mcp_server", server)
+        self._init_options = self._server.create_initialization_options()
+        return self.handle_incoming_request
+
+    async def handle_incoming_request(
+        self, message: Message
+    ) -> Message | AsyncIterator[Message] | None:
         """
-        Create an ingress handler for the MCP protocol.
-        This method should define how to handle incoming messages.
+        Handle an incoming request and return its response. If the sender
+        accepts streamed responses, the messages the server sends while
+        handling the request, e.g. progress notifications, are streamed before
+        the response.
         """
-        raise NotImplementedError(
-            "Ingress handler creation is not implemented for MCP protocol"
+        request = JSONRPCMessage.model_validate_json(message.payload)
+        if not isinstance(request.root, JSONRPCRequest):
+            # stateless, so there is no session for a notification to apply to
+            logger.debug(f"Ignoring {type(request.root).__name__} from MCP client")
+            return None
+
+        responses = self._run(request)
+        if accepts_stream(message):
+            return self._stream(message, responses)
+
+        last = None
+        async for last in responses:
+            pass
+        return self._response(message, last)
+
+    async def _run(self, request: JSONRPCMessage) -> AsyncIterator[JSONRPCMessage]:
+        """
+        Run a server session for a request, yielding the messages it sends up
+        to the response to the request.
+        """
+        read_writer, read_stream = anyio.create_memory_object_stream[
+            SessionMessage | Exception
+        ](1)
+        write_stream, write_reader = anyio.create_memory_object_stream[SessionMessage](
+            16
+        )
+
+        session = asyncio.create_task(
+            self._server.run(
+                read_stream, write_stream, self._init_options, stateless=True
+            )
+        )
+        try:
+            await read_writer.send(SessionMessage(request))
+            async for session_message in write_reader:
+                yield session_message.message
+                response = session_message.message.root
+                if (
+                    isinstance(response, (JSONRPCResponse, JSONRPCError))
+                    and response.id == request.root.id
+                ):
+                    break
+        finally:
+            read_writer.close()
+            session.cancel()
+            await asyncio.gather(session, return_exceptions=True)
+            write_reader.close()
+
+    async def _stream(
+        self, message: Message, responses: AsyncIterator[JSONRPCMessage]
+    ) -> AsyncIterator[Message]:
+        async for response in responses:
+            yield self._response(message, response)
+
+    @staticmethod
+    def _response(message: Message, response: JSONRPCMessage | None) -> Message:
+        if response is None:
+            raise RuntimeError("MCP server did not respond")
+        return Message(
+            type=MCP_RESPONSE_TYPE,
+            payload=encode(response),
+            reply_to=message.reply_to,
         )
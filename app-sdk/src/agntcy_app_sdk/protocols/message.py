@@ -4,6 +4,79 @@
 from typing import Optional
 import json
 import base64
+import struct
+
+from agntcy_app_sdk.common.cache import TTLCache
+
+# =============== Wire Formats ================
+
+# The legacy format: a JSON object with a base64-encoded payload.
+JSON_WIRE_FORMAT = "json"
+# A versioned, length-prefixed binary envelope carrying the raw payload bytes.
+BINARY_WIRE_FORMAT = "binary"
+
+WIRE_FORMATS = (JSON_WIRE_FORMAT, BINARY_WIRE_FORMAT)
+# Understood by every peer, used when nothing is known about the receiver.
+DEFAULT_WIRE_FORMAT = JSON_WIRE_FORMAT
+# Transports send requests in binary to the peers known to understand it, in
+# JSON to the others.
+NEGOTIATED_WIRE_FORMAT = "auto"
+
+# Header of responses listing the wire formats their sender understands.
+# Peers predating the binary format do not set it.
+WIRE_FORMATS_HEADER = "wire_formats"
+
+# Binary envelope layout (network byte order):
+#
+#   fixed header: magic (2s) | version (B) | flags (B) | status_code (i)
+#                 | header count (H) | payload length (I)
+#   fields:       type, reply_to, route_path, method as length-prefixed
+#                 UTF-8 strings (H), 0xFFFF marking an absent value
+#   header map:   per entry a key (H + UTF-8), a value tag (B) and the
+#                 value (I + bytes); tag 0 is a UTF-8 string, tag 1 JSON
+#   payload:      raw bytes, always last so decoding copies it out in a
+#                 single slice, without base64 decoding
+#
+# JSON envelopes always start with "{", so the magic never collides.
+_BINARY_MAGIC = b"AM"
+_BINARY_VERSION = 1
+_FIXED_HEADER = struct.Struct("!2sBBiHI")
+_STR_LEN = struct.Struct("!H")
+_VALUE_LEN = struct.Struct("!I")
+_ABSENT = 0xFFFF
+
+_FLAG_HAS_STATUS_CODE = 0x01
+
+_HEADER_VALUE_STR = 0
+_HEADER_VALUE_JSON = 1
+
+
+def _pack_str(value: Optional[str]) -> bytes:
+    if value is None:
+        return _STR_LEN.pack(_ABSENT)
+    encoded = value.encode("utf-8")
+    if len(encoded) >= _ABSENT:
+        raise ValueError("Message field exceeds the binary envelope limit")
+    return _STR_LEN.pack(len(encoded)) + encoded
+
+
+def _unpack_str(view: memoryview, offset: int) -> tuple[Optional[str], int]:
+    (length,) = _STR_LEN.unpack_from(view, offset)
+    offset += _STR_LEN.size
+    if length == _ABSENT:
+        return None, offset
+    end = offset + length
+    return str(view[offset:end], "utf-8"), end
+
+
+def _to_payload_bytes(payload) -> bytes:
+    """Coerce a payload into a bytes-like object suitable for the wire."""
+    if isinstance(payload, (bytes, bytearray, memoryview)):
+        return payload
+    if isinstance(payload, str):
+        return payload.encode("utf-8")
+    return str(payload).encode("utf-8")
+
 
 # =============== Message Models ================
 
@@ -20,6 +93,7 @@ class Message:
         method: Optional[str] = None,
         headers: Optional[dict] = None,
         status_code: Optional[int] = None,
+        wire_format: Optional[str] = None,
     ):
         self.type = type
         self.payload = payload
@@ -28,6 +102,8 @@ class Message:
         self.method = method
         self.headers = headers if headers is not None else {}
         self.status_code = status_code
+        # wire format this message arrived in (or should be sent in), if known
+        self.wire_format = wire_format
 
     def __repr__(self) -> str:
         return f"Message(type={self.type}, payload={self.payload}, reply_to={self.reply_to}, route_path={self.route_path}, method={self.method}, headers={self.headers}, status_code={self.status_code})"
@@ -35,20 +111,147 @@ class Message:
     def __str__(self) -> str:
         return f"Message(type={self.type}, payload={self.payload}, reply_to={self.reply_to}, route_path={self.route_path}, method={self.method}, headers={self.headers}, status_code={self.status_code})"
 
-    def serialize(self) -> bytes:
+    def serialize(self, wire_format: Optional[str] = None) -> bytes:
         """
         Serialize the Message object into bytes.
 
+        Args:
+            wire_format: The wire format to use. Falls back to the format the
+                message was received in, then to DEFAULT_WIRE_FORMAT.
+
         Returns:
             bytes: The serialized message
         """
-        # Ensure payload is bytes-like
-        payload_bytes = self.payload
-        if not isinstance(payload_bytes, bytes):
-            if isinstance(payload_bytes, str):
-                payload_bytes = payload_bytes.encode("utf-8")
+        wire_format = wire_format or self.wire_format or DEFAULT_WIRE_FORMAT
+
+        if wire_format == BINARY_WIRE_FORMAT:
+            return self._serialize_binary()
+        if wire_format == JSON_WIRE_FORMAT:
+            return self._serialize_json()
+
+        raise ValueError(f"Unsupported wire format: {wire_format}")
+
+    @classmethod
+    def deserialize(cls, data: bytes) -> "Message":
+        """
+        Deserialize bytes into a Message object. Both the binary envelope and
+        the legacy JSON format are accepted, so mixed fleets interoperate.
+
+        Args:
+            data: The serialized message bytes
+
+        Returns:
+            Message: The deserialized Message object
+        """
+        # Ensure input is bytes
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+
+        if data[: len(_BINARY_MAGIC)] == _BINARY_MAGIC:
+            return cls._deserialize_binary(data)
+
+        return cls._deserialize_json(data)
+
+    def _serialize_binary(self) -> bytes:
+        payload_bytes = _to_payload_bytes(self.payload)
+
+        flags = 0
+        status_code = 0
+        if self.status_code is not None:
+            flags |= _FLAG_HAS_STATUS_CODE
+            status_code = self.status_code
+
+        parts = [
+            None,  # fixed header, filled in once the header count is known
+            _pack_str(self.type),
+            _pack_str(self.reply_to),
+            _pack_str(self.route_path),
+            _pack_str(self.method),
+        ]
+
+        headers = self.headers or {}
+        for key, value in headers.items():
+            parts.append(_pack_str(str(key)))
+            if isinstance(value, str):
+                tag, encoded = _HEADER_VALUE_STR, value.encode("utf-8")
             else:
-                payload_bytes = str(payload_bytes).encode("utf-8")
+                tag, encoded = _HEADER_VALUE_JSON, json.dumps(value).encode("utf-8")
+            parts.append(bytes((tag,)) + _VALUE_LEN.pack(len(encoded)) + encoded)
+
+        parts[0] = _FIXED_HEADER.pack(
+            _BINARY_MAGIC,
+            _BINARY_VERSION,
+            flags,
+            status_code,
+            len(headers),
+            len(payload_bytes),
+        )
+        # the payload is joined as-is, without an intermediate copy
+        parts.append(payload_bytes)
+
+        return b"".join(parts)
+
+    @classmethod
+    def _deserialize_binary(cls, data: bytes) -> "Message":
+        view = memoryview(data)
+
+        try:
+            (
+                _,
+                version,
+                flags,
+                status_code,
+                header_count,
+                payload_length,
+            ) = _FIXED_HEADER.unpack_from(view, 0)
+            if version != _BINARY_VERSION:
+                raise ValueError(f"Unsupported binary message version: {version}")
+
+            offset = _FIXED_HEADER.size
+            type_value, offset = _unpack_str(view, offset)
+            reply_to, offset = _unpack_str(view, offset)
+            route_path, offset = _unpack_str(view, offset)
+            method, offset = _unpack_str(view, offset)
+
+            headers = {}
+            for _ in range(header_count):
+                key, offset = _unpack_str(view, offset)
+                tag = view[offset]
+                (length,) = _VALUE_LEN.unpack_from(view, offset + 1)
+                offset += 1 + _VALUE_LEN.size
+                raw = view[offset : offset + length]
+                offset += length
+                if tag == _HEADER_VALUE_STR:
+                    headers[key] = str(raw, "utf-8")
+                elif tag == _HEADER_VALUE_JSON:
+                    headers[key] = json.loads(bytes(raw))
+                else:
+                    raise ValueError(f"Unknown header value tag: {tag}")
+        except struct.error as e:
+            raise ValueError(f"Truncated binary message: {e}") from e
+
+        received = len(view) - offset
+        if received != payload_length:
+            raise ValueError(
+                f"Payload length mismatch: expected {payload_length}, got {received}"
+            )
+
+        return cls(
+            type=type_value,
+            # handlers expect bytes: the payload is copied once out of the
+            # received buffer, the other fields are read in place
+            payload=bytes(view[offset:]),
+            reply_to=reply_to,
+            route_path=route_path,
+            method=method,
+            headers=headers,
+            status_code=status_code if flags & _FLAG_HAS_STATUS_CODE else None,
+            wire_format=BINARY_WIRE_FORMAT,
+        )
+
+    def _serialize_json(self) -> bytes:
+        # Ensure payload is bytes-like
+        payload_bytes = _to_payload_bytes(self.payload)
 
         # Create a dictionary representation of the Message
         message_dict = {
@@ -71,22 +274,9 @@ class Message:
         return json.dumps(message_dict).encode("utf-8")
 
     @classmethod
-    def deserialize(cls, data: bytes) -> "Message":
-        """
-        Deserialize bytes into a Message object.
-
-        Args:
-            data: The serialized message bytes
-
-        Returns:
-            Message: The deserialized Message object
-        """
-        # Ensure input is bytes
-        if isinstance(data, str):
-            data = data.encode("utf-8")
-
+    def _deserialize_json(cls, data: bytes) -> "Message":
         # Convert bytes to JSON string and then to dictionary
-        message_dict = json.loads(data.decode("utf-8"))
+        message_dict = json.loads(data)
 
         # Extract required fields
         type_value = message_dict.get("type")
@@ -109,4 +299,62 @@ class Message:
             method=method,
             headers=headers,
             status_code=status_code,
+            wire_format=JSON_WIRE_FORMAT,
         )
+
+
+# =============== Wire Format Negotiation ================
+
+
+def advertise_wire_formats(message: Message) -> None:
+    """Tell the receiver of a response which wire formats we understand."""
+    message.headers = message.headers or {}
+    message.headers[WIRE_FORMATS_HEADER] = ",".join(WIRE_FORMATS)
+
+
+class WireFormatNegotiator:
+    """
+    Picks the wire format of outbound requests, per topic.
+
+    With NEGOTIATED_WIRE_FORMAT, requests are sent in JSON until a response
+    from the topic advertised the binary format, and in JSON again once a
+    response did not. Broadcasts may reach subscribers that never responded,
+    so they are always sent in JSON. Any other wire format is always used.
+    """
+
+    def __init__(self, wire_format: str = NEGOTIATED_WIRE_FORMAT, maxsize: int = 1024):
+        """
+        :param wire_format: NEGOTIATED_WIRE_FORMAT, or the wire format to always use.
+        :param maxsize: Maximum number of topics whose wire format is remembered.
+        """
+        if wire_format not in WIRE_FORMATS + (NEGOTIATED_WIRE_FORMAT,):
+            raise ValueError(f"Unsupported wire format: {wire_format}")
+
+        self.wire_format = wire_format
+        # topics known to understand the binary format
+        self._binary_topics = TTLCache(maxsize=maxsize)
+
+    def request_format(self, topic: str) -> str:
+        """Return the wire format of a request to a topic."""
+        if self.wire_format != NEGOTIATED_WIRE_FORMAT:
+            return self.wire_format
+        if topic in self._binary_topics:
+            return BINARY_WIRE_FORMAT
+        return DEFAULT_WIRE_FORMAT
+
+    def broadcast_format(self) -> str:
+        """Return the wire format of a broadcast."""
+        if self.wire_format != NEGOTIATED_WIRE_FORMAT:
+            return self.wire_format
+        return DEFAULT_WIRE_FORMAT
+
+    def observe(self, topic: str, response: Optional[Message]) -> None:
+        """Learn the wire formats understood by a topic from one of its responses."""
+        if response is None or self.wire_format != NEGOTIATED_WIRE_FORMAT:
+            return
+
+        formats = (response.headers or {}).get(WIRE_FORMATS_HEADER)
+        if isinstance(formats, str) and BINARY_WIRE_FORMAT in formats.split(","):
+            self._binary_topics[topic] = True
+        else:
+            self._binary_topics.pop(topic)
@@ -2,12 +2,32 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import asyncio
+import contextlib
+import functools
+import re
 import nats
 from nats.aio.client import Client as NATS
+from nats.js.api import ConsumerConfig
+from nats.js.errors import BadRequestError
 from agntcy_app_sdk.transports.transport import BaseTransport
 from agntcy_app_sdk.common.logging_config import configure_logging, get_logger
-from agntcy_app_sdk.protocols.message import Message
-from typing import Callable, List, Optional
+from agntcy_app_sdk.protocols.message import (
+    Message,
+    NEGOTIATED_WIRE_FORMAT,
+    WireFormatNegotiator,
+)
+from agntcy_app_sdk.common.concurrency import KeyedTaskRunner
+from agntcy_app_sdk.transports.pending import (
+    CORRELATION_HEADER,
+    PendingRequests,
+    correlate,
+)
+from agntcy_app_sdk.transports.streaming import (
+    STREAM_HEADER,
+    frame_stream,
+    is_stream,
+)
+from typing import AsyncIterator, Callable, List, Optional
 from uuid import uuid4
 
 configure_logging()
@@ -17,31 +37,98 @@ logger = get_logger(__name__)
 Nats implementation of BaseTransport.
 """
 
+# Suffix of the subject broadcasts to a topic are published to when fanned out,
+# which all the subscribers of the topic listen to, whether they are in a queue
+# group or not
+BROADCAST_SUFFIX = ".broadcast"
+
+# Seconds a durable consumer waits for messages before fetching again
+FETCH_TIMEOUT = 5.0
+# Error code of a stream that already exists with another configuration
+STREAM_NAME_IN_USE = 10058
+
 
 class NatsTransport(BaseTransport):
     def __init__(
-        self, client: Optional[NATS] = None, endpoint: Optional[str] = None, **kwargs
+        self,
+        client: Optional[NATS] = None,
+        endpoint: Optional[str] = None,
+        wire_format: str = NEGOTIATED_WIRE_FORMAT,
+        jetstream: bool = False,
+        durable_name: Optional[str] = None,
+        fetch_batch: int = 10,
+        max_in_flight: int = 64,
+        ack_wait: float = 30.0,
+        max_deliver: Optional[int] = None,
+        redelivery_delay: float = 1.0,
+        stream_max_age: Optional[float] = 3600.0,
+        fan_out_broadcasts: bool = False,
+        **kwargs,
     ):
         """
         Initialize the NATS transport with the given endpoint and client.
         :param endpoint: The NATS server endpoint.
         :param client: An optional NATS client instance. If not provided, a new one will be created.
+        :param wire_format: The message wire format used for outbound requests ("binary" or "json").
+            By default, binary is used with the topics whose responses advertised
+            it, JSON with the others and for broadcasts. Replies always mirror the
+            format of the request they answer.
+        :param jetstream: Publish requests to JetStream streams and receive them
+            through durable consumers, so that messages published while no
+            subscriber is running are delivered once one is, at least once.
+        :param durable_name: Name of the durable consumers, subscribers sharing it
+            share the messages of a topic. Defaults to one consumer per topic.
+        :param fetch_batch: Number of messages fetched at once by a durable consumer.
+        :param max_in_flight: Number of messages handled and not yet acknowledged
+            at once by a durable consumer.
+        :param ack_wait: Seconds after which a message that was not acknowledged
+            is delivered again. Messages still being handled are reported in
+            progress every ack_wait / 2 seconds.
+        :param max_deliver: Number of times a message is delivered, None for no limit.
+        :param redelivery_delay: Seconds before a message that failed is delivered again.
+        :param stream_max_age: Seconds the messages are kept in their stream, None
+            to keep them until the stream limits are reached.
+        :param fan_out_broadcasts: Publish broadcasts to the fan-out subject of
+            the topic, so that they reach every subscriber of a queue group
+            rather than one. Subscribers older than the fan-out subject only
+            listen to the topic itself, so enable it once all were upgraded.
         """
 
         if not endpoint and not client:
             raise ValueError("Either endpoint or client must be provided")
         if client and not isinstance(client, NATS):
             raise ValueError("Client must be an instance of nats.aio.client.Client")
+        if fetch_batch <= 0 or max_in_flight <= 0:
+            raise ValueError("fetch_batch and max_in_flight must be greater than 0")
 
         self._nc = client
         self.endpoint = endpoint
+        self._wire_formats = WireFormatNegotiator(wire_format)
         self._callback = None
         self.subscriptions = []
+        # broadcasts waiting for responses, by correlation id
+        self._pending = PendingRequests()
+
+        self._jetstream = jetstream
+        self._durable_name = durable_name
+        self._fetch_batch = fetch_batch
+        self._max_in_flight = max_in_flight
+        self._ack_wait = ack_wait
+        self._max_deliver = max_deliver
+        self._redelivery_delay = redelivery_delay
+        self._stream_max_age = stream_max_age
+        self._fan_out_broadcasts = fan_out_broadcasts
+        # prefix of the reply topics of the requests sent by this transport
+        self._inbox: Optional[str] = None
+        self._inbox_lock = asyncio.Lock()
+        # topics whose stream is known to exist, and the durable consumer tasks
+        self._streams: set[str] = set()
+        self._consumers: list[asyncio.Task] = []
 
     @classmethod
-    def from_client(cls, client: NATS) -> "NatsTransport":
+    def from_client(cls, client: NATS, **kwargs) -> "NatsTransport":
         # Optionally validate client
-        return cls(client=client)
+        return cls(client=client, **kwargs)
 
     @classmethod
     def from_config(cls, endpoint: str, **kwargs) -> "NatsTransport":
@@ -82,7 +169,16 @@ class NatsTransport(BaseTransport):
 
     async def close(self) -> None:
         """Close the NATS connection."""
-        if self._nc:
+        self._pending.fail_all(ConnectionError("NATS transport closed"))
+
+        # messages being handled are not acknowledged, they are delivered again
+        consumers, self._consumers = self._consumers, []
+        for consumer in consumers:
+            consumer.cancel()
+        await asyncio.gather(*consumers, return_exceptions=True)
+
+        self._inbox = None
+        if self._nc and not self._nc.is_closed:
             await self._nc.drain()
             await self._nc.close()
             logger.info("NATS connection closed")
@@ -93,8 +189,15 @@ class NatsTransport(BaseTransport):
         """Set the message handler function."""
         self._callback = callback
 
-    async def subscribe(self, topic: str) -> None:
-        """Subscribe to a topic with a callback."""
+    async def subscribe(self, topic: str, queue_group: Optional[str] = None) -> None:
+        """
+        Subscribe to a topic with a callback.
+
+        :param queue_group: Subscribers of a topic sharing a queue group share its
+            messages, each being delivered to one of them. Broadcasts are still
+            delivered to all when the broadcasting transport fans them out. In
+            JetStream mode, the name of the durable consumer.
+        """
         if self._nc is None:
             await self._connect()
 
@@ -102,9 +205,21 @@ class NatsTransport(BaseTransport):
             raise ValueError("Message handler must be set before starting transport")
 
         topic = self.santize_topic(topic)
-        sub = await self._nc.subscribe(topic, cb=self._message_handler)
-        self.subscriptions.append(sub)
-        logger.info(f"Subscribed to topic: {topic}")
+        if self._jetstream:
+            await self._subscribe_durable(topic, queue_group)
+            return
+
+        sub = await self._nc.subscribe(
+            topic, queue=queue_group or "", cb=self._message_handler
+        )
+        fan_out = await self._nc.subscribe(
+            topic + BROADCAST_SUFFIX, cb=self._message_handler
+        )
+        self.subscriptions += [sub, fan_out]
+        if queue_group:
+            logger.info(f"Subscribed to topic: {topic} in queue group {queue_group}")
+        else:
+            logger.info(f"Subscribed to topic: {topic}")
 
     async def publish(
         self,
@@ -123,21 +238,35 @@ class NatsTransport(BaseTransport):
         if message.headers is None:
             message.headers = {}
 
+        message.wire_format = message.wire_format or self._wire_formats.request_format(
+            topic
+        )
+        payload = message.serialize()
+
+        if self._jetstream:
+            response = await self._publish_durable(
+                topic, message, payload, respond, timeout
+            )
+            if respond:
+                self._wire_formats.observe(topic, response)
+            return response
+
         try:
             if respond:
                 resp = await self._nc.request(
                     topic,
-                    message.serialize(),
+                    payload,
                     headers=message.headers,
                     timeout=timeout,
                 )
 
                 message = Message.deserialize(resp.data)
+                self._wire_formats.observe(topic, message)
                 return message
             else:
                 await self._nc.publish(
                     topic,
-                    message.serialize(),
+                    payload,
                 )
         except nats.errors.TimeoutError:
             logger.error(f"Timeout while publishing to {topic}")
@@ -153,56 +282,266 @@ class NatsTransport(BaseTransport):
         expected_responses: int = 1,
         timeout: Optional[float] = 30.0,
     ) -> List[Message]:
-        """Broadcast a message to all subscribers of a topic and wait for responses."""
+        """
+        Broadcast a message to all subscribers of a topic and wait for responses,
+        returning the ones received so far on timeout.
+        """
+        logger.info(
+            f"Collecting up to {expected_responses} response(s) with timeout={timeout}s..."
+        )
+        responses = [
+            response
+            async for response in self.broadcast_stream(
+                topic, message, expected_responses, timeout
+            )
+        ]
+        if len(responses) < expected_responses:
+            logger.warning(
+                f"Timeout reached after {timeout}s; collected {len(responses)} response(s)"
+            )
+        return responses
+
+    async def broadcast_stream(
+        self,
+        topic: str,
+        message: Message,
+        expected_responses: int = 1,
+        timeout: Optional[float] = 30.0,
+        quorum: Optional[int] = None,
+    ) -> AsyncIterator[Message]:
+        """
+        Broadcast a message to all subscribers of a topic and yield the responses
+        as they arrive.
+        """
         if self._nc is None:
             await self._connect()
 
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout is not None else None
+
         publish_topic = self.santize_topic(topic)
-        reply_topic = uuid4().hex
-        message.reply_to = reply_topic
+        request_id = uuid4().hex
+        message.reply_to = await self._reply_topic(request_id)
         logger.info(
-            f"Broadcasting to: {publish_topic} and receiving from: {reply_topic}"
+            f"Broadcasting to: {publish_topic} and receiving from: {message.reply_to}"
         )
 
-        response_queue: asyncio.Queue = asyncio.Queue()
+        message.headers = message.headers or {}
+        message.headers[CORRELATION_HEADER] = request_id
+        message.wire_format = (
+            message.wire_format or self._wire_formats.broadcast_format()
+        )
+        # a stream stores the topic only, so in JetStream mode a broadcast
+        # reaches one subscriber per durable consumer
+        if self._fan_out_broadcasts and not self._jetstream:
+            broadcast_topic = publish_topic + BROADCAST_SUFFIX
+        else:
+            broadcast_topic = topic
+        collector = self._pending.register(request_id, expected_responses)
+        received = 0
+        try:
+            await self.publish(
+                broadcast_topic,
+                message,
+                respond=False,  # tell receivers to reply to the reply_topic
+            )
+            async for response in collector.iterate(deadline):
+                received += 1
+                logger.debug(f"Received {received} response(s)")
+                yield response
+        finally:
+            self._pending.discard(request_id)
 
-        async def _response_handler(nats_msg) -> None:
-            msg = Message.deserialize(nats_msg.data)
-            await response_queue.put(msg)
+        if quorum is not None and received < quorum:
+            raise TimeoutError(
+                f"Broadcast to {publish_topic} received {received} of the "
+                f"{quorum} responses required"
+            )
 
-        # Subscribe to the reply topic to handle responses
-        sub = await self._nc.subscribe(reply_topic, cb=_response_handler)
-        await self.publish(
-            topic,
-            message,
-            respond=False,  # tell receivers to reply to the reply_topic
-        )
+    async def request_stream(
+        self,
+        topic: str,
+        message: Message,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[Message]:
+        """Send a request and yield the chunks of its streamed response in order."""
+        if self._nc is None:
+            await self._connect()
 
-        logger.info(
-            f"Collecting up to {expected_responses} response(s) with timeout={timeout}s..."
-        )
-        responses: List[Message] = []
+        # the chunks are published by the responder to a reply topic of our own
+        request_id = uuid4().hex
+        message.reply_to = await self._reply_topic(request_id)
+        message.headers = message.headers or {}
+        message.headers[STREAM_HEADER] = "1"
 
+        stream = self._pending.register_stream(request_id)
         try:
-            # Use a timeout to collect responses
-            async def collect_responses():
-                while len(responses) < expected_responses:
-                    msg = await asyncio.wait_for(response_queue.get(), timeout=timeout)
-                    responses.append(msg)
-                    logger.info(f"Received {len(responses)} response(s)")
+            await self.publish(topic, message, respond=False)
+            first = True
+            async for chunk in stream.iterate(timeout):
+                if first:
+                    self._wire_formats.observe(self.santize_topic(topic), chunk)
+                    first = False
+                yield chunk
+        finally:
+            self._pending.discard(request_id)
 
-            await collect_responses()
+    async def _reply_topic(self, request_id: str) -> str:
+        """
+        Return the reply topic of a request, on the inbox of this transport.
 
-        except asyncio.TimeoutError:
-            logger.warning(
-                f"Timeout reached after {timeout}s; collected {len(responses)} response(s)"
+        Responses to all requests arrive on one wildcard subscription, like the
+        ones of nats.py requests, rather than on a subscription per request.
+        """
+        if self._inbox is None:
+            async with self._inbox_lock:
+                if self._inbox is None:
+                    inbox = self._nc.new_inbox()
+                    await self._nc.subscribe(f"{inbox}.*", cb=self._inbox_handler)
+                    self._inbox = inbox
+        return f"{self._inbox}.{request_id}"
+
+    async def _inbox_handler(self, nats_msg) -> None:
+        # the last token of the subject is the id of the request
+        request_id = nats_msg.subject.rsplit(".", 1)[-1]
+        response = Message.deserialize(nats_msg.data)
+        if not self._pending.resolve(response, request_id):
+            logger.debug(f"Dropping unknown or duplicate response to {request_id}")
+
+    # ###################################################
+    # JetStream methods
+    # ###################################################
+
+    async def _ensure_stream(self, topic: str) -> str:
+        """Create the stream storing the messages of a topic, unless it exists."""
+        name = "agntcy_" + re.sub(r"[^A-Za-z0-9_-]", "_", topic)
+        if topic in self._streams:
+            return name
+
+        try:
+            await self._nc.jetstream().add_stream(
+                name=name, subjects=[topic], max_age=self._stream_max_age
             )
+        except BadRequestError as e:
+            # created by another process with other limits, use it as it is
+            if e.err_code != STREAM_NAME_IN_USE:
+                raise
+        self._streams.add(topic)
+        return name
+
+    async def _publish_durable(
+        self,
+        topic: str,
+        message: Message,
+        payload: bytes,
+        respond: bool,
+        timeout: float,
+    ) -> Optional[Message]:
+        if respond:
+            # the stream acknowledges the publish, so the response comes to a
+            # reply topic of our own rather than to the request inbox
+            responses = self.broadcast_stream(topic, message, 1, timeout)
+            async with contextlib.aclosing(responses):
+                async for response in responses:
+                    return response
+            logger.error(f"Timeout while publishing to {topic}")
+            raise nats.errors.TimeoutError
 
+        await self._ensure_stream(topic)
+        try:
+            await self._nc.jetstream().publish(topic, payload)
+        except Exception as e:
+            logger.error(f"Unexpected error while publishing to {topic}: {e}")
+            raise
+
+    async def _subscribe_durable(
+        self, topic: str, durable_name: Optional[str] = None
+    ) -> None:
+        stream = await self._ensure_stream(topic)
+        sub = await self._nc.jetstream().pull_subscribe(
+            topic,
+            durable=durable_name or self._durable_name or stream,
+            stream=stream,
+            config=ConsumerConfig(
+                ack_wait=self._ack_wait,
+                max_deliver=self._max_deliver,
+                max_ack_pending=self._max_in_flight,
+            ),
+        )
+        self.subscriptions.append(sub)
+        self._consumers.append(asyncio.create_task(self._consume(sub, topic)))
+        logger.info(f"Subscribed to topic: {topic} with durable consumer")
+
+    async def _consume(self, sub, topic: str) -> None:
+        # bound the handlers in flight as the consumer bounds unacknowledged messages
+        runner = KeyedTaskRunner(self._max_in_flight)
+        try:
+            while True:
+                try:
+                    msgs = await sub.fetch(self._fetch_batch, timeout=FETCH_TIMEOUT)
+                except nats.errors.TimeoutError:
+                    continue
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    if self._nc.is_closed:
+                        return
+                    logger.error(f"Failed to fetch messages from {topic}: {e}")
+                    await asyncio.sleep(self._redelivery_delay)
+                    continue
+
+                for msg in msgs:
+                    await runner.submit(functools.partial(self._handle_durable, msg))
         finally:
-            # Clean up request specific subscription
-            await sub.unsubscribe()
+            runner.cancel()
 
-        return responses
+    async def _handle_durable(self, nats_msg) -> None:
+        """Handle a message of a durable consumer, acknowledging it once replied to."""
+        message = Message.deserialize(nats_msg.data)
+        # we will handle replies instead of the bridge receiver, the reply
+        # subject of the NATS message is the one acknowledging it
+        reply_to = message.reply_to
+        message.reply_to = None
+
+        # handlers may outlast ack_wait, e.g. LLM backed agents
+        heartbeat = asyncio.create_task(self._keep_in_progress(nats_msg))
+        try:
+            try:
+                output = await self._callback(message)
+                if reply_to and output is None:
+                    raise RuntimeError("No response to send")
+                if reply_to:
+                    await self._reply(reply_to, message, output)
+            finally:
+                heartbeat.cancel()
+        except Exception as e:
+            logger.warning(f"Failed to handle message from {nats_msg.subject}: {e}")
+            await nats_msg.nak(delay=self._redelivery_delay)
+            return
+
+        await nats_msg.ack()
+
+    async def _keep_in_progress(self, nats_msg) -> None:
+        """Reset the ack_wait of a message being handled, so that it is not redelivered."""
+        while True:
+            await asyncio.sleep(self._ack_wait / 2)
+            try:
+                await nats_msg.in_progress()
+            except Exception as e:
+                logger.warning(
+                    f"Failed to extend the ack wait of a message from {nats_msg.subject}: {e}"
+                )
+
+    async def _reply(self, reply_to: str, request: Message, output) -> None:
+        if is_stream(output):
+            async for chunk in frame_stream(output):
+                await self._reply(reply_to, request, chunk)
+            return
+
+        correlate(output, request, self.sender_id)
+        # reply in the format the request was sent in
+        payload = output.serialize(output.wire_format or request.wire_format)
+        await self._nc.publish(reply_to, payload)
 
     async def _message_handler(self, nats_msg):
         """Internal handler for NATS messages."""
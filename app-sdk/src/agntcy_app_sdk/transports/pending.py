@@ -0,0 +1,182 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import AsyncIterator, Optional, Union
+import asyncio
+
+from agntcy_app_sdk.protocols.message import Message, advertise_wire_formats
+from agntcy_app_sdk.transports.streaming import StreamCollector
+
+# Header carrying the id a response is correlated to its request with. Responders
+# already echo it back, so it is used for single requests as well as broadcasts.
+CORRELATION_HEADER = "broadcast_id"
+# Header identifying the responder, so that a response delivered more than once
+# counts once towards the responses a broadcast expects
+SENDER_HEADER = "sender_id"
+
+
+def correlation_id(message: Message) -> Optional[str]:
+    """Return the correlation id of a message, if any."""
+    if not message.headers:
+        return None
+    return message.headers.get(CORRELATION_HEADER)
+
+
+def sender_id(message: Message) -> Optional[str]:
+    """Return the identity of the sender of a response, if any."""
+    if not message.headers:
+        return None
+    return message.headers.get(SENDER_HEADER)
+
+
+def correlate(response: Message, request: Message, sender: str) -> None:
+    """
+    Tag a response with the correlation id of its request, its sender and the
+    wire formats the sender understands.
+    """
+    response.headers = response.headers or {}
+    request_id = correlation_id(request)
+    if request_id:
+        response.headers[CORRELATION_HEADER] = request_id
+    response.headers[SENDER_HEADER] = sender
+    advertise_wire_formats(response)
+
+
+_END = object()
+
+
+class ResponseCollector:
+    """
+    Gathers the responses to one outstanding request, to be waited for all
+    at once or iterated over as they arrive. Responses from a sender that
+    already responded are dropped.
+    """
+
+    def __init__(self, expected_responses: int = 1):
+        self.expected_responses = expected_responses
+        self.responses: list[Message] = []
+        self._senders: set[str] = set()
+        self._done = asyncio.get_running_loop().create_future()
+        # the responses and then the end or failure, in arrival order
+        self._arrivals: asyncio.Queue = asyncio.Queue()
+        if expected_responses <= 0:
+            self._done.set_result(None)
+            self._arrivals.put_nowait(_END)
+
+    def done(self) -> bool:
+        return self._done.done()
+
+    def add(self, message: Message) -> bool:
+        """Record a response, return False if the collector does not need it."""
+        if self._done.done():
+            return False
+
+        sender = sender_id(message)
+        if sender is not None:
+            if sender in self._senders:
+                return False
+            self._senders.add(sender)
+
+        self.responses.append(message)
+        self._arrivals.put_nowait(message)
+        if len(self.responses) >= self.expected_responses:
+            self._done.set_result(None)
+            self._arrivals.put_nowait(_END)
+        return True
+
+    def fail(self, exc: BaseException) -> None:
+        """Fail the request, e.g. because the transport is closing."""
+        if not self._done.done():
+            self._done.set_exception(exc)
+            self._arrivals.put_nowait(exc)
+
+    async def wait(self) -> list[Message]:
+        """Wait until all the expected responses were received."""
+        # shield the future so that cancelling a waiter does not cancel the request
+        await asyncio.shield(self._done)
+        return self.responses
+
+    async def iterate(self, deadline: Optional[float] = None) -> AsyncIterator[Message]:
+        """
+        Yield the responses as they arrive, until all the expected ones were
+        received or, if given, the event loop time deadline passed.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            timeout = None if deadline is None else deadline - loop.time()
+            if timeout is not None and timeout <= 0:
+                return
+            try:
+                item = await asyncio.wait_for(self._arrivals.get(), timeout=timeout)
+            except asyncio.TimeoutError:
+                return
+
+            if item is _END:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+
+
+class PendingRequests:
+    """
+    Table of the requests waiting for responses, keyed by correlation id.
+
+    A single reader feeds every response received on a session to resolve(),
+    so that any number of requests can be in flight and complete out of order.
+    """
+
+    def __init__(self):
+        self._collectors: dict[str, Union[ResponseCollector, StreamCollector]] = {}
+
+    def __len__(self) -> int:
+        return len(self._collectors)
+
+    def __contains__(self, request_id: str) -> bool:
+        return request_id in self._collectors
+
+    def register(
+        self, request_id: str, expected_responses: int = 1
+    ) -> ResponseCollector:
+        """Start waiting for responses to request_id, before the request is sent."""
+        return self._add(request_id, ResponseCollector(expected_responses))
+
+    def register_stream(self, request_id: str) -> StreamCollector:
+        """Start waiting for the chunks of a streamed response to request_id."""
+        return self._add(request_id, StreamCollector())
+
+    def _add(self, request_id: str, collector):
+        if request_id in self._collectors:
+            raise ValueError(f"Request {request_id} is already pending")
+
+        self._collectors[request_id] = collector
+        return collector
+
+    def discard(self, request_id: str) -> None:
+        """Stop waiting for responses to request_id."""
+        self._collectors.pop(request_id, None)
+
+    def resolve(self, message: Message, request_id: Optional[str] = None) -> bool:
+        """
+        Hand a response to the request it correlates to, or to request_id if
+        the transport tells the requests apart by other means.
+
+        Returns False if no pending request is waiting for it, e.g. because it
+        is a late response to a request that timed out.
+        """
+        collector = self._collectors.get(request_id or correlation_id(message))
+        if collector is None:
+            return False
+        return collector.add(message)
+
+    def fail(self, request_id: str, exc: BaseException) -> None:
+        """Fail and forget a pending request, e.g. because its connection was lost."""
+        collector = self._collectors.pop(request_id, None)
+        if collector is not None:
+            collector.fail(exc)
+
+    def fail_all(self, exc: BaseException) -> None:
+        """Fail and forget every pending request."""
+        collectors, self._collectors = self._collectors, {}
+        for collector in collectors.values():
+            collector.fail(exc)
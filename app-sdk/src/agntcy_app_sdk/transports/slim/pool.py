@@ -0,0 +1,261 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Hashable, Optional
+import asyncio
+import zlib
+
+from agntcy_app_sdk.common.cache import TTLCache
+from agntcy_app_sdk.common.logging_config import configure_logging, get_logger
+
+configure_logging()
+logger = get_logger(__name__)
+
+LEAST_LOADED = "least_loaded"
+HASH_BY_TOPIC = "hash_by_topic"
+POOL_STRATEGIES = (LEAST_LOADED, HASH_BY_TOPIC)
+
+
+class PooledGateway:
+    """
+    One SLIM connection of a pool, with the routes, subscriptions, sessions and
+    tasks that are bound to it.
+    """
+
+    def __init__(
+        self,
+        index: int,
+        gateway: Any,
+        reply_topic: str,
+        route_cache_size: int = 1024,
+        route_cache_ttl: Optional[float] = 300.0,
+    ):
+        self.index = index
+        self.gateway = gateway
+        # topic on which the responses to requests sent on this connection arrive
+        self.reply_topic = reply_topic
+
+        # (org, namespace, topic) of the routes and subscriptions already set
+        self.routes = TTLCache(maxsize=route_cache_size, ttl=route_cache_ttl)
+        self.subscriptions = TTLCache(maxsize=route_cache_size, ttl=route_cache_ttl)
+        self.sessions: dict[str, Any] = {}
+        self.session_lock = asyncio.Lock()
+        self.tasks: dict[Hashable, asyncio.Task] = {}
+        # correlation ids of the requests waiting for responses on this connection
+        self.pending: set[str] = set()
+        # (org, namespace, topic) of the reply topics given by callers, with the
+        # number of requests using them, unsubscribed once no longer used
+        self.reply_topic_users: dict[tuple[str, str, str], int] = {}
+
+        self.receiving = False
+        self.in_flight = 0
+        self.healthy = True
+
+    def reset(self, gateway: Any = None) -> None:
+        """Cancel tasks, forget the connection state and optionally replace it."""
+        for task in self.tasks.values():
+            task.cancel()
+        self.tasks.clear()
+        self.routes.clear()
+        self.subscriptions.clear()
+        self.sessions.clear()
+        self.pending.clear()
+        self.receiving = False
+
+        if gateway is not None:
+            self.gateway = gateway
+            self.healthy = True
+
+
+class GatewayPool:
+    """
+    A fixed-size pool of SLIM connections.
+
+    Connections are picked per publish, either the one with the fewest requests
+    in flight or by hashing the topic, so that a single process is not limited
+    to the throughput of one stream to the SLIM node. Connections failing a
+    publish or a periodic health check are taken out of rotation and
+    reconnected in the background.
+    """
+
+    def __init__(
+        self,
+        size: int = 1,
+        strategy: str = LEAST_LOADED,
+        connect: Optional[Callable[[int], Awaitable[Any]]] = None,
+        check: Optional[Callable[[PooledGateway], Awaitable[None]]] = None,
+        on_unhealthy: Optional[Callable[[PooledGateway], Awaitable[None]]] = None,
+        on_reconnect: Optional[Callable[[PooledGateway], Awaitable[None]]] = None,
+        reply_topic: str = "",
+        health_check_interval: Optional[float] = 30.0,
+        reconnect_backoff: float = 1.0,
+        max_reconnect_backoff: float = 30.0,
+        route_cache_size: int = 1024,
+        route_cache_ttl: Optional[float] = 300.0,
+    ):
+        """
+        :param size: Number of connections in the pool.
+        :param strategy: How a connection is picked, LEAST_LOADED or HASH_BY_TOPIC.
+        :param connect: Coroutine function creating the connection of a pool slot,
+            None if connections cannot be re-established.
+        :param check: Coroutine function raising if a connection is not healthy.
+        :param on_unhealthy: Called once a connection is taken out of rotation,
+            before it is reconnected.
+        :param on_reconnect: Called once a connection was re-established.
+        :param reply_topic: Reply topic of the first connection, the others
+            derive theirs from it.
+        :param health_check_interval: Seconds between health checks, None to disable.
+        :param reconnect_backoff: Initial delay between reconnection attempts.
+        :param max_reconnect_backoff: Maximum delay between reconnection attempts.
+        """
+        if size <= 0:
+            raise ValueError("Pool size must be greater than 0")
+        if strategy not in POOL_STRATEGIES:
+            raise ValueError(f"Unsupported pool strategy: {strategy}")
+
+        self.size = size
+        self.strategy = strategy
+        self.members: list[PooledGateway] = []
+
+        self._connect = connect
+        self._check = check
+        self._on_unhealthy = on_unhealthy
+        self._on_reconnect = on_reconnect
+        self._reply_topic = reply_topic
+        self._health_check_interval = health_check_interval
+        self._reconnect_backoff = reconnect_backoff
+        self._max_reconnect_backoff = max_reconnect_backoff
+        self._route_cache_size = route_cache_size
+        self._route_cache_ttl = route_cache_ttl
+
+        self._health_task: Optional[asyncio.Task] = None
+        self._reconnect_tasks: dict[int, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    @property
+    def primary(self) -> PooledGateway:
+        """The first connection, which serves the subscriptions of the transport."""
+        return self.members[0]
+
+    async def start(self, gateway: Any) -> None:
+        """Fill the pool, gateway being the already established first connection."""
+        gateways = [gateway]
+        if self.size > 1:
+            gateways += await asyncio.gather(
+                *(self._connect(index) for index in range(1, self.size))
+            )
+
+        self.members = [
+            PooledGateway(
+                index,
+                gateway,
+                self._member_reply_topic(index),
+                route_cache_size=self._route_cache_size,
+                route_cache_ttl=self._route_cache_ttl,
+            )
+            for index, gateway in enumerate(gateways)
+        ]
+
+        if self._health_check_interval and self._check and self._connect:
+            self._health_task = asyncio.create_task(self._health_loop())
+
+    async def close(self) -> None:
+        """Stop health checks and reconnections."""
+        tasks = list(self._reconnect_tasks.values())
+        if self._health_task:
+            tasks.append(self._health_task)
+            self._health_task = None
+        self._reconnect_tasks.clear()
+
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def select(self, topic: Optional[str] = None) -> PooledGateway:
+        """Pick a healthy connection to publish to topic on."""
+        healthy = [member for member in self.members if member.healthy]
+        if not healthy:
+            raise ConnectionError("No healthy SLIM connection available")
+
+        if self.strategy == HASH_BY_TOPIC and topic is not None:
+            return healthy[zlib.crc32(topic.encode()) % len(healthy)]
+        return min(healthy, key=lambda member: member.in_flight)
+
+    @asynccontextmanager
+    async def acquire(
+        self, topic: Optional[str] = None
+    ) -> AsyncIterator[PooledGateway]:
+        """Pick a connection and count the request as in flight on it."""
+        member = self.select(topic)
+        member.in_flight += 1
+        try:
+            yield member
+        finally:
+            member.in_flight -= 1
+
+    def mark_unhealthy(self, member: PooledGateway, error: Exception) -> None:
+        """Take a connection out of rotation and reconnect it in the background."""
+        if not member.healthy:
+            return
+        if self._connect is None:
+            # nothing to reconnect with, keep using the connection we were given
+            logger.warning(f"SLIM connection {member.index} failed: {error}")
+            return
+
+        logger.warning(f"SLIM connection {member.index} is unhealthy: {error}")
+        member.healthy = False
+        self._reconnect_tasks[member.index] = asyncio.create_task(
+            self._reconnect(member)
+        )
+
+    async def _reconnect(self, member: PooledGateway) -> None:
+        if self._on_unhealthy:
+            try:
+                await self._on_unhealthy(member)
+            except Exception as e:
+                logger.warning(f"Failed to release SLIM connection {member.index}: {e}")
+
+        delay = self._reconnect_backoff
+        while True:
+            try:
+                gateway = await self._connect(member.index)
+                break
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Failed to reconnect SLIM connection {member.index}: {e}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self._max_reconnect_backoff)
+
+        member.reset(gateway)
+        self._reconnect_tasks.pop(member.index, None)
+        logger.info(f"SLIM connection {member.index} reconnected")
+
+        if self._on_reconnect:
+            try:
+                await self._on_reconnect(member)
+            except Exception as e:
+                logger.error(f"Failed to restore SLIM connection {member.index}: {e}")
+
+    async def _health_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._health_check_interval)
+            for member in self.members:
+                if not member.healthy:
+                    continue
+                try:
+                    await asyncio.wait_for(
+                        self._check(member), timeout=self._health_check_interval
+                    )
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    self.mark_unhealthy(member, e)
+
+    def _member_reply_topic(self, index: int) -> str:
+        if index == 0:
+            return self._reply_topic
+        return f"{self._reply_topic}-{index}"
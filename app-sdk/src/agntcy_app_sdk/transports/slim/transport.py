@@ -1,15 +1,38 @@
 # Copyright AGNTCY Contributors (https://github.com/agntcy)
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Optional, Callable
+from typing import AsyncIterator, Optional, Callable, Hashable
+import contextlib
 import os
 import slim_bindings
 import asyncio
 import inspect
 import datetime
+import functools
 import uuid
 from agntcy_app_sdk.common.logging_config import configure_logging, get_logger
 from agntcy_app_sdk.transports.transport import BaseTransport, Message
+from agntcy_app_sdk.common.concurrency import KeyedTaskRunner
+from agntcy_app_sdk.protocols.message import (
+    NEGOTIATED_WIRE_FORMAT,
+    WireFormatNegotiator,
+)
+from agntcy_app_sdk.transports.slim.pool import (
+    LEAST_LOADED,
+    GatewayPool,
+    PooledGateway,
+)
+from agntcy_app_sdk.transports.pending import (
+    CORRELATION_HEADER,
+    PendingRequests,
+    correlate,
+    correlation_id,
+)
+from agntcy_app_sdk.transports.streaming import (
+    STREAM_HEADER,
+    frame_stream,
+    is_stream,
+)
 
 
 configure_logging()
@@ -31,14 +54,65 @@ class SLIMTransport(BaseTransport):
         endpoint: Optional[str] = None,
         default_org: str = "default",
         default_namespace: str = "default",
+        wire_format: str = NEGOTIATED_WIRE_FORMAT,
+        route_cache_size: int = 1024,
+        route_cache_ttl: Optional[float] = 300.0,
+        pool_size: int = 1,
+        pool_strategy: str = LEAST_LOADED,
+        health_check_interval: Optional[float] = 30.0,
+        max_concurrent_requests: int = 16,
+        ordering_key: Optional[Callable[[Message], Optional[Hashable]]] = None,
     ) -> None:
+        """
+        :param client: An optional slim_bindings.Slim instance.
+        :param endpoint: The SLIM server endpoint.
+        :param default_org: The organization name.
+        :param default_namespace: The namespace name.
+        :param wire_format: The message wire format used for outbound requests,
+            "binary" or "json". By default, binary is used with the topics whose
+            responses advertised it, JSON with the others and for broadcasts.
+        :param route_cache_size: Maximum number of established routes and
+            subscriptions remembered, to skip setting them again on publish.
+        :param route_cache_ttl: Seconds after which a route or subscription is
+            set again, None to keep them until the transport is closed.
+        :param pool_size: Number of connections to the SLIM server requests are
+            spread over, only used when the transport creates its own gateway.
+        :param pool_strategy: How a connection is picked for a publish,
+            "least_loaded" or "hash_by_topic".
+        :param health_check_interval: Seconds between connection health checks,
+            None to disable them.
+        :param max_concurrent_requests: Number of received requests handled
+            concurrently on each subscribed topic.
+        :param ordering_key: Optional function returning the key of a received
+            request, requests with the same key are handled in order, e.g.
+            A2AProtocol.context_id. Requests without key are not ordered.
+        """
         self._endpoint = endpoint
         self._gateway = client
         self._callback = None
         self._default_org = default_org
         self._default_namespace = default_namespace
-
-        self._sessions = {}
+        # format used for outbound requests, replies mirror the request format
+        self._wire_formats = WireFormatNegotiator(wire_format)
+
+        self._route_cache_size = route_cache_size
+        self._route_cache_ttl = route_cache_ttl
+        self._pool_size = pool_size
+        self._pool_strategy = pool_strategy
+        self._health_check_interval = health_check_interval
+        self._max_concurrent_requests = max_concurrent_requests
+        self._ordering_key = ordering_key
+        # connections and the state bound to them, created with the first gateway
+        self._pool: Optional[GatewayPool] = None
+        self._pool_lock = asyncio.Lock()
+        # (org, namespace, topic) served by this transport, restored on reconnect
+        self._served_topics: set[tuple[str, str, str]] = set()
+
+        # stable topic on which this transport receives responses to its requests
+        self._reply_topic = uuid.uuid4().hex
+
+        # requests waiting for responses, fed by one reader task per session
+        self._pending = PendingRequests()
 
         if os.environ.get("TRACING_ENABLED", "false").lower() == "true":
             # Initialize tracing if enabled
@@ -54,9 +128,13 @@ class SLIMTransport(BaseTransport):
     # ###################################################
 
     @classmethod
-    def from_client(cls, client, org="default", namespace="default") -> "SLIMTransport":
+    def from_client(
+        cls, client, org="default", namespace="default", **kwargs
+    ) -> "SLIMTransport":
         # Optionally validate client
-        return cls(client=client, default_org=org, default_namespace=namespace)
+        return cls(
+            client=client, default_org=org, default_namespace=namespace, **kwargs
+        )
 
     @classmethod
     def from_config(
@@ -78,7 +156,16 @@ class SLIMTransport(BaseTransport):
         return "SLIM"
 
     async def close(self) -> None:
-        pass
+        """Fail pending requests, stop readers and disconnect our gateways."""
+        self._pending.fail_all(ConnectionError("SLIM transport closed"))
+
+        if self._pool is None:
+            return
+
+        pool, self._pool = self._pool, None
+        await pool.close()
+        for member in pool.members:
+            await self._release(member)
 
     def set_callback(self, handler: Callable[[Message], asyncio.Future]) -> None:
         """Set the message handler function."""
@@ -95,9 +182,13 @@ class SLIMTransport(BaseTransport):
 
         logger.debug(f"Publishing {message.payload} to topic: {topic}")
 
-        # if we are asked to provide a response, use or generate a reply_to topic
-        if respond and not message.reply_to:
-            message.reply_to = uuid.uuid4().hex
+        # responses are matched to this request by correlation id
+        if respond:
+            message.headers = message.headers or {}
+            message.headers[CORRELATION_HEADER] = uuid.uuid4().hex
+        message.wire_format = message.wire_format or self._wire_formats.request_format(
+            topic
+        )
 
         resp = await self._publish(
             org=self._default_org,
@@ -105,10 +196,13 @@ class SLIMTransport(BaseTransport):
             topic=topic,
             message=message,
             expected_responses=1 if respond else 0,
+            reply=respond,
         )
 
         if respond:
-            return resp[0] if resp else None
+            response = resp[0] if resp else None
+            self._wire_formats.observe(topic, response)
+            return response
 
     async def broadcast(
         self,
@@ -116,39 +210,113 @@ class SLIMTransport(BaseTransport):
         message: Message,
         expected_responses: int = 1,
         timeout: Optional[float] = 30.0,
-    ) -> None:
-        """Broadcast a message to all subscribers of a topic and wait for responses."""
+    ) -> list[Message]:
+        """
+        Broadcast a message to all subscribers of a topic and wait for responses,
+        returning the ones received so far on timeout.
+        """
+        responses = [
+            response
+            async for response in self.broadcast_stream(
+                topic, message, expected_responses, timeout
+            )
+        ]
+        if len(responses) < expected_responses:
+            logger.warning(
+                f"Broadcast to topic {topic} timed out after {timeout} seconds "
+                f"with {len(responses)} of {expected_responses} responses"
+            )
+        return responses
+
+    async def broadcast_stream(
+        self,
+        topic: str,
+        message: Message,
+        expected_responses: int = 1,
+        timeout: Optional[float] = 30.0,
+        quorum: Optional[int] = None,
+    ) -> AsyncIterator[Message]:
+        """
+        Broadcast a message to all subscribers of a topic and yield the responses
+        as they arrive.
+        """
         topic = self.santize_topic(topic)
 
         logger.info(
             f"Broadcasting to topic: {topic} and waiting for {expected_responses} responses"
         )
 
-        # Generate a unique reply_to topic if not provided
-        if not message.reply_to:
-            message.reply_to = uuid.uuid4().hex
+        # the deadline covers sending as well, a slow connection must not extend it
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout is not None else None
 
+        # Responses to concurrent broadcasts are told apart by broadcast_id
         # set the broadcast_id header to a unique value
+        request_id = str(uuid.uuid4())
         message.headers = message.headers or {}
-        message.headers["broadcast_id"] = str(uuid.uuid4())
+        message.headers[CORRELATION_HEADER] = request_id
+        message.wire_format = (
+            message.wire_format or self._wire_formats.broadcast_format()
+        )
 
+        collector = self._pending.register(request_id, expected_responses)
+        received = 0
         try:
-            responses = await asyncio.wait_for(
-                self._publish(
-                    org=self._default_org,
-                    namespace=self._default_namespace,
-                    topic=topic,
-                    message=message,
-                    expected_responses=expected_responses,
-                ),
-                timeout=timeout,
-            )
-            return responses
-        except asyncio.TimeoutError:
-            logger.warning(
-                f"Broadcast to topic {topic} timed out after {timeout} seconds"
+            async with self._exchange(
+                self._default_org,
+                self._default_namespace,
+                topic,
+                message,
+                request_id,
+                reply=True,
+            ):
+                async for response in collector.iterate(deadline):
+                    received += 1
+                    yield response
+        finally:
+            self._pending.discard(request_id)
+
+        if quorum is not None and received < quorum:
+            raise TimeoutError(
+                f"Broadcast to topic {topic} received {received} of the "
+                f"{quorum} responses required"
             )
-            return []
+
+    async def request_stream(
+        self,
+        topic: str,
+        message: Message,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[Message]:
+        """Send a request and yield the chunks of its streamed response in order."""
+        topic = self.santize_topic(topic)
+
+        request_id = uuid.uuid4().hex
+        message.headers = message.headers or {}
+        message.headers[CORRELATION_HEADER] = request_id
+        message.headers[STREAM_HEADER] = "1"
+        message.wire_format = message.wire_format or self._wire_formats.request_format(
+            topic
+        )
+
+        stream = self._pending.register_stream(request_id)
+        try:
+            async with self._exchange(
+                self._default_org,
+                self._default_namespace,
+                topic,
+                message,
+                request_id,
+                reply=True,
+            ):
+                first = True
+                async for chunk in stream.iterate(timeout):
+                    if first:
+                        self._wire_formats.observe(topic, chunk)
+                        first = False
+                    yield chunk
+        finally:
+            self._pending.discard(request_id)
 
     async def subscribe(self, topic: str) -> None:
         """Subscribe to a topic with a callback."""
@@ -169,58 +337,115 @@ class SLIMTransport(BaseTransport):
     # ###################################################
 
     async def _subscribe(self, org: str, namespace: str, topic: str) -> None:
-        if not self._gateway:
-            await self._create_gateway(org, namespace, topic)
-
-        await self._gateway.subscribe(org, namespace, topic)
+        await self._ensure_pool(org, namespace, topic)
 
-        session_info = await self._get_session(org, namespace, topic, "pubsub")
+        # subscriptions are served on the first connection
+        self._served_topics.add((org, namespace, topic))
+        await self._serve(self._pool.primary, org, namespace, topic)
 
-        async def background_task():
-            async with self._gateway:
-                while True:
-                    # Receive the message from the session
-                    recv_session, msg = await self._gateway.receive(
-                        session=session_info.id
-                    )
+    async def _serve(
+        self, member: PooledGateway, org: str, namespace: str, topic: str
+    ) -> None:
+        await member.gateway.subscribe(org, namespace, topic)
 
-                    msg = Message.deserialize(msg)
+        session_info = await self._get_session(member, org, namespace, topic, "pubsub")
 
-                    logger.debug(f"Received message: {msg}")
+        await self._start_receiving(member)
+        member.tasks[("requests", session_info.id)] = asyncio.create_task(
+            self._handle_requests(member, session_info, org, namespace)
+        )
 
-                    reply_to = msg.reply_to
-                    msg.reply_to = (
-                        None  # we will handle replies instead of the bridge receiver
-                    )
+    async def _handle_requests(
+        self, member: PooledGateway, session_info, org: str, namespace: str
+    ) -> None:
+        gateway = member.gateway
+        # a slow request must not hold back the ones received after it
+        runner = KeyedTaskRunner(self._max_concurrent_requests)
 
-                    if inspect.iscoroutinefunction(self._callback):
-                        output = await self._callback(msg)
-                    else:
-                        output = self._callback(msg)
+        try:
+            while True:
+                # Receive the message from the session
+                recv_session, msg = await gateway.receive(session=session_info.id)
+
+                msg = Message.deserialize(msg)
+
+                logger.debug(f"Received message: {msg}")
+
+                key = self._ordering_key(msg) if self._ordering_key else None
+
+                await runner.submit(
+                    functools.partial(
+                        self._handle_request,
+                        gateway,
+                        member,
+                        recv_session,
+                        msg,
+                        org,
+                        namespace,
+                    ),
+                    key=key,
+                )
+        finally:
+            runner.cancel()
 
-                    if reply_to:
-                        # set a unique broadcast_id if not already set
-                        output.headers = output.headers or {}
-                        output.headers["broadcast_id"] = msg.headers.get(
-                            "broadcast_id", str(uuid.uuid4())
-                        )
+    async def _handle_request(
+        self,
+        gateway,
+        member: PooledGateway,
+        recv_session,
+        msg: Message,
+        org: str,
+        namespace: str,
+    ) -> None:
+        reply_to = msg.reply_to
+        # we will handle replies instead of the bridge receiver
+        msg.reply_to = None
 
-                        payload = output.serialize()
+        if inspect.iscoroutinefunction(self._callback):
+            output = await self._callback(msg)
+        else:
+            output = self._callback(msg)
+
+        if reply_to and output is None:
+            logger.warning(f"No response to send to {reply_to}")
+        elif reply_to:
+            # Set a slim route to the reply_to topic to enable outbound messages
+            await self._set_route(member, org, namespace, reply_to)
+
+            if is_stream(output):
+                async for chunk in frame_stream(output):
+                    await self._reply(
+                        gateway, recv_session, org, namespace, reply_to, msg, chunk
+                    )
+            else:
+                await self._reply(
+                    gateway, recv_session, org, namespace, reply_to, msg, output
+                )
 
-                        # Set a slim route to the reply_to topic to enable outbound messages
-                        await self._gateway.set_route(org, namespace, reply_to)
+            logger.debug(f"Replied to {reply_to}")
 
-                        await self._gateway.publish(
-                            recv_session,
-                            payload,
-                            org,
-                            namespace,
-                            reply_to,
-                        )
+    async def _reply(
+        self,
+        gateway,
+        recv_session,
+        org: str,
+        namespace: str,
+        reply_to: str,
+        request: Message,
+        output: Message,
+    ) -> None:
+        correlate(output, request, self.sender_id)
 
-                        logger.debug(f"Replied to {reply_to} with message: {output}")
+        # reply in the format the request was sent in
+        payload = output.serialize(output.wire_format or request.wire_format)
 
-        asyncio.create_task(background_task())
+        await gateway.publish(
+            recv_session,
+            payload,
+            org,
+            namespace,
+            reply_to,
+        )
 
     async def _publish(
         self,
@@ -229,60 +454,255 @@ class SLIMTransport(BaseTransport):
         topic: str,
         message: Message,
         expected_responses: int = 0,
-    ) -> None:
-        if not self._gateway:
-            await self._create_gateway(org, namespace, uuid.uuid4().hex)
+        reply: bool = False,
+    ) -> list[Message]:
+        request_id = correlation_id(message) if expected_responses > 0 else None
+        if expected_responses > 0 and not request_id:
+            raise ValueError("A request expecting responses needs a correlation id")
+
+        # register before sending, a fast response must find its request
+        collector = (
+            self._pending.register(request_id, expected_responses)
+            if request_id
+            else None
+        )
+
+        try:
+            async with self._exchange(
+                org, namespace, topic, message, request_id, reply
+            ):
+                if collector is None:
+                    return []
+                return await collector.wait()
+        finally:
+            if request_id:
+                self._pending.discard(request_id)
+
+    @contextlib.asynccontextmanager
+    async def _exchange(
+        self,
+        org: str,
+        namespace: str,
+        topic: str,
+        message: Message,
+        request_id: Optional[str],
+        reply: bool,
+    ) -> AsyncIterator[PooledGateway]:
+        """
+        Send a message on a pooled connection, which is held until the responses
+        to it were received.
+        """
+        await self._ensure_pool(org, namespace, uuid.uuid4().hex)
 
         logger.debug(f"Publishing to topic: {topic}")
 
+        # if we are asked to provide a response, use the reply topic of the
+        # connection the request is sent on, other reply topics are released
+        # once the last request using them is done
+        default_reply_to = reply and not message.reply_to
+
+        # a failed send is retried once on every other healthy connection
+        attempts = len(self._pool)
+        for attempt in range(attempts):
+            async with self._pool.acquire(topic) as member:
+                if default_reply_to:
+                    message.reply_to = member.reply_topic
+                reply_key = (
+                    (org, namespace, message.reply_to)
+                    if message.reply_to and not default_reply_to
+                    else None
+                )
+                if reply_key:
+                    users = member.reply_topic_users
+                    users[reply_key] = users.get(reply_key, 0) + 1
+
+                try:
+                    try:
+                        await self._send(
+                            member, org, namespace, topic, message, request_id
+                        )
+                    except Exception as e:
+                        # the request is retried, it must not fail with the connection
+                        member.pending.discard(request_id)
+                        self._pool.mark_unhealthy(member, e)
+                        if attempt == attempts - 1:
+                            raise
+                        logger.warning(f"Failed to publish to {topic}, retrying: {e}")
+                        continue
+
+                    try:
+                        yield member
+                    finally:
+                        if request_id:
+                            member.pending.discard(request_id)
+                    return
+                finally:
+                    if reply_key:
+                        await self._release_reply_topic(member, *reply_key)
+
+    async def _send(
+        self,
+        member: PooledGateway,
+        org: str,
+        namespace: str,
+        topic: str,
+        message: Message,
+        request_id: Optional[str],
+    ) -> None:
         # Set a slim route to this topic, enabling outbound messages to this topic
-        await self._gateway.set_route(org, namespace, topic)
+        await self._set_route(member, org, namespace, topic)
+
         if message.reply_to:
             logger.debug(f"Setting reply_to topic: {message.reply_to}")
             # to get responses, we need to subscribe to the reply_to topic
-            await self._gateway.subscribe(org, namespace, message.reply_to)
+            await self._subscribe_once(member, org, namespace, message.reply_to)
+
+        session_info = await self._get_session(member, org, namespace, topic, "pubsub")
+        await self._start_reader(member, session_info)
+
+        if request_id:
+            member.pending.add(request_id)
+
+        await member.gateway.publish(
+            session_info,
+            message.serialize(
+                message.wire_format or self._wire_formats.request_format(topic)
+            ),
+            org,
+            namespace,
+            topic,
+        )
 
-        session_info = await self._get_session(org, namespace, topic, "pubsub")
+    async def _start_receiving(self, member: PooledGateway) -> None:
+        """Start the receive loop of a connection once, shared by all its sessions."""
+        if member.receiving:
+            return
 
-        async with self._gateway:
-            # Send the message
-            await self._gateway.publish(
-                session_info,
-                message.serialize(),
-                org,
-                namespace,
-                topic,
-            )
+        await member.gateway.__aenter__()
+        member.receiving = True
+
+    async def _start_reader(self, member: PooledGateway, session_info) -> None:
+        """Start the task routing the responses received on a session, once."""
+        key = ("responses", session_info.id)
+        reader = member.tasks.get(key)
+        if reader is not None and not reader.done():
+            return
+
+        await self._start_receiving(member)
+        member.tasks[key] = asyncio.create_task(
+            self._read_responses(member, session_info.id)
+        )
+
+    async def _read_responses(self, member: PooledGateway, session_id: int) -> None:
+        """Hand every response received on a session to its pending request."""
+        while True:
+            try:
+                _, msg = await member.gateway.receive(session=session_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(
+                    f"Failed to receive responses on session {session_id}: {e}"
+                )
+                self._session_lost(member, session_id, e)
+                return
 
-            responses = []
-            while len(responses) < expected_responses and expected_responses > 0:
-                # Wait for a response if requested
-                session_info, msg = await self._gateway.receive(session=session_info.id)
+            try:
                 response = Message.deserialize(msg)
+            except Exception as e:
+                logger.warning(
+                    f"Dropping invalid response on session {session_id}: {e}"
+                )
+                continue
+
+            # sessions to a topic share their id across connections, so SLIM
+            # may deliver a response more than once, or to another connection
+            if not self._pending.resolve(response):
+                logger.debug(
+                    f"Dropping unknown or duplicate response to "
+                    f"{CORRELATION_HEADER} {correlation_id(response)}"
+                )
 
-                # Check if the response is from the same broadcast
-                broadcast_id = message.headers.get("broadcast_id")
-                if (
-                    broadcast_id
-                    and response.headers.get("broadcast_id") != broadcast_id
-                ):
-                    logger.warning(
-                        f"Received response with different broadcast_id: {response.headers.get('broadcast_id')}"
-                    )
-                    continue
-                responses.append(response)
+    def _session_lost(
+        self, member: PooledGateway, session_id: int, error: Exception
+    ) -> None:
+        """
+        Fail the requests waiting on a connection whose session can no longer be
+        read, and forget the session so that the next publish creates another.
+        """
+        for request_id in list(member.pending):
+            self._pending.fail(
+                request_id,
+                ConnectionError(f"SLIM session {session_id} lost: {error}"),
+            )
+        member.pending.clear()
+
+        for key, session_info in list(member.sessions.items()):
+            if session_info.id == session_id:
+                del member.sessions[key]
+
+        if self._pool is not None:
+            self._pool.mark_unhealthy(member, error)
+
+    async def _set_route(
+        self, member: PooledGateway, org: str, namespace: str, topic: str
+    ) -> None:
+        """Set a route to a topic, unless it was already set."""
+        key = (org, namespace, topic)
+        if key in member.routes:
+            return
 
-            return responses
+        await member.gateway.set_route(org, namespace, topic)
+        member.routes[key] = True
 
-    async def _get_session(self, org, namespace, topic, session_type):
+    async def _subscribe_once(
+        self, member: PooledGateway, org: str, namespace: str, topic: str
+    ) -> None:
+        """Subscribe to a topic, unless already subscribed."""
+        key = (org, namespace, topic)
+        if key in member.subscriptions:
+            return
+
+        await member.gateway.subscribe(org, namespace, topic)
+        member.subscriptions[key] = True
+
+    async def _release_reply_topic(
+        self, member: PooledGateway, org: str, namespace: str, topic: str
+    ) -> None:
+        """Unsubscribe from a reply topic once no request uses it anymore."""
+        key = (org, namespace, topic)
+        users = member.reply_topic_users.get(key, 0) - 1
+        if users > 0:
+            member.reply_topic_users[key] = users
+            return
+
+        member.reply_topic_users.pop(key, None)
+        await self._unsubscribe(member, org, namespace, topic)
+
+    async def _unsubscribe(
+        self, member: PooledGateway, org: str, namespace: str, topic: str
+    ) -> None:
+        """Unsubscribe from an ephemeral topic."""
+        member.subscriptions.pop((org, namespace, topic), None)
+        try:
+            await member.gateway.unsubscribe(org, namespace, topic)
+        except Exception as e:
+            logger.warning(f"Failed to unsubscribe from {topic}: {e}")
+
+    async def _get_session(self, member, org, namespace, topic, session_type):
         session_key = f"{org}_{namespace}_{topic}_{session_type}"
 
         # TODO: handle different session types
-        if session_key in self._sessions:
-            session_info = self._sessions[session_key]
+        if session_key in member.sessions:
             logger.debug(f"Reusing existing session: {session_key}")
-        else:
-            session_info = await self._gateway.create_session(
+            return member.sessions[session_key]
+
+        # concurrent first publishes to a topic must share one session
+        async with member.session_lock:
+            if session_key in member.sessions:
+                return member.sessions[session_key]
+
+            session_info = await member.gateway.create_session(
                 slim_bindings.PySessionConfiguration.Streaming(
                     slim_bindings.PySessionDirection.BIDIRECTIONAL,
                     topic=slim_bindings.PyAgentType(org, namespace, topic),
@@ -291,25 +711,93 @@ class SLIMTransport(BaseTransport):
                 )
             )
             logger.debug(f"Created new session: {session_key}")
-            self._sessions[session_key] = session_info
+            member.sessions[session_key] = session_info
 
         return session_info
 
-    async def _create_gateway(
-        self, org: str, namespace: str, topic: str, retries=3
-    ) -> None:
+    async def _ensure_pool(self, org: str, namespace: str, topic: str) -> None:
+        """Create the connection pool around the first gateway, once."""
+        if self._pool is not None:
+            return
+
+        # concurrent first publishes and subscribes must share one pool
+        async with self._pool_lock:
+            if self._pool is None:
+                await self._create_pool(org, namespace, topic)
+
+    async def _create_pool(self, org: str, namespace: str, topic: str) -> None:
+        if not self._gateway:
+            self._gateway = await self._create_gateway(org, namespace, topic)
+
+        # without an endpoint the given client cannot be reconnected nor pooled
+        can_connect = bool(self._endpoint)
+        if self._pool_size > 1 and not can_connect:
+            logger.warning("Ignoring pool_size, no endpoint to open connections to")
+
+        async def connect(index: int):
+            # the first connection is reconnected under the name it was created with
+            name = topic if index == 0 else uuid.uuid4().hex
+            return await self._create_gateway(org, namespace, name)
+
+        async def check(member: PooledGateway) -> None:
+            await member.gateway.subscribe(org, namespace, member.reply_topic)
+
+        pool = GatewayPool(
+            size=self._pool_size if can_connect else 1,
+            strategy=self._pool_strategy,
+            connect=connect if can_connect else None,
+            check=check,
+            on_unhealthy=self._release,
+            on_reconnect=self._restore,
+            reply_topic=self._reply_topic,
+            health_check_interval=self._health_check_interval,
+            route_cache_size=self._route_cache_size,
+            route_cache_ttl=self._route_cache_ttl,
+        )
+        await pool.start(self._gateway)
+        self._pool = pool
+
+    async def _release(self, member: PooledGateway) -> None:
+        """Fail the requests of a connection, stop its tasks and disconnect it."""
+        for request_id in member.pending:
+            self._pending.fail(
+                request_id, ConnectionError(f"SLIM connection {member.index} lost")
+            )
+
+        receiving = member.receiving
+        member.reset()
+
+        if receiving:
+            await member.gateway.__aexit__(None, None, None)
+
+        if self._endpoint:
+            try:
+                await member.gateway.disconnect(self._endpoint)
+            except Exception as e:
+                logger.warning(f"Failed to disconnect from SLIM server: {e}")
+
+    async def _restore(self, member: PooledGateway) -> None:
+        """Serve the subscribed topics again on a reconnected first connection."""
+        if member.index != 0:
+            return
+
+        self._gateway = member.gateway
+        for org, namespace, topic in self._served_topics:
+            await self._serve(member, org, namespace, topic)
+
+    async def _create_gateway(self, org: str, namespace: str, topic: str, retries=3):
         # create new gateway object
         logger.info(
             f"Creating new gateway for org: {org}, namespace: {namespace}, topic: {topic}"
         )
 
-        self._gateway = await slim_bindings.Slim.new(org, namespace, topic)
+        gateway = await slim_bindings.Slim.new(org, namespace, topic)
 
         for _ in range(retries):
             try:
                 # Attempt to connect to the SLIM server
                 # Connect to slim server
-                _ = await self._gateway.connect(
+                _ = await gateway.connect(
                     {
                         "endpoint": self._endpoint,
                         "tls": {"insecure": True},
@@ -317,7 +805,7 @@ class SLIMTransport(BaseTransport):
                 )
 
                 logger.info(f"connected to gateway @{self._endpoint}")
-                return  # Successfully connected, exit the loop
+                return gateway  # Successfully connected, exit the loop
             except Exception as e:
                 logger.error(f"Failed to connect to SLIM server: {e}")
                 await asyncio.sleep(1)
@@ -1,27 +1,117 @@
 # Copyright AGNTCY Contributors (https://github.com/agntcy)
 # SPDX-License-Identifier: Apache-2.0
 import asyncio
-from contextlib import AsyncExitStack
+from contextlib import asynccontextmanager
 
 from mcp import ClientSession
+from mcp.client.streamable_http import streamablehttp_client
 
 from agntcy_app_sdk.transports.transport import BaseTransport
 from agntcy_app_sdk.transports.streamable_http.models import StreamsContextProtocol
 from agntcy_app_sdk.common.logging_config import configure_logging, get_logger
 from agntcy_app_sdk.protocols.message import Message
-from typing import Callable, Dict, Optional
+from typing import Any, AsyncIterator, Callable, Dict, Optional
 
 configure_logging()
 logger = get_logger(__name__)
 
 
+class _PooledSession:
+    """
+    An initialized MCP client session of the pool.
+
+    The streams and session contexts are entered and exited by a task of their
+    own, as anyio requires, so that the session can be closed from any task,
+    e.g. the health check one.
+    """
+
+    def __init__(self, streams_context: StreamsContextProtocol):
+        self.session: Optional[ClientSession] = None
+        self.busy = False
+        self._streams_context = streams_context
+        self._closing = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def alive(self) -> bool:
+        return self.session is not None and not self._task.done()
+
+    async def open(self) -> None:
+        ready = asyncio.get_running_loop().create_future()
+        self._task = asyncio.create_task(self._run(ready))
+        try:
+            await asyncio.shield(ready)
+        except BaseException:
+            self._task.cancel()
+            await self.close()
+            raise
+
+    async def close(self) -> None:
+        self._closing.set()
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def _run(self, ready: asyncio.Future) -> None:
+        try:
+            async with self._streams_context as (read_stream, write_stream, _):
+                async with ClientSession(read_stream, write_stream) as session:
+                    await session.initialize()
+                    self.session = session
+                    ready.set_result(None)
+                    await self._closing.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.warning(f"MCP session closed unexpectedly: {e}")
+        finally:
+            self.session = None
+            if not ready.done():
+                ready.set_exception(ConnectionError("MCP session closed"))
+
+
 class StreamableHTTPTransport(BaseTransport):
-    def __init__(self, endpoint: str):
+    """
+    A pool of MCP client sessions with a Streamable HTTP server.
+
+    Sessions are initialized once and reused: callers acquire one for each
+    call, so that concurrent calls neither share a session nor pay for an
+    initialize() handshake. Idle sessions are pinged periodically, the ones
+    failing being replaced.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        pool_size: int = 1,
+        warm_up: bool = True,
+        health_check_interval: Optional[float] = 30.0,
+        acquire_timeout: Optional[float] = None,
+    ):
+        """
+        :param endpoint: The Streamable HTTP server endpoint.
+        :param pool_size: Maximum number of sessions.
+        :param warm_up: Open all the sessions on connect(), rather than when
+            concurrent calls first need them.
+        :param health_check_interval: Seconds between pings of the idle
+            sessions, None to not check them.
+        :param acquire_timeout: Seconds to wait for a session when all are
+            busy, None to wait forever.
+        """
+        if pool_size < 1:
+            raise ValueError(f"pool_size must be at least 1, got {pool_size}")
+
         self.endpoint: str = endpoint if endpoint else None
-        self.session: Optional[ClientSession] = None
-        self._exit_stack = AsyncExitStack()
-        self._session_context: Optional[AsyncExitStack] = None
-        self._streams_context: Optional[StreamsContextProtocol] = None
+        self.pool_size = pool_size
+        self.warm_up = warm_up
+        self.health_check_interval = health_check_interval
+        self.acquire_timeout = acquire_timeout
+
+        self._sessions: list[_PooledSession] = []
+        self._opening = 0
+        self._available = asyncio.Condition()
+        self._health_task: Optional[asyncio.Task] = None
+        self._connected = False
 
     @classmethod
     def from_client(cls, client):
@@ -40,39 +130,208 @@ class StreamableHTTPTransport(BaseTransport):
     def type(self) -> str:
         return "StreamableHTTPTransport"
 
+    @property
+    def session(self) -> Optional[ClientSession]:
+        """
+        A session of the pool, shared with the other callers using this
+        property rather than acquire().
+        """
+        for pooled in self._sessions:
+            if pooled.alive:
+                return pooled.session
+        return None
+
     def set_callback(self, handler: Callable[[Message], asyncio.Future]) -> None:
         """Set the message handler function."""
         raise NotImplementedError(
             "Set callback method is not implemented for Streamable HTTP transport"
         )
 
-    async def connect(self, streams_context: StreamsContextProtocol):
-        """Connect to the Streamable HTTP server."""
-        if self.session is not None:
+    async def connect(self, streams_context: Optional[StreamsContextProtocol] = None):
+        """
+        Connect to the Streamable HTTP server, opening the sessions of the pool
+        if warm_up is set, the first one otherwise.
+
+        :param streams_context: Optional streams context of the first session,
+            the others being opened with streamablehttp_client().
+        """
+        if self._connected:
             logger.info("Already connected to Streamable HTTP server.")
             return
-        self._streams_context = streams_context
-        read_stream, write_stream, _ = await self._streams_context.__aenter__()
-        self._session_context = ClientSession(read_stream, write_stream)
-        self.session = await self._session_context.__aenter__()
-        await self.session.initialize()
-        logger.info(f"Connected to Streamable HTTP server at {self.endpoint}")
+        self._connected = True
+
+        try:
+            await self._add_session(streams_context)
+            if self.warm_up and self.pool_size > 1:
+                await asyncio.gather(
+                    *(self._add_session() for _ in range(self.pool_size - 1))
+                )
+        except BaseException:
+            await self.close()
+            raise
+
+        if self.health_check_interval is not None:
+            self._health_task = asyncio.create_task(self._check_health())
+        logger.info(
+            f"Connected to Streamable HTTP server at {self.endpoint} "
+            f"with {len(self._sessions)} session(s)"
+        )
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[ClientSession]:
+        """
+        Take a session of the pool for the duration of a call, opening a
+        new one if all are busy and the pool is not full.
+
+        :raises TimeoutError: If no session was available in acquire_timeout.
+        """
+        pooled = await asyncio.wait_for(self._take_session(), self.acquire_timeout)
+        try:
+            yield pooled.session
+        finally:
+            await self._release(pooled)
+
+    async def call_tool(
+        self, name: str, arguments: dict[str, Any] | None = None, **kwargs
+    ):
+        """Call a tool with a session acquired from the pool."""
+        async with self.acquire() as session:
+            return await session.call_tool(name, arguments, **kwargs)
+
+    async def list_tools(self, cursor: str | None = None):
+        """List the tools with a session acquired from the pool."""
+        async with self.acquire() as session:
+            return await session.list_tools(cursor)
 
     # Duplicate method to maintain compatibility with MCP documentation
     async def cleanup(self) -> None:
-        """Properly clean up the session and streams"""
-        if self._session_context:
-            await self._session_context.__aexit__(None, None, None)
-        if self._streams_context:
-            await self._streams_context.__aexit__(None, None, None)
+        """Properly clean up the sessions and streams"""
+        await self.close()
 
     # Duplicate method to maintain compatibility with BaseTransport interface
     async def close(self) -> None:
-        """Properly clean up the session and streams"""
-        if self._session_context:
-            await self._session_context.__aexit__(None, None, None)
-        if self._streams_context:
-            await self._streams_context.__aexit__(None, None, None)
+        """Properly clean up the sessions and streams"""
+        self._connected = False
+        if self._health_task is not None:
+            self._health_task.cancel()
+            await asyncio.gather(self._health_task, return_exceptions=True)
+            self._health_task = None
+
+        sessions, self._sessions = self._sessions, []
+        await asyncio.gather(*(pooled.close() for pooled in sessions))
+        async with self._available:
+            self._available.notify_all()
+
+    async def _add_session(
+        self, streams_context: Optional[StreamsContextProtocol] = None
+    ) -> _PooledSession:
+        self._opening += 1
+        try:
+            pooled = await self._open_session(streams_context)
+        finally:
+            self._opening -= 1
+
+        if not self._connected:
+            # closed while opening
+            await pooled.close()
+            raise ConnectionError("Streamable HTTP transport is closed")
+        self._sessions.append(pooled)
+        return pooled
+
+    async def _open_session(
+        self, streams_context: Optional[StreamsContextProtocol] = None
+    ) -> _PooledSession:
+        if streams_context is None:
+            streams_context = streamablehttp_client(url=self.endpoint)
+        pooled = _PooledSession(streams_context)
+        await pooled.open()
+        logger.debug(f"Opened MCP session with {self.endpoint}")
+        return pooled
+
+    async def _take_session(self) -> _PooledSession:
+        async with self._available:
+            while True:
+                if not self._connected:
+                    raise ConnectionError("Streamable HTTP transport is not connected")
+
+                for pooled in list(self._sessions):
+                    if pooled.busy:
+                        continue
+                    if pooled.alive:
+                        pooled.busy = True
+                        return pooled
+                    # its task is over, there is nothing left to close
+                    self._sessions.remove(pooled)
+
+                if len(self._sessions) + self._opening < self.pool_size:
+                    break
+                await self._available.wait()
+
+        try:
+            pooled = await self._add_session()
+        except BaseException:
+            # let a waiter try in place of this caller
+            async with self._available:
+                self._available.notify()
+            raise
+        pooled.busy = True
+        return pooled
+
+    async def _release(self, pooled: _PooledSession) -> None:
+        pooled.busy = False
+        if not pooled.alive:
+            await self._discard(pooled)
+        async with self._available:
+            self._available.notify()
+
+    async def _discard(self, pooled: _PooledSession) -> None:
+        if pooled in self._sessions:
+            self._sessions.remove(pooled)
+        await pooled.close()
+        logger.info(f"Discarded MCP session with {self.endpoint}")
+
+    async def _check_health(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+
+            for pooled in list(self._sessions):
+                if pooled.busy:
+                    continue
+                if not pooled.alive:
+                    await self._discard(pooled)
+                    continue
+                pooled.busy = True
+                try:
+                    await asyncio.wait_for(
+                        pooled.session.send_ping(), self.health_check_interval
+                    )
+                    healthy = True
+                except Exception as e:
+                    logger.warning(
+                        f"MCP session with {self.endpoint} failed its ping: {e!r}"
+                    )
+                    healthy = False
+                finally:
+                    pooled.busy = False
+
+                if not healthy:
+                    await self._discard(pooled)
+                async with self._available:
+                    self._available.notify()
+
+            if not self.warm_up:
+                continue
+            missing = self.pool_size - len(self._sessions) - self._opening
+            for _ in range(max(missing, 0)):
+                try:
+                    await self._add_session()
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to reopen MCP session with {self.endpoint}: {e}"
+                    )
+                    break
+            async with self._available:
+                self._available.notify_all()
 
     async def publish(
         self,
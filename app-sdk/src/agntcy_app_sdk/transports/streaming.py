@@ -0,0 +1,139 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Any, AsyncIterable, AsyncIterator, Optional
+import asyncio
+
+from agntcy_app_sdk.common.logging_config import configure_logging, get_logger
+from agntcy_app_sdk.protocols.message import Message
+
+configure_logging()
+logger = get_logger(__name__)
+
+# Request header telling the responder that the response may be streamed
+STREAM_HEADER = "stream"
+# Headers of the chunks of a streamed response: their position in the stream
+# and, on the last chunk, the end of the stream
+SEQUENCE_HEADER = "stream_seq"
+END_HEADER = "stream_end"
+
+# Message type of the chunk ending a stream
+STREAM_END_TYPE = "StreamEnd"
+# Message type of an error response, ending a stream as well
+ERROR_TYPE = "error"
+
+_END = object()
+
+
+def accepts_stream(message: Message) -> bool:
+    """Whether the sender of a request accepts a streamed response."""
+    return bool(message.headers) and message.headers.get(STREAM_HEADER) == "1"
+
+
+def is_stream(response: Any) -> bool:
+    """Whether a handler returned a stream of messages rather than one message."""
+    return hasattr(response, "__aiter__")
+
+
+def sequence(message: Message) -> Optional[int]:
+    """Return the position of a chunk in its stream, None if it is not a chunk."""
+    if not message.headers or SEQUENCE_HEADER not in message.headers:
+        return None
+    return int(message.headers[SEQUENCE_HEADER])
+
+
+async def frame_stream(chunks: AsyncIterable[Message]) -> AsyncIterator[Message]:
+    """
+    Number the chunks of a streamed response and end it with a marker chunk, or
+    with an error chunk if producing the chunks fails.
+    """
+    seq = 0
+    try:
+        async for chunk in chunks:
+            chunk.headers = chunk.headers or {}
+            chunk.headers[SEQUENCE_HEADER] = str(seq)
+            seq += 1
+            yield chunk
+        end = Message(type=STREAM_END_TYPE, payload=b"")
+    except Exception as e:
+        logger.error(f"Error streaming response: {e}")
+        end = Message(type=ERROR_TYPE, payload=str(e))
+
+    end.headers = {SEQUENCE_HEADER: str(seq), END_HEADER: "1"}
+    yield end
+
+
+class StreamCollector:
+    """
+    Gathers the chunks of one streamed response and hands them out in order.
+
+    Chunks that arrive out of order are held back until their predecessors
+    arrived, and chunks arriving more than once are dropped. A response that
+    was not streamed, e.g. by a responder that does not support streaming, is
+    handed out as a stream of a single chunk.
+    """
+
+    def __init__(self):
+        self._next = 0
+        self._held: dict[int, Message] = {}
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._done = False
+
+    def done(self) -> bool:
+        return self._done
+
+    def add(self, message: Message) -> bool:
+        """Record a chunk, return False if the collector does not need it."""
+        if self._done:
+            return False
+
+        seq = sequence(message)
+        if seq is None:
+            self._deliver(message)
+            self._finish()
+            return True
+
+        if seq < self._next or seq in self._held:
+            return False
+
+        self._held[seq] = message
+        while not self._done and self._next in self._held:
+            chunk = self._held.pop(self._next)
+            self._next += 1
+            self._deliver(chunk)
+            if chunk.headers.get(END_HEADER) == "1":
+                self._finish()
+        return True
+
+    def fail(self, exc: BaseException) -> None:
+        """Fail the stream, e.g. because the transport is closing."""
+        if not self._done:
+            self._done = True
+            self._queue.put_nowait(exc)
+
+    async def iterate(self, timeout: Optional[float] = None) -> AsyncIterator[Message]:
+        """
+        Yield the chunks in order until the end of the stream.
+
+        :param timeout: Seconds to wait for the next chunk, None to wait forever.
+        """
+        while True:
+            item = await asyncio.wait_for(self._queue.get(), timeout=timeout)
+            if item is _END:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+
+    def _deliver(self, chunk: Message) -> None:
+        if chunk.type == ERROR_TYPE:
+            payload = chunk.payload
+            if isinstance(payload, bytes):
+                payload = payload.decode("utf-8", errors="replace")
+            self._queue.put_nowait(RuntimeError(f"Streamed response failed: {payload}"))
+        elif chunk.type != STREAM_END_TYPE:
+            self._queue.put_nowait(chunk)
+
+    def _finish(self) -> None:
+        self._done = True
+        self._queue.put_nowait(_END)
@@ -3,9 +3,10 @@
 
 from abc import ABC, abstractmethod
 from agntcy_app_sdk.protocols.message import Message
-from typing import Callable, Optional
+from typing import AsyncIterator, Callable, Optional
 from typing import Any, TypeVar, Type
 import asyncio
+import uuid
 
 T = TypeVar("T", bound="BaseTransport")
 
@@ -17,6 +18,15 @@ class BaseTransport(ABC):
     such as AGP, NATS, MQTT, etc.
     """
 
+    @property
+    def sender_id(self) -> str:
+        """Identity of this transport instance, set on the responses it sends."""
+        try:
+            return self._sender_id
+        except AttributeError:
+            self._sender_id = uuid.uuid4().hex
+            return self._sender_id
+
     @classmethod
     @abstractmethod
     def from_client(cls: Type[T], client: Any) -> T:
@@ -69,3 +79,41 @@ class BaseTransport(ABC):
     ) -> None:
         """Broadcast a message to all subscribers of a topic and wait for responses."""
         pass
+
+    def request_stream(
+        self,
+        topic: str,
+        message: Message,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[Message]:
+        """
+        Send a request and yield the chunks of its streamed response in order.
+        A response that is not streamed is yielded as a single chunk.
+
+        :param timeout: Seconds to wait for each chunk, None to wait forever.
+        """
+        raise NotImplementedError(f"{self.type()} transport does not support streaming")
+
+    def broadcast_stream(
+        self,
+        topic: str,
+        message: Message,
+        expected_responses: int = 1,
+        timeout: Optional[float] = 30.0,
+        quorum: Optional[int] = None,
+    ) -> AsyncIterator[Message]:
+        """
+        Broadcast a message to all subscribers of a topic and yield the responses
+        as they arrive, until expected_responses were received or the deadline
+        passed.
+
+        :param expected_responses: Number of responses after which to stop, e.g.
+            1 for the first responder only.
+        :param timeout: Seconds after which to stop waiting for responses, the
+            ones received by then being the result, None to wait forever.
+        :param quorum: Minimum number of responses, TimeoutError being raised
+            if fewer were received by the deadline.
+        """
+        raise NotImplementedError(
+            f"{self.type()} transport does not support streamed broadcasts"
+        )
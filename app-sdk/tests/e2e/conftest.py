@@ -18,7 +18,7 @@ TRANSPORT_CONFIGS = {
 def run_server():
     procs = []
 
-    def _run(transport, endpoint, version="1.0.0"):
+    def _run(transport, endpoint, version="1.0.0", jetstream=False):
         cmd = [
             "uv",
             "run",
@@ -31,6 +31,8 @@ def run_server():
             "--version",
             version,
         ]
+        if jetstream:
+            cmd.append("--jetstream")
 
         proc = subprocess.Popen(cmd, preexec_fn=os.setsid)
 
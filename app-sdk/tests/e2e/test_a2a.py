@@ -5,8 +5,10 @@ from agntcy_app_sdk.factory import AgntcyFactory
 from a2a.types import (
     MessageSendParams,
     SendMessageRequest,
+    SendStreamingMessageRequest,
 )
 from typing import Any
+import asyncio
 import uuid
 import pytest
 from tests.e2e.conftest import TRANSPORT_CONFIGS
@@ -165,3 +167,119 @@ async def test_broadcast(run_server, transport):
         await transport_instance.close()
 
     print(f"=== ✅ Test passed for transport: {transport} ===\n")
+
+
+@pytest.mark.parametrize(
+    "transport", list(TRANSPORT_CONFIGS.keys()), ids=lambda val: val
+)
+@pytest.mark.asyncio
+async def test_streaming(run_server, transport):
+    """
+    End-to-end test for the A2A factory client streaming over different transports.
+    """
+    endpoint = TRANSPORT_CONFIGS[transport]
+
+    print(
+        f"\n--- Starting test: test_streaming | Transport: {transport} | Endpoint: {endpoint} ---"
+    )
+
+    print("[setup] Launching test server...")
+    run_server(transport, endpoint)
+
+    print("[setup] Initializing client factory and transport...")
+    factory = AgntcyFactory(enable_tracing=True)
+    transport_instance = factory.create_transport(transport, endpoint=endpoint)
+
+    print("[test] Creating A2A client...")
+    client = await factory.create_client(
+        "A2A",
+        agent_url=endpoint,
+        agent_topic="Hello_World_Agent_1.0.0",  # Used if transport is provided
+        transport=transport_instance,
+    )
+    assert client is not None, "Client was not created"
+
+    print("[test] Sending streaming test message...")
+    send_message_payload: dict[str, Any] = {
+        "message": {
+            "role": "user",
+            "parts": [{"type": "text", "text": "how much is 10 USD in INR?"}],
+            "messageId": "1234",
+        },
+    }
+    request = SendStreamingMessageRequest(
+        id=str(uuid.uuid4()), params=MessageSendParams(**send_message_payload)
+    )
+
+    events = [
+        event.model_dump(mode="json", exclude_none=True)
+        async for event in client.send_message_streaming(request)
+    ]
+
+    print(f"[debug] Streamed events: {events}")
+
+    assert len(events) == 1
+    assert events[0]["result"]["kind"] == "message"
+    assert events[0]["result"]["parts"][0]["text"] == "Hello World"
+
+    if transport_instance:
+        print("[teardown] Closing transport...")
+        await transport_instance.close()
+
+    print(f"=== ✅ Test passed for transport: {transport} ===\n")
+
+
+@pytest.mark.asyncio
+async def test_durable_delivery(run_server):
+    """
+    End-to-end test for the NATS JetStream mode: a request sent while the agent
+    is down is delivered once it is running.
+    """
+    endpoint = TRANSPORT_CONFIGS["NATS"]
+
+    print(
+        f"\n--- Starting test: test_durable_delivery | Transport: NATS | Endpoint: {endpoint} ---"
+    )
+
+    print("[setup] Initializing client factory and transport...")
+    factory = AgntcyFactory(enable_tracing=True)
+    transport_instance = factory.create_transport(
+        "NATS", endpoint=endpoint, jetstream=True
+    )
+
+    async def send():
+        client = await factory.create_client(
+            "A2A",
+            agent_url=endpoint,
+            agent_topic="Hello_World_Agent_1.0.0",
+            transport=transport_instance,
+        )
+        send_message_payload: dict[str, Any] = {
+            "message": {
+                "role": "user",
+                "parts": [{"type": "text", "text": "how much is 10 USD in INR?"}],
+                "messageId": "1234",
+            },
+        }
+        request = SendMessageRequest(
+            id=str(uuid.uuid4()), params=MessageSendParams(**send_message_payload)
+        )
+        return await client.send_message(request)
+
+    print("[test] Sending test message before the server runs...")
+    sending = asyncio.create_task(send())
+    await asyncio.sleep(2)
+    assert not sending.done(), "Request was answered without a server"
+
+    print("[setup] Launching test server...")
+    run_server("NATS", endpoint, jetstream=True)
+
+    response = await asyncio.wait_for(sending, timeout=30)
+    response = response.model_dump(mode="json", exclude_none=True)
+    print(f"[debug] Raw response: {response}")
+    assert response["result"]["parts"][0]["text"] == "Hello World"
+
+    print("[teardown] Closing transport...")
+    await transport_instance.close()
+
+    print("=== ✅ Test passed for transport: NATS ===\n")
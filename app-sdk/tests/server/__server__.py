@@ -21,7 +21,13 @@ from agntcy_app_sdk.factory import AgntcyFactory
 factory = AgntcyFactory(enable_tracing=True)
 
 
-async def main(transport_type: str, endpoint: str, version="1.0.0", block: bool = True):
+async def main(
+    transport_type: str,
+    endpoint: str,
+    version="1.0.0",
+    block: bool = True,
+    jetstream: bool = False,
+):
     """
     This is a simple example of how to create a bridge between an A2A server and a transport.
     It creates a Hello World agent and sets up the transport to communicate with it.
@@ -60,7 +66,10 @@ async def main(transport_type: str, endpoint: str, version="1.0.0", block: bool
         userver = Server(config)
         await userver.serve()
     else:
-        transport = factory.create_transport(transport_type, endpoint=endpoint)
+        kwargs = {"jetstream": True} if jetstream else {}
+        transport = factory.create_transport(
+            transport_type, endpoint=endpoint, **kwargs
+        )
         bridge = factory.create_bridge(server, transport=transport)
         await bridge.start(blocking=block)
 
@@ -96,6 +105,14 @@ if __name__ == "__main__":
         help="Run the server in non-blocking mode (default: blocking)",
     )
 
+    parser.add_argument(
+        "--jetstream",
+        action="store_true",
+        help="Receive messages through a JetStream durable consumer (NATS only)",
+    )
+
     args = parser.parse_args()
 
-    asyncio.run(main(args.transport, args.endpoint, args.version, args.block))
+    asyncio.run(
+        main(args.transport, args.endpoint, args.version, args.block, args.jetstream)
+    )
@@ -0,0 +1,108 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+
+import pytest
+
+from agntcy_app_sdk.protocols.a2a.protocol import A2AProtocol
+from agntcy_app_sdk.protocols.message import Message
+from agntcy_app_sdk.transports.streaming import STREAM_HEADER, is_stream
+
+pytest_plugins = "pytest_asyncio"
+
+
+def _protocol(content_type: bytes, chunks: list[bytes]) -> A2AProtocol:
+    async def app(scope, receive, send):
+        request = await receive()
+        assert scope["path"] == "/"
+        assert request["body"] == b'{"id": 1}'
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", content_type)],
+            }
+        )
+        for chunk in chunks:
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    protocol = A2AProtocol()
+    protocol._app = app
+    return protocol
+
+
+@pytest.mark.asyncio
+async def test_json_response_is_passed_through():
+    body = b'{"result":{"kind":"message"},"id":1}'
+    protocol = _protocol(b"application/json", [body])
+
+    response = await protocol.handle_incoming_request(
+        Message(type="A2ARequest", payload=b'{"id": 1}', route_path="", method="POST")
+    )
+
+    assert response.payload is body
+
+
+@pytest.mark.asyncio
+async def test_unchanged_get_response_is_not_sent_again():
+    body = b'{"name":"agent"}'
+    protocol = _protocol(b"application/json", [body])
+
+    def request(headers):
+        return Message(
+            type="A2ARequest",
+            payload=b'{"id": 1}',
+            route_path="/",
+            method="GET",
+            headers=headers,
+        )
+
+    response = await protocol.handle_incoming_request(request({}))
+    etag = response.headers["etag"]
+    assert response.payload == body
+
+    response = await protocol.handle_incoming_request(request({"if-none-match": etag}))
+    assert response.status_code == 304
+    assert response.payload == b""
+
+
+@pytest.mark.asyncio
+async def test_chunked_response_is_joined():
+    protocol = _protocol(b"text/plain", [b'{"a":', b" 1}"])
+
+    response = await protocol.handle_incoming_request(
+        Message(type="A2ARequest", payload=b'{"id": 1}', route_path="/", method="POST")
+    )
+
+    assert json.loads(response.payload) == {"a": 1}
+
+
+@pytest.mark.asyncio
+async def test_event_stream_is_streamed_when_accepted():
+    events = [b'data: {"n": 1}\r\n\r\n', b": ping\r\n\r\ndata: {", b'"n": 2}\r\n\r\n']
+    protocol = _protocol(b"text/event-stream", events)
+
+    response = await protocol.handle_incoming_request(
+        Message(
+            type="A2ARequest",
+            payload=b'{"id": 1}',
+            route_path="/",
+            method="POST",
+            headers={STREAM_HEADER: "1"},
+        )
+    )
+
+    assert is_stream(response)
+    assert [json.loads(chunk.payload) async for chunk in response] == [
+        {"n": 1},
+        {"n": 2},
+    ]
+
+
+def test_context_id():
+    payload = json.dumps({"params": {"message": {"contextId": "ctx"}}})
+
+    assert A2AProtocol.context_id(Message(type="A2ARequest", payload=payload)) == "ctx"
+    assert A2AProtocol.context_id(Message(type="A2ARequest", payload=b"{}")) is None
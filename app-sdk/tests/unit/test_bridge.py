@@ -0,0 +1,167 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+
+import pytest
+
+from agntcy_app_sdk.bridge import MessageBridge
+from agntcy_app_sdk.protocols.message import WIRE_FORMATS_HEADER, Message
+from agntcy_app_sdk.transports.pending import CORRELATION_HEADER, SENDER_HEADER
+
+pytest_plugins = "pytest_asyncio"
+
+
+class FakeTransport:
+    sender_id = "fake"
+
+    def __init__(self):
+        self.callback = None
+        self.published = []
+        self.subscriptions = []
+
+    def set_callback(self, callback):
+        self.callback = callback
+
+    async def subscribe(self, topic, queue_group=None):
+        self.subscriptions.append((topic, queue_group))
+
+    async def publish(self, topic, message, respond=False):
+        self.published.append((topic, message))
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded():
+    running = 0
+    peak = 0
+    release = asyncio.Event()
+
+    async def handler(message):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await release.wait()
+        running -= 1
+        return Message(type="response", payload=message.payload)
+
+    transport = FakeTransport()
+    bridge = MessageBridge(transport, handler, "topic", max_concurrency=3)
+    await bridge.start()
+
+    calls = [
+        asyncio.create_task(
+            transport.callback(Message(type="request", payload=bytes([i])))
+        )
+        for i in range(10)
+    ]
+    await asyncio.sleep(0.05)
+    assert peak == 3
+
+    release.set()
+    responses = await asyncio.gather(*calls)
+    assert [r.payload for r in responses] == [bytes([i]) for i in range(10)]
+
+    await bridge.stop()
+
+
+@pytest.mark.asyncio
+async def test_stop_drains_queued_messages():
+    handled = []
+
+    async def handler(message):
+        await asyncio.sleep(0.01)
+        handled.append(message.payload)
+        return Message(type="response", payload=message.payload)
+
+    transport = FakeTransport()
+    bridge = MessageBridge(transport, handler, "topic", max_concurrency=1)
+    await bridge.start()
+
+    # replies are sent by the bridge, the transport is released once queued
+    for i in range(5):
+        message = Message(
+            type="request",
+            payload=bytes([i]),
+            reply_to="inbox",
+            headers={CORRELATION_HEADER: str(i)},
+        )
+        assert await transport.callback(message) is None
+
+    loop = asyncio.create_task(bridge.loop_forever())
+    await bridge.stop()
+    await asyncio.wait_for(loop, timeout=1)
+
+    assert handled == [bytes([i]) for i in range(5)]
+    assert [topic for topic, _ in transport.published] == ["inbox"] * 5
+    # replies are correlated to their request and tell who sent them, and the
+    # wire formats it understands
+    assert [m.headers for _, m in transport.published] == [
+        {
+            CORRELATION_HEADER: str(i),
+            SENDER_HEADER: "fake",
+            WIRE_FORMATS_HEADER: "json,binary",
+        }
+        for i in range(5)
+    ]
+
+    # messages arriving once stopped are answered with an error
+    await transport.callback(Message(type="request", payload=b"late", reply_to="inbox"))
+    assert transport.published[-1][1].type == "error"
+
+
+@pytest.mark.asyncio
+async def test_queue_group_subscription():
+    async def handler(message):
+        return Message(type="response", payload=message.payload)
+
+    transport = FakeTransport()
+    bridge = MessageBridge(transport, handler, "topic", queue_group="replicas")
+    await bridge.start()
+    assert transport.subscriptions == [("topic", "replicas")]
+    await bridge.stop()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_loop_drains_then_propagates():
+    release = asyncio.Event()
+
+    async def handler(message):
+        await release.wait()
+        return Message(type="response", payload=message.payload)
+
+    transport = FakeTransport()
+    bridge = MessageBridge(transport, handler, "topic", max_concurrency=1)
+    await bridge.start()
+    message = Message(type="request", payload=b"stuck", reply_to="inbox")
+    await transport.callback(message)
+
+    loop = asyncio.create_task(bridge.loop_forever(drain_timeout=0.1))
+    await asyncio.sleep(0)
+    loop.cancel()
+
+    # the drain is bounded and the task ends cancelled
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(loop, timeout=1)
+    assert loop.cancelled()
+    assert not bridge._workers
+
+
+@pytest.mark.asyncio
+async def test_stop_timeout_fails_messages_in_flight():
+    async def handler(message):
+        await asyncio.sleep(10)
+        return Message(type="response", payload=message.payload)
+
+    transport = FakeTransport()
+    bridge = MessageBridge(transport, handler, "topic", max_concurrency=1)
+    await bridge.start()
+
+    # the transport waits for the response of messages without reply topic
+    call = asyncio.create_task(
+        transport.callback(Message(type="request", payload=b"slow"))
+    )
+    await asyncio.sleep(0.01)
+    await bridge.stop(timeout=0.05)
+
+    with pytest.raises(RuntimeError, match="Message bridge stopped"):
+        await asyncio.wait_for(call, timeout=1)
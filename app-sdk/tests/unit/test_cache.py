@@ -0,0 +1,60 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import time
+
+import pytest
+
+from agntcy_app_sdk.common.cache import TTLCache
+
+
+def test_lru_eviction():
+    evicted = []
+    cache = TTLCache(maxsize=2, on_evict=lambda k, v: evicted.append(k))
+
+    cache["a"] = 1
+    cache["b"] = 2
+    # touch "a" so that "b" becomes the least recently used entry
+    assert cache.get("a") == 1
+    cache["c"] = 3
+
+    assert "b" not in cache
+    assert "a" in cache and "c" in cache
+    assert evicted == ["b"]
+
+
+def test_ttl_expiry(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+
+    cache = TTLCache(ttl=10)
+    cache["a"] = 1
+    cache.set("b", 2, ttl=None)
+
+    now[0] += 11
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert len(cache) == 1
+
+
+def test_expire_and_pop(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+
+    evicted = []
+    cache = TTLCache(ttl=1, on_evict=lambda k, v: evicted.append(k))
+    cache["a"] = 1
+    cache["b"] = 2
+
+    assert cache.pop("a") == 1
+    assert cache.pop("a", "missing") == "missing"
+
+    now[0] += 2
+    assert cache.expire() == ["b"]
+    assert evicted == ["b"]
+    assert len(cache) == 0
+
+
+def test_invalid_size():
+    with pytest.raises(ValueError):
+        TTLCache(maxsize=0)
@@ -0,0 +1,84 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from agntcy_app_sdk.protocols.a2a.card_cache import AgentCardCache, card_etag
+
+pytest_plugins = "pytest_asyncio"
+
+CARD = json.dumps(
+    {
+        "name": "Hello World Agent",
+        "description": "Just a hello world agent",
+        "url": "http://localhost:9999/",
+        "version": "1.0.0",
+        "defaultInputModes": ["text"],
+        "defaultOutputModes": ["text"],
+        "capabilities": {},
+        "skills": [],
+    }
+).encode()
+
+
+class Loader:
+    def __init__(self, revalidates: bool = True):
+        self.revalidates = revalidates
+        self.etags = []
+
+    async def __call__(self, etag):
+        self.etags.append(etag)
+        await asyncio.sleep(0)
+        if self.revalidates and etag == card_etag(CARD):
+            return None, etag
+        return CARD, card_etag(CARD) if self.revalidates else None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_fetches_share_one_load():
+    cache = AgentCardCache()
+    load = Loader()
+
+    cards = await asyncio.gather(*(cache.fetch("agent", load) for _ in range(10)))
+
+    assert load.etags == [None]
+    assert all(card is cards[0] for card in cards)
+    assert cards[0].name == "Hello World Agent"
+
+    # fresh, served without loading
+    assert await cache.fetch("agent", load) is cards[0]
+    assert load.etags == [None]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("revalidates", [True, False])
+async def test_stale_card_is_revalidated(monkeypatch, revalidates):
+    now = [100.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    cache = AgentCardCache(ttl=10)
+    load = Loader(revalidates)
+
+    card = await cache.fetch("agent", load)
+    now[0] += 11
+
+    # unchanged, the cached card is kept
+    assert await cache.fetch("agent", load) is card
+    assert load.etags == [None, card_etag(CARD)]
+    assert cache.get("agent").fresh()
+
+
+@pytest.mark.asyncio
+async def test_cache_is_persisted(tmp_path):
+    path = str(tmp_path / "cards.json")
+    await AgentCardCache(path=path).fetch("agent", Loader())
+
+    cache = AgentCardCache(path=path)
+    load = Loader()
+    card = await cache.fetch("agent", load)
+
+    assert card.name == "Hello World Agent"
+    assert load.etags == []
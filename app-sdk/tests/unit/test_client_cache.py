@@ -0,0 +1,65 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+
+import pytest
+
+from agntcy_app_sdk.common.client_cache import ClientCache
+
+pytest_plugins = "pytest_asyncio"
+
+
+class Client:
+    created = 0
+
+    def __init__(self):
+        Client.created += 1
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+async def _create():
+    await asyncio.sleep(0)
+    return Client()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_acquires_share_one_client():
+    Client.created = 0
+    cache = ClientCache()
+
+    clients = await asyncio.gather(*(cache.acquire("a", _create) for _ in range(5)))
+
+    assert Client.created == 1
+    assert all(client is clients[0] for client in clients)
+    assert await cache.acquire("b", _create) is not clients[0]
+
+    await cache.close()
+    assert clients[0].closed
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_idle_client_is_closed():
+    cache = ClientCache(idle_timeout=0.01)
+
+    client = await cache.acquire("a", _create)
+    assert await cache.acquire("a", _create) is client
+    cache.release(client)
+    await asyncio.sleep(0.02)
+    # still in use by the first caller
+    assert "a" in cache and not client.closed
+
+    cache.release(client)
+    # acquired again before the timeout, it is kept
+    assert await cache.acquire("a", _create) is client
+    await asyncio.sleep(0.02)
+    assert not client.closed
+
+    cache.release(client)
+    await asyncio.sleep(0.02)
+    assert "a" not in cache
+    assert client.closed
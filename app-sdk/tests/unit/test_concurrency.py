@@ -0,0 +1,76 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+
+import pytest
+
+from agntcy_app_sdk.common.concurrency import KeyedTaskRunner
+
+pytest_plugins = "pytest_asyncio"
+
+
+@pytest.mark.asyncio
+async def test_slow_task_does_not_block_other_keys():
+    done = []
+    release = asyncio.Event()
+
+    async def slow():
+        await release.wait()
+        done.append("slow")
+
+    async def fast(name):
+        done.append(name)
+
+    runner = KeyedTaskRunner(max_concurrency=4)
+    await runner.submit(slow, key="a")
+    await runner.submit(lambda: fast("b"), key="b")
+    await runner.submit(lambda: fast("none"))
+    # same key as the slow task, must wait for it
+    await runner.submit(lambda: fast("a"), key="a")
+
+    await asyncio.sleep(0.01)
+    assert sorted(done) == ["b", "none"]
+
+    release.set()
+    await runner.join()
+    assert done[-2:] == ["slow", "a"]
+    assert len(runner) == 0
+
+
+@pytest.mark.asyncio
+async def test_submit_waits_when_bound_reached():
+    release = asyncio.Event()
+
+    async def blocked():
+        await release.wait()
+
+    runner = KeyedTaskRunner(max_concurrency=2)
+    await runner.submit(blocked)
+    await runner.submit(blocked)
+
+    third = asyncio.create_task(runner.submit(blocked))
+    await asyncio.sleep(0.01)
+    assert not third.done()
+
+    release.set()
+    await asyncio.wait_for(third, timeout=1)
+    await runner.join()
+
+
+@pytest.mark.asyncio
+async def test_errors_do_not_break_ordering():
+    done = []
+
+    async def failing():
+        raise RuntimeError("boom")
+
+    async def ok():
+        done.append("ok")
+
+    runner = KeyedTaskRunner(max_concurrency=1)
+    await runner.submit(failing, key="k")
+    await runner.submit(ok, key="k")
+    await runner.join()
+
+    assert done == ["ok"]
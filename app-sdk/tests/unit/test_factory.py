@@ -1,2 +1,55 @@
 # Copyright AGNTCY Contributors (https://github.com/agntcy)
 # SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from agntcy_app_sdk.factory import AgntcyFactory
+
+pytest_plugins = "pytest_asyncio"
+
+
+@pytest.mark.asyncio
+async def test_http_client_is_shared_until_closed():
+    factory = AgntcyFactory()
+
+    client = factory.http_client
+    assert factory.http_client is client
+
+    await factory.close()
+    assert client.is_closed
+    assert factory.http_client is not client
+    await factory.close()
+
+
+class _Protocol:
+    async def create_client(self, url=None, topic=None, transport=None, **kwargs):
+        return object()
+
+
+@pytest.mark.asyncio
+async def test_clients_are_shared_on_request():
+    factory = AgntcyFactory()
+    factory._protocol_registry["TEST"] = _Protocol
+
+    client = await factory.create_client("TEST", agent_topic="agent", share=True)
+    assert (
+        await factory.create_client("TEST", agent_topic="agent", share=True) is client
+    )
+    assert (
+        await factory.create_client("TEST", agent_topic="other", share=True)
+        is not client
+    )
+
+    # clients are not shared by default, nor when their options are not hashable
+    assert await factory.create_client("TEST", agent_topic="agent") is not client
+    headers = {"Authorization": "token"}
+    first = await factory.create_client(
+        "TEST", agent_topic="agent", headers=headers, share=True
+    )
+    second = await factory.create_client(
+        "TEST", agent_topic="agent", headers=headers, share=True
+    )
+    assert first is not second
+
+    factory.release_client(client)
+    await factory.close()
@@ -0,0 +1,107 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+
+import pytest
+from mcp.server.fastmcp import Context, FastMCP
+
+from agntcy_app_sdk.protocols.mcp.client import TransportMCPClient
+from agntcy_app_sdk.protocols.mcp.protocol import MCPProtocol
+from agntcy_app_sdk.protocols.message import Message
+from agntcy_app_sdk.transports.streaming import STREAM_HEADER, is_stream
+
+pytest_plugins = "pytest_asyncio"
+
+
+def _server() -> FastMCP:
+    server = FastMCP("weather")
+
+    @server.tool()
+    async def get_forecast(location: str, ctx: Context) -> str:
+        await ctx.report_progress(0.5, 1.0)
+        return f"Sunny in {location}"
+
+    return server
+
+
+class LoopbackTransport:
+    """Hands requests straight to the ingress handler of a bridge."""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.requests = []
+
+    def type(self) -> str:
+        return "LOOPBACK"
+
+    async def request_stream(self, topic, message, timeout=None):
+        self.requests.append(message)
+        message.headers[STREAM_HEADER] = "1"
+        response = await self.handler(message)
+        if is_stream(response):
+            async for chunk in response:
+                yield chunk
+        else:
+            yield response
+
+
+@pytest.mark.asyncio
+async def test_tool_call_over_transport():
+    handler = MCPProtocol().create_ingress_handler(_server())
+    transport = LoopbackTransport(handler)
+
+    client = TransportMCPClient(transport, "weather")
+    await client.connect()
+    try:
+        tools = await client.session.list_tools()
+        assert [tool.name for tool in tools.tools] == ["get_forecast"]
+
+        progress = []
+
+        async def on_progress(value, total, message):
+            progress.append(value)
+
+        result = await client.session.call_tool(
+            "get_forecast",
+            {"location": "Colombia"},
+            progress_callback=on_progress,
+        )
+        assert result.content[0].text == "Sunny in Colombia"
+        assert progress == [0.5]
+    finally:
+        await client.close()
+
+    # notifications, e.g. initialized, are not sent to the stateless server
+    methods = [json.loads(r.payload)["method"] for r in transport.requests]
+    assert methods == ["initialize", "tools/list", "tools/call"]
+
+
+@pytest.mark.asyncio
+async def test_unstreamed_request_gets_the_response_only():
+    protocol = MCPProtocol()
+    handler = protocol.create_ingress_handler(_server())
+
+    request = protocol.message_translator(
+        {
+            "jsonrpc": "2.0",
+            "id": 7,
+            "method": "tools/call",
+            "params": {
+                "name": "get_forecast",
+                "arguments": {"location": "Lima"},
+                "_meta": {"progressToken": 1},
+            },
+        }
+    )
+    response = await handler(request)
+
+    assert isinstance(response, Message)
+    body = json.loads(response.payload)
+    assert body["id"] == 7
+    assert body["result"]["content"][0]["text"] == "Sunny in Lima"
+
+    notification = protocol.message_translator(
+        {"jsonrpc": "2.0", "method": "notifications/initialized"}
+    )
+    assert await handler(notification) is None
@@ -0,0 +1,129 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+
+import pytest
+
+from agntcy_app_sdk.protocols.message import (
+    BINARY_WIRE_FORMAT,
+    JSON_WIRE_FORMAT,
+    Message,
+    WireFormatNegotiator,
+    advertise_wire_formats,
+)
+
+
+def _message() -> Message:
+    return Message(
+        type="A2ARequest",
+        payload=json.dumps({"jsonrpc": "2.0", "id": "1"}),
+        reply_to="reply-topic",
+        route_path="/",
+        method="POST",
+        headers={"broadcast_id": "1234", "x-retries": 3},
+        status_code=200,
+    )
+
+
+@pytest.mark.parametrize("wire_format", [BINARY_WIRE_FORMAT, JSON_WIRE_FORMAT])
+def test_round_trip(wire_format):
+    message = _message()
+
+    decoded = Message.deserialize(message.serialize(wire_format))
+
+    assert decoded.type == message.type
+    assert decoded.payload == message.payload.encode("utf-8")
+    assert decoded.reply_to == message.reply_to
+    assert decoded.route_path == message.route_path
+    assert decoded.method == message.method
+    assert decoded.headers == message.headers
+    assert decoded.status_code == message.status_code
+    assert decoded.wire_format == wire_format
+
+
+def test_binary_carries_raw_payload():
+    payload = bytes(range(256)) * 16
+    data = Message(type="A2AResponse", payload=payload).serialize(BINARY_WIRE_FORMAT)
+
+    assert data.startswith(b"AM")
+    assert data.endswith(payload)
+
+    decoded = Message.deserialize(data)
+    # a bytes copy, not a view keeping the whole received buffer alive
+    assert type(decoded.payload) is bytes
+    assert decoded.payload == payload
+    assert decoded.reply_to is None
+    assert decoded.status_code is None
+    assert decoded.headers == {}
+
+
+def test_json_is_default():
+    data = Message(type="A2ARequest", payload=b"{}").serialize()
+
+    assert data.startswith(b"{")
+
+
+def test_legacy_json_is_accepted():
+    legacy = json.dumps(
+        {"type": "A2AResponse", "payload": "aGVsbG8=", "reply_to": "abc"}
+    ).encode("utf-8")
+
+    decoded = Message.deserialize(legacy)
+
+    assert decoded.payload == b"hello"
+    assert decoded.reply_to == "abc"
+    assert decoded.wire_format == JSON_WIRE_FORMAT
+
+
+def test_reply_mirrors_received_format():
+    request = Message.deserialize(_message().serialize(JSON_WIRE_FORMAT))
+
+    reply = Message(type="A2AResponse", payload=b"{}", wire_format=request.wire_format)
+
+    assert reply.serialize().startswith(b"{")
+
+
+def test_truncated_binary_message_raises():
+    data = _message().serialize(BINARY_WIRE_FORMAT)
+
+    with pytest.raises(ValueError):
+        Message.deserialize(data[:-1])
+
+    with pytest.raises(ValueError):
+        Message.deserialize(data[:10])
+
+
+def test_unknown_wire_format_raises():
+    with pytest.raises(ValueError):
+        _message().serialize("xml")
+
+
+def test_binary_is_negotiated_per_topic():
+    negotiator = WireFormatNegotiator()
+    assert negotiator.request_format("upgraded") == JSON_WIRE_FORMAT
+
+    response = Message(type="A2AResponse", payload=b"{}")
+    advertise_wire_formats(response)
+    negotiator.observe("upgraded", response)
+    # peers that did not advertise binary, e.g. older ones, keep getting JSON
+    negotiator.observe("legacy", Message(type="A2AResponse", payload=b"{}"))
+
+    assert negotiator.request_format("upgraded") == BINARY_WIRE_FORMAT
+    assert negotiator.request_format("legacy") == JSON_WIRE_FORMAT
+    assert negotiator.broadcast_format() == JSON_WIRE_FORMAT
+
+    # a response without the header, e.g. from a replica not yet upgraded
+    negotiator.observe("upgraded", Message(type="A2AResponse", payload=b"{}"))
+    assert negotiator.request_format("upgraded") == JSON_WIRE_FORMAT
+
+
+def test_forced_wire_format_is_always_used():
+    negotiator = WireFormatNegotiator(BINARY_WIRE_FORMAT)
+    negotiator.observe("legacy", Message(type="A2AResponse", payload=b"{}"))
+
+    assert negotiator.request_format("legacy") == BINARY_WIRE_FORMAT
+    assert negotiator.broadcast_format() == BINARY_WIRE_FORMAT
+
+    with pytest.raises(ValueError):
+        WireFormatNegotiator("xml")
@@ -0,0 +1,106 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from agntcy_app_sdk.protocols.message import Message, advertise_wire_formats
+from agntcy_app_sdk.transports.nats.transport import BROADCAST_SUFFIX, NatsTransport
+
+pytest_plugins = "pytest_asyncio"
+
+
+class FakeNATS:
+    def __init__(self, response: Message = None):
+        self.published = []
+        self.payloads = []
+        self.subscribed = []
+        self.response = response
+
+    def new_inbox(self):
+        return "_INBOX.test"
+
+    async def subscribe(self, subject, queue="", cb=None):
+        self.subscribed.append((subject, queue))
+
+    async def publish(self, subject, payload, headers=None):
+        self.published.append(subject)
+        self.payloads.append(payload)
+
+    async def request(self, subject, payload, headers=None, timeout=None):
+        await self.publish(subject, payload)
+        return SimpleNamespace(data=self.response.serialize())
+
+
+def transport(**kwargs) -> NatsTransport:
+    transport = NatsTransport(endpoint="nats://localhost:4222", **kwargs)
+    transport._nc = FakeNATS()
+    return transport
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fan_out", [False, True])
+async def test_broadcast_subject(fan_out):
+    nats = transport(fan_out_broadcasts=fan_out)
+    request = Message(type="request", payload=b"ping")
+
+    assert await nats.broadcast("agent", request, timeout=0.01) == []
+
+    # subscribers older than the fan-out subject only listen to the topic
+    expected = "agent" + BROADCAST_SUFFIX if fan_out else "agent"
+    assert nats._nc.published == [expected]
+
+
+@pytest.mark.asyncio
+async def test_binary_is_used_once_the_peer_advertised_it():
+    nats = transport()
+    response = Message(type="response", payload=b"pong")
+    advertise_wire_formats(response)
+    nats._nc = FakeNATS(response)
+
+    for _ in range(2):
+        await nats.publish("agent", Message(type="request", payload=b"ping"), True)
+    await nats.broadcast("agent", Message(type="request", payload=b"ping"), 0)
+
+    # JSON until the peer told it understands binary, broadcasts stay in JSON
+    assert [payload[:1] for payload in nats._nc.payloads] == [b"{", b"A", b"{"]
+
+
+class FakeMsg:
+    subject = "agent"
+
+    def __init__(self, message: Message):
+        self.data = message.serialize()
+        self.calls = []
+
+    async def in_progress(self):
+        self.calls.append("in_progress")
+
+    async def ack(self):
+        self.calls.append("ack")
+
+    async def nak(self, delay=None):
+        self.calls.append("nak")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fails", [False, True])
+async def test_slow_durable_message_is_kept_in_progress(fails):
+    nats = transport(jetstream=True, ack_wait=0.1)
+
+    async def handler(message):
+        await asyncio.sleep(0.25)
+        if fails:
+            raise RuntimeError("failed")
+
+    nats.set_callback(handler)
+    msg = FakeMsg(Message(type="request", payload=b"work"))
+    await nats._handle_durable(msg)
+    await asyncio.sleep(0.15)
+
+    # no heartbeat once the message was acknowledged, or not
+    *heartbeats, outcome = msg.calls
+    assert len(heartbeats) >= 3 and set(heartbeats) == {"in_progress"}
+    assert outcome == ("nak" if fails else "ack")
@@ -0,0 +1,127 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+
+import pytest
+
+from agntcy_app_sdk.protocols.message import Message
+from agntcy_app_sdk.transports.pending import (
+    CORRELATION_HEADER,
+    SENDER_HEADER,
+    PendingRequests,
+)
+
+pytest_plugins = "pytest_asyncio"
+
+
+def _response(request_id: str, payload: bytes) -> Message:
+    return Message(
+        type="response", payload=payload, headers={CORRELATION_HEADER: request_id}
+    )
+
+
+@pytest.mark.asyncio
+async def test_responses_complete_out_of_order():
+    pending = PendingRequests()
+    collectors = {str(i): pending.register(str(i)) for i in range(100)}
+    waiters = {
+        request_id: asyncio.create_task(collector.wait())
+        for request_id, collector in collectors.items()
+    }
+
+    for request_id in reversed(list(collectors)):
+        assert pending.resolve(_response(request_id, request_id.encode()))
+
+    for request_id, waiter in waiters.items():
+        [response] = await waiter
+        assert response.payload == request_id.encode()
+
+
+@pytest.mark.asyncio
+async def test_unknown_and_extra_responses_are_rejected():
+    pending = PendingRequests()
+    collector = pending.register("a", expected_responses=2)
+
+    assert not pending.resolve(_response("b", b"stray"))
+    assert pending.resolve(_response("a", b"1"))
+    assert not collector.done()
+    assert pending.resolve(_response("a", b"2"))
+    assert not pending.resolve(_response("a", b"3"))
+
+    assert [r.payload for r in await collector.wait()] == [b"1", b"2"]
+
+    pending.discard("a")
+    assert "a" not in pending
+    assert not pending.resolve(_response("a", b"late"))
+
+
+@pytest.mark.asyncio
+async def test_fail_all():
+    pending = PendingRequests()
+    collector = pending.register("a")
+
+    with pytest.raises(ValueError):
+        pending.register("a")
+
+    pending.fail_all(ConnectionError("closed"))
+    assert len(pending) == 0
+    with pytest.raises(ConnectionError):
+        await collector.wait()
+
+
+@pytest.mark.asyncio
+async def test_iterate_yields_responses_as_they_arrive():
+    pending = PendingRequests()
+    collector = pending.register("a", expected_responses=3)
+    loop = asyncio.get_running_loop()
+
+    pending.resolve(_response("a", b"1"))
+    responses = collector.iterate(deadline=loop.time() + 0.2)
+    assert (await anext(responses)).payload == b"1"
+
+    loop.call_later(0.01, pending.resolve, _response("a", b"2"))
+    assert (await anext(responses)).payload == b"2"
+
+    # the third response never arrives, iteration ends at the deadline
+    with pytest.raises(StopAsyncIteration):
+        await anext(responses)
+    assert [r.payload for r in collector.responses] == [b"1", b"2"]
+
+
+@pytest.mark.asyncio
+async def test_iterate_stops_at_expected_responses():
+    pending = PendingRequests()
+    collector = pending.register("a", expected_responses=2)
+    for payload in (b"1", b"2", b"3"):
+        pending.resolve(_response("a", payload))
+
+    assert [r.payload async for r in collector.iterate()] == [b"1", b"2"]
+
+
+@pytest.mark.asyncio
+async def test_duplicate_responders_count_once():
+    pending = PendingRequests()
+    collector = pending.register("a", expected_responses=2)
+
+    def response(sender: str) -> Message:
+        message = _response("a", sender.encode())
+        message.headers[SENDER_HEADER] = sender
+        return message
+
+    assert pending.resolve(response("x"))
+    assert not pending.resolve(response("x"))
+    assert not collector.done()
+    assert pending.resolve(response("y"))
+
+    assert [r.payload for r in await collector.wait()] == [b"x", b"y"]
+
+
+@pytest.mark.asyncio
+async def test_resolve_by_request_id():
+    pending = PendingRequests()
+    collector = pending.register("a")
+
+    # the transport tells which request a response is for, e.g. by its subject
+    assert pending.resolve(Message(type="response", payload=b"1"), "a")
+    assert [r.payload for r in await collector.wait()] == [b"1"]
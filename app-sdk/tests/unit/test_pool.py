@@ -0,0 +1,200 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from agntcy_app_sdk.protocols.message import Message
+from agntcy_app_sdk.transports.slim.pool import HASH_BY_TOPIC, GatewayPool
+from agntcy_app_sdk.transports.slim.transport import SLIMTransport
+
+pytest_plugins = "pytest_asyncio"
+
+
+async def _connect(index: int) -> str:
+    return f"gateway-{index}"
+
+
+@pytest.mark.asyncio
+async def test_least_loaded_selection():
+    pool = GatewayPool(size=3, connect=_connect, reply_topic="inbox")
+    await pool.start("gateway-0")
+
+    assert [m.gateway for m in pool.members] == ["gateway-0", "gateway-1", "gateway-2"]
+    assert [m.reply_topic for m in pool.members] == ["inbox", "inbox-1", "inbox-2"]
+
+    async with pool.acquire() as first:
+        async with pool.acquire() as second:
+            async with pool.acquire() as third:
+                assert {first.index, second.index, third.index} == {0, 1, 2}
+        assert pool.select() is second
+
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_hash_by_topic_selection():
+    pool = GatewayPool(size=4, strategy=HASH_BY_TOPIC, connect=_connect)
+    await pool.start("gateway-0")
+
+    assert pool.select("topic-a") is pool.select("topic-a")
+    assert len({pool.select(f"topic-{i}").index for i in range(32)}) > 1
+
+    with pytest.raises(ValueError):
+        GatewayPool(strategy="random")
+
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_unhealthy_connection_is_reconnected():
+    released, restored = [], []
+    reconnected = asyncio.Event()
+
+    async def on_unhealthy(member):
+        released.append(member.gateway)
+
+    async def on_reconnect(member):
+        restored.append(member.gateway)
+        reconnected.set()
+
+    pool = GatewayPool(
+        size=2,
+        connect=_connect,
+        on_unhealthy=on_unhealthy,
+        on_reconnect=on_reconnect,
+    )
+    await pool.start("initial")
+    member = pool.primary
+    member.routes[("org", "ns", "topic")] = True
+
+    pool.mark_unhealthy(member, ConnectionError("lost"))
+    assert not member.healthy
+    assert pool.select() is pool.members[1]
+
+    await asyncio.wait_for(reconnected.wait(), timeout=1)
+    assert released == ["initial"]
+    assert restored == ["gateway-0"]
+    assert member.healthy
+    assert len(member.routes) == 0
+
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_connection_without_connect_stays_in_rotation():
+    pool = GatewayPool()
+    await pool.start("client")
+
+    pool.mark_unhealthy(pool.primary, ConnectionError("lost"))
+    assert pool.select() is pool.primary
+
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_calls_share_one_pool(monkeypatch):
+    transport = SLIMTransport(endpoint="http://slim", pool_size=2)
+    created = []
+
+    async def create_gateway(org, namespace, name):
+        await asyncio.sleep(0.01)
+        created.append(name)
+        return f"gateway-{len(created)}"
+
+    monkeypatch.setattr(transport, "_create_gateway", create_gateway)
+    await asyncio.gather(
+        *(transport._ensure_pool("org", "ns", "topic") for _ in range(5))
+    )
+
+    assert len(created) == 2
+    assert transport._pool.primary.gateway is transport._gateway
+
+    await transport._pool.close()
+
+
+class ClosedSessionGateway:
+    def __init__(self):
+        self.receives = 0
+
+    async def receive(self, session=None):
+        self.receives += 1
+        raise RuntimeError("session not found")
+
+
+@pytest.mark.asyncio
+async def test_lost_session_fails_its_requests():
+    reconnecting = asyncio.Event()
+
+    async def connect(index):
+        reconnecting.set()
+        await asyncio.Event().wait()
+
+    transport = SLIMTransport(endpoint="http://slim")
+    transport._pool = GatewayPool(connect=connect)
+    gateway = ClosedSessionGateway()
+    await transport._pool.start(gateway)
+    member = transport._pool.primary
+    member.sessions["org_ns_topic_pubsub"] = SimpleNamespace(id=7)
+    collector = transport._pending.register("request", 1)
+    member.pending.add("request")
+
+    # the reader gives up on the session rather than spinning on it
+    await asyncio.wait_for(transport._read_responses(member, 7), timeout=1)
+    assert gateway.receives == 1
+
+    with pytest.raises(ConnectionError):
+        await collector.wait()
+    assert not member.sessions
+    assert not member.healthy
+    await asyncio.wait_for(reconnecting.wait(), timeout=1)
+
+    await transport._pool.close()
+
+
+class SubscribingGateway:
+    def __init__(self):
+        self.subscribed = []
+        self.unsubscribed = []
+
+    async def subscribe(self, org, namespace, topic):
+        self.subscribed.append(topic)
+
+    async def unsubscribe(self, org, namespace, topic):
+        self.unsubscribed.append(topic)
+
+
+@pytest.mark.asyncio
+async def test_shared_reply_topic_outlives_its_first_request(monkeypatch):
+    transport = SLIMTransport()
+    transport._pool = GatewayPool()
+    gateway = SubscribingGateway()
+    await transport._pool.start(gateway)
+
+    async def send(member, org, namespace, topic, message, request_id):
+        await transport._subscribe_once(member, org, namespace, message.reply_to)
+
+    monkeypatch.setattr(transport, "_send", send)
+
+    def request():
+        return transport._exchange(
+            "org",
+            "ns",
+            "topic",
+            Message(type="request", payload=b"", reply_to="inbox"),
+            None,
+            reply=True,
+        )
+
+    async with request():
+        async with request():
+            pass
+        # the first request done, the other one still gets its responses
+        assert gateway.unsubscribed == []
+    assert gateway.subscribed == ["inbox"]
+    assert gateway.unsubscribed == ["inbox"]
+    assert not transport._pool.primary.reply_topic_users
+
+    await transport._pool.close()
@@ -0,0 +1,126 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import anyio
+import pytest
+from mcp.server.fastmcp import FastMCP
+from mcp.shared.memory import create_client_server_memory_streams
+
+from agntcy_app_sdk.transports.streamable_http import transport as streamable_http
+from agntcy_app_sdk.transports.streamable_http.transport import (
+    StreamableHTTPTransport,
+)
+
+pytest_plugins = "pytest_asyncio"
+
+
+@pytest.fixture
+def server(monkeypatch):
+    """A FastMCP server reached through in-memory streams rather than HTTP."""
+    server = FastMCP("weather")
+    server.opened = 0
+    release = asyncio.Event()
+    release.set()
+    server.release = release
+
+    @server.tool()
+    async def get_forecast(location: str) -> str:
+        await release.wait()
+        return f"Sunny in {location}"
+
+    @asynccontextmanager
+    async def memory_client(url):
+        server.opened += 1
+        async with create_client_server_memory_streams() as (client, server_streams):
+            async with anyio.create_task_group() as tasks:
+                mcp_server = server._mcp_server
+                tasks.start_soon(
+                    mcp_server.run,
+                    *server_streams,
+                    mcp_server.create_initialization_options(),
+                )
+                yield client[0], client[1], None
+                tasks.cancel_scope.cancel()
+
+    monkeypatch.setattr(streamable_http, "streamablehttp_client", memory_client)
+    return server
+
+
+@pytest.mark.asyncio
+async def test_warm_pool_is_reused(server):
+    transport = StreamableHTTPTransport("http://mcp", pool_size=3)
+    await transport.connect()
+    assert server.opened == 3
+
+    server.release.clear()
+    calls = [
+        asyncio.create_task(transport.call_tool("get_forecast", {"location": f"{i}"}))
+        for i in range(3)
+    ]
+    await asyncio.sleep(0.1)
+    # each call has a session of its own
+    assert all(pooled.busy for pooled in transport._sessions)
+
+    server.release.set()
+    results = await asyncio.gather(*calls)
+    assert [r.content[0].text for r in results] == [
+        "Sunny in 0",
+        "Sunny in 1",
+        "Sunny in 2",
+    ]
+
+    tools = await transport.list_tools()
+    assert [tool.name for tool in tools.tools] == ["get_forecast"]
+    assert server.opened == 3
+
+    await transport.close()
+    assert transport.session is None
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_opened_on_demand_up_to_pool_size(server):
+    transport = StreamableHTTPTransport(
+        "http://mcp", pool_size=2, warm_up=False, acquire_timeout=0.2
+    )
+    await transport.connect()
+    assert server.opened == 1
+
+    async with transport.acquire() as first:
+        async with transport.acquire() as second:
+            assert first is not second
+            assert server.opened == 2
+
+            with pytest.raises(asyncio.TimeoutError):
+                async with transport.acquire():
+                    pass
+
+        async with transport.acquire() as third:
+            assert third is second
+
+    await transport.close()
+
+
+@pytest.mark.asyncio
+async def test_failing_session_is_replaced(server):
+    transport = StreamableHTTPTransport(
+        "http://mcp", pool_size=2, health_check_interval=0.05
+    )
+    await transport.connect()
+    failing = transport._sessions[0]
+
+    async def fail():
+        raise ConnectionError("gone")
+
+    failing.session.send_ping = fail
+    await asyncio.sleep(0.3)
+
+    assert failing not in transport._sessions
+    assert len(transport._sessions) == 2
+    assert server.opened == 3
+    result = await transport.call_tool("get_forecast", {"location": "Lima"})
+    assert result.content[0].text == "Sunny in Lima"
+
+    await transport.close()
@@ -0,0 +1,60 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from agntcy_app_sdk.protocols.message import Message
+from agntcy_app_sdk.transports.streaming import (
+    END_HEADER,
+    StreamCollector,
+    frame_stream,
+)
+
+pytest_plugins = "pytest_asyncio"
+
+
+async def _chunks(payloads, error=None):
+    for payload in payloads:
+        yield Message(type="A2AResponse", payload=payload)
+    if error:
+        raise error
+
+
+async def _collect(stream: StreamCollector) -> list[bytes]:
+    return [chunk.payload async for chunk in stream.iterate(timeout=1)]
+
+
+@pytest.mark.asyncio
+async def test_chunks_are_reordered_and_deduplicated():
+    framed = [chunk async for chunk in frame_stream(_chunks([b"a", b"b", b"c"]))]
+    assert framed[-1].headers[END_HEADER] == "1"
+
+    stream = StreamCollector()
+    for chunk in reversed(framed):
+        assert stream.add(chunk)
+    assert stream.done()
+    assert not stream.add(framed[0])
+
+    assert await _collect(stream) == [b"a", b"b", b"c"]
+
+
+@pytest.mark.asyncio
+async def test_failed_stream_raises_after_the_sent_chunks():
+    stream = StreamCollector()
+    async for chunk in frame_stream(_chunks([b"a"], error=ValueError("boom"))):
+        stream.add(chunk)
+
+    received = []
+    with pytest.raises(RuntimeError, match="boom"):
+        async for chunk in stream.iterate(timeout=1):
+            received.append(chunk.payload)
+    assert received == [b"a"]
+
+
+@pytest.mark.asyncio
+async def test_response_that_was_not_streamed():
+    stream = StreamCollector()
+    assert stream.add(Message(type="A2AResponse", payload=b"whole"))
+    assert not stream.add(Message(type="A2AResponse", payload=b"again"))
+
+    assert await _collect(stream) == [b"whole"]
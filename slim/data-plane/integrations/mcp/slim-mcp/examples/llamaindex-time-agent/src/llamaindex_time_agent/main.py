@@ -11,7 +11,7 @@ from llama_index.llms.azure_openai import AzureOpenAI
 from llama_index.llms.ollama import Ollama
 from llama_index.tools.mcp import McpToolSpec
 
-from slim_mcp import SLIMClient
+from slim_mcp import SLIMClient, ToolCache
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -50,6 +50,8 @@ async def amain(
         organization,
         namespace,
         mcp_server,
+        # the current time changes, but tool listings and conversions do not
+        cache=ToolCache(tool_ttls={"get_current_time": 0, "convert_time": 300}),
     ) as client1:
         async with client1.to_mcp_session() as mcp_session:
             logger.info("Creating MCP tool spec")
@@ -0,0 +1,126 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+"""Messages per second through SLIMBase.new_streams().
+
+SLIM is replaced by a loopback that hands out the same received message and
+drops the sent ones, so that only the reader and writer loops of new_streams(),
+and the serialization of the messages, are measured. The serialization alone
+is measured too.
+
+    uv run python benchmarks/bench_new_streams.py --messages 50000
+"""
+
+import argparse
+import asyncio
+import time
+from types import SimpleNamespace
+
+import mcp.types as types
+
+from slim_mcp.codec import decode_message, encode_message
+from slim_mcp.common import SLIMBase
+
+MESSAGES = {
+    "request": types.JSONRPCMessage(
+        types.JSONRPCRequest(
+            jsonrpc="2.0",
+            id=1,
+            method="tools/call",
+            params={"name": "get_forecast", "arguments": {"location": "Rome"}},
+        )
+    ),
+    "result": types.JSONRPCMessage(
+        types.JSONRPCResponse(
+            jsonrpc="2.0",
+            id=1,
+            result={
+                "content": [{"type": "text", "text": "Sunny, 24C. " * 40}],
+                "isError": False,
+            },
+        )
+    ),
+}
+
+
+class _LoopbackSlim:
+    def __init__(self, session, data: bytes):
+        self._session = session
+        self._data = data
+
+    async def receive(self, session=None):
+        return self._session, self._data
+
+    async def delete_session(self, session_id):
+        pass
+
+
+class LoopbackSLIM(SLIMBase):
+    def __init__(self, data: bytes):
+        super().__init__({"endpoint": "loopback"}, "org", "default", "bench")
+        self.session = SimpleNamespace(id=1)
+        self.slim = _LoopbackSlim(self.session, data)
+        self.sent = 0
+
+    async def _send_message(self, session, message: bytes):
+        self.sent += 1
+
+
+async def bench(message: types.JSONRPCMessage, count: int) -> tuple[float, float]:
+    data = message.model_dump_json(by_alias=True, exclude_none=True).encode()
+    base = LoopbackSLIM(data)
+
+    async with base.new_streams(base.session) as (read_stream, write_stream):
+        start = time.perf_counter()
+        for _ in range(count):
+            await read_stream.receive()
+        received = count / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for _ in range(count):
+            await write_stream.send(message)
+        while base.sent < count:
+            await asyncio.sleep(0)
+        sent = count / (time.perf_counter() - start)
+
+    return received, sent
+
+
+def bench_codec(message: types.JSONRPCMessage, count: int) -> tuple[float, float]:
+    data = encode_message(message)
+
+    start = time.perf_counter()
+    for _ in range(count):
+        decode_message(data)
+    decoded = count / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(count):
+        encode_message(message)
+    encoded = count / (time.perf_counter() - start)
+
+    return decoded, encoded
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for name, message in MESSAGES.items():
+        runs = [await bench(message, args.messages) for _ in range(args.repeat)]
+        received = max(run[0] for run in runs)
+        sent = max(run[1] for run in runs)
+        print(f"{name:>8}: received {received:>9,.0f} msg/s, sent {sent:>9,.0f} msg/s")
+
+        runs = [bench_codec(message, args.messages) for _ in range(args.repeat)]
+        decoded = max(run[0] for run in runs)
+        encoded = max(run[1] for run in runs)
+        print(
+            f"{'':>8}  decoded  {decoded:>9,.0f} msg/s, encoded {encoded:>9,.0f} msg/s"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
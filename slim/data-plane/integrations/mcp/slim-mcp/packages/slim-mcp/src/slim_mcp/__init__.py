@@ -3,5 +3,8 @@
 
 from slim_bindings import init_tracing as init_tracing
 
+from slim_mcp.cache import CachingClientSession as CachingClientSession
+from slim_mcp.cache import ToolCache as ToolCache
 from slim_mcp.client import SLIMClient as SLIMClient
+from slim_mcp.multiplex import MultiplexedStream as MultiplexedStream
 from slim_mcp.server import SLIMServer as SLIMServer
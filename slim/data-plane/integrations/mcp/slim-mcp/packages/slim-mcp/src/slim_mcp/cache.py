@@ -0,0 +1,342 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable
+
+import mcp.types as types
+from mcp import ClientSession
+
+logger = logging.getLogger(__name__)
+
+# Kinds of the listings cached per server
+TOOLS = "tools"
+RESOURCES = "resources"
+
+
+def canonical_arguments(arguments: dict[str, Any] | None) -> str:
+    """Serialize tool arguments so that equal arguments give the same key.
+
+    Args:
+        arguments: Arguments of a tool call
+
+    Returns:
+        str: The arguments as compact JSON, with sorted keys
+    """
+    return json.dumps(
+        arguments or {},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+
+
+def _hint(tool: types.Tool, name: str, default: bool) -> bool:
+    # annotations are a field of newer MCP versions, an extra field of older ones
+    annotations = getattr(tool, "annotations", None)
+    if isinstance(annotations, dict):
+        value = annotations.get(name)
+    else:
+        value = getattr(annotations, name, None)
+    # absent hints take the defaults of the MCP specification
+    return default if value is None else value
+
+
+class ToolCache:
+    """Client-side cache of MCP tool results and server listings.
+
+    Results of tool calls are cached by (server, tool, canonical arguments) for
+    a time-to-live depending on the tool: the one set in tool_ttls, or
+    default_ttl for the tools the server declares closed world (openWorldHint
+    false) and either read-only, or idempotent and not destructive. Absent hints
+    take their defaults of the MCP specification, under which a tool is open
+    world and destructive. Other tools, and failed calls, are never cached. The
+    least recently used results are evicted once maxsize is reached.
+
+    The tools and resources listed by a server are kept as a snapshot, served
+    as-is once stale while it is refreshed in the background.
+
+    A cache can be shared by many sessions and clients. Concurrent identical
+    calls share a single request.
+
+    Attributes:
+        maxsize (int): Maximum number of cached tool results
+        default_ttl (float): Seconds the result of a tool the server declares
+            cacheable is kept, 0 to only cache the tools of tool_ttls
+        tool_ttls (Dict[str, float]): Seconds the result of a tool is kept, per
+            tool name, 0 to never cache it
+        listing_ttl (float): Seconds a listing is served without a refresh
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        default_ttl: float = 60.0,
+        tool_ttls: dict[str, float] | None = None,
+        listing_ttl: float = 300.0,
+    ):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of cached tool results
+            default_ttl: Seconds the result of a tool declared cacheable by the
+                server is kept, 0 to ignore server hints
+            tool_ttls: Seconds the result of a tool is kept per tool name,
+                overriding server hints, 0 to never cache the tool
+            listing_ttl: Seconds the tools and resources of a server are listed
+                from the cache before being refreshed
+
+        Raises:
+            ValueError: If maxsize is not positive
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be greater than 0")
+
+        self.maxsize = maxsize
+        self.default_ttl = default_ttl
+        self.tool_ttls = dict(tool_ttls or {})
+        self.listing_ttl = listing_ttl
+
+        # key -> (expiry time, value)
+        self._results: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._listings: dict[tuple[str, str], tuple[float, Any]] = {}
+        # tools of each server, by name, for their hints
+        self._tools: dict[str, dict[str, types.Tool]] = {}
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def tool_ttl(self, server: str, tool: str) -> float:
+        """Return the seconds the results of a tool are kept, 0 if they are not cached.
+
+        Args:
+            server: Identifier of the MCP server
+            tool: Name of the tool
+        """
+        if tool in self.tool_ttls:
+            return self.tool_ttls[tool]
+
+        known = self._tools.get(server, {}).get(tool)
+        if known is None:
+            return 0
+        # open world tools depend on external state, unless told otherwise
+        if _hint(known, "openWorldHint", True):
+            return 0
+        if _hint(known, "readOnlyHint", False):
+            return self.default_ttl
+        # destructive tools must run, the hint only applies to non read-only ones
+        if _hint(known, "idempotentHint", False) and not _hint(
+            known, "destructiveHint", True
+        ):
+            return self.default_ttl
+        return 0
+
+    def knows_tools(self, server: str) -> bool:
+        """Tell whether the tools of a server, and so their hints, are known."""
+        return server in self._tools
+
+    async def call_tool(
+        self,
+        server: str,
+        tool: str,
+        arguments: dict[str, Any] | None,
+        call: Callable[[], Awaitable[types.CallToolResult]],
+    ) -> types.CallToolResult:
+        """Return the cached result of a tool call, calling it if there is none.
+
+        Args:
+            server: Identifier of the MCP server
+            tool: Name of the tool
+            arguments: Arguments of the call
+            call: Coroutine function calling the tool
+
+        Returns:
+            types.CallToolResult: The result, shared with the other callers
+        """
+        ttl = self.tool_ttl(server, tool)
+        if ttl <= 0:
+            return await call()
+
+        key = (server, tool, canonical_arguments(arguments))
+        cached = self._results.get(key)
+        if cached is not None:
+            expires_at, result = cached
+            if expires_at > time.monotonic():
+                self._results.move_to_end(key)
+                logger.debug(f"Cached result of {tool} on {server}")
+                return result
+            del self._results[key]
+
+        async def fetch() -> types.CallToolResult:
+            result = await call()
+            if not result.isError:
+                self._store(key, result, ttl)
+            return result
+
+        return await self._share(key, fetch)
+
+    async def listing(
+        self,
+        server: str,
+        kind: str,
+        fetch: Callable[[], Awaitable[Any]],
+        refresh: Callable[[Awaitable[Any]], Any],
+    ) -> Any:
+        """Return the snapshot of a listing, fetching it if there is none.
+
+        A stale snapshot is returned as-is, while it is fetched again.
+
+        Args:
+            server: Identifier of the MCP server
+            kind: Kind of listing, TOOLS or RESOURCES
+            fetch: Coroutine function fetching the listing
+            refresh: Runs the refresh of a stale snapshot in the background,
+                e.g. in a task of the session it is fetched with
+        """
+        key = (server, kind)
+
+        async def update() -> Any:
+            value = await fetch()
+            self._listings[key] = (time.monotonic() + self.listing_ttl, value)
+            if kind == TOOLS:
+                self._tools[server] = {tool.name: tool for tool in value.tools}
+            return value
+
+        cached = self._listings.get(key)
+        if cached is None:
+            return await self._share(key, update)
+
+        expires_at, value = cached
+        if expires_at <= time.monotonic() and key not in self._inflight:
+            logger.debug(f"Refreshing {kind} of {server}")
+            refresh(self._share(key, update))
+        return value
+
+    def invalidate(self, server: str, tool: str | None = None) -> None:
+        """Forget the cached results of a tool, or of all the tools of a server.
+
+        Args:
+            server: Identifier of the MCP server
+            tool: Name of the tool, None for all tools
+        """
+        for key in list(self._results):
+            if key[0] == server and (tool is None or key[1] == tool):
+                del self._results[key]
+
+    def invalidate_listing(self, server: str, kind: str) -> None:
+        """Forget the snapshot of a listing, e.g. once the server changed it."""
+        self._listings.pop((server, kind), None)
+        if kind == TOOLS:
+            self._tools.pop(server, None)
+
+    def clear(self) -> None:
+        """Forget all entries."""
+        self._results.clear()
+        self._listings.clear()
+        self._tools.clear()
+
+    def _store(self, key: Hashable, value: Any, ttl: float) -> None:
+        self._results[key] = (time.monotonic() + ttl, value)
+        self._results.move_to_end(key)
+        while len(self._results) > self.maxsize:
+            self._results.popitem(last=False)
+
+    async def _share(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fetch())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # a caller giving up must not fail the others
+        return await asyncio.shield(future)
+
+
+class CachingClientSession(ClientSession):
+    """MCP client session answering from a ToolCache when it can.
+
+    call_tool(), list_tools() and list_resources() go through the cache, other
+    requests are sent as usual. Notifications that the server changed its tools
+    or resources drop the matching entries.
+    """
+
+    def __init__(self, *args: Any, cache: ToolCache, server: str, **kwargs: Any):
+        """Initialize the session.
+
+        Args:
+            cache: The cache, possibly shared with other sessions
+            server: Identifier of the MCP server the session is with
+        """
+        super().__init__(*args, **kwargs)
+        self.cache = cache
+        self.server = server
+        self._refreshes: set[asyncio.Task] = set()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        for task in self._refreshes:
+            task.cancel()
+        return await super().__aexit__(exc_type, exc_val, exc_tb)
+
+    async def call_tool(
+        self, name: str, arguments: dict[str, Any] | None = None, **kwargs: Any
+    ) -> types.CallToolResult:
+        if name not in self.cache.tool_ttls and not self.cache.knows_tools(self.server):
+            # learn the hints of the server tools, from the cache most of the time
+            await self.list_tools()
+
+        return await self.cache.call_tool(
+            self.server,
+            name,
+            arguments,
+            lambda: super(CachingClientSession, self).call_tool(
+                name, arguments, **kwargs
+            ),
+        )
+
+    async def list_tools(self, *args: Any, **kwargs: Any) -> types.ListToolsResult:
+        if args or kwargs:
+            # pages other than the first are not cached
+            return await super().list_tools(*args, **kwargs)
+        return await self.cache.listing(
+            self.server, TOOLS, super().list_tools, self._refresh
+        )
+
+    async def list_resources(
+        self, *args: Any, **kwargs: Any
+    ) -> types.ListResourcesResult:
+        if args or kwargs:
+            return await super().list_resources(*args, **kwargs)
+        return await self.cache.listing(
+            self.server, RESOURCES, super().list_resources, self._refresh
+        )
+
+    async def _received_notification(
+        self, notification: types.ServerNotification
+    ) -> None:
+        match notification.root:
+            case types.ToolListChangedNotification():
+                # the tools may behave differently too
+                self.cache.invalidate_listing(self.server, TOOLS)
+                self.cache.invalidate(self.server)
+            case types.ResourceListChangedNotification():
+                self.cache.invalidate_listing(self.server, RESOURCES)
+            case _:
+                pass
+        await super()._received_notification(notification)
+
+    def _refresh(self, refresh: Awaitable[Any]) -> None:
+        async def run() -> None:
+            try:
+                await refresh
+            except Exception as e:
+                logger.warning(f"Failed to refresh listing of {self.server}: {e}")
+
+        task = asyncio.create_task(run())
+        self._refreshes.add(task)
+        task.add_done_callback(self._refreshes.discard)
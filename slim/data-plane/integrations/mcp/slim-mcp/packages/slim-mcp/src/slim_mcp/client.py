@@ -1,6 +1,7 @@
 # Copyright AGNTCY Contributors (https://github.com/agntcy)
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 import datetime
@@ -9,7 +10,9 @@ from typing import Any
 import slim_bindings
 from mcp import ClientSession
 
+from slim_mcp.cache import CachingClientSession, ToolCache
 from slim_mcp.common import SLIMBase
+from slim_mcp.multiplex import SLIMMultiplexer, run_multiplexer
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +29,9 @@ class SLIMClient(SLIMBase):
         remote_organization (str): Remote organization identifier
         remote_namespace (str): Remote namespace identifier
         remote_mcp_agent (str): Remote MCP agent identifier
+        cache (Optional[ToolCache]): Cache of tool results and listings used by
+            the MCP sessions, None to disable caching
+        multiplex (bool): Whether the MCP sessions share one SLIM session
     """
 
     def __init__(
@@ -39,6 +45,8 @@ class SLIMClient(SLIMBase):
         remote_mcp_agent: str,
         message_timeout: datetime.timedelta = datetime.timedelta(seconds=15),
         message_retries: int = 2,
+        cache: ToolCache | None = None,
+        multiplex: bool = False,
     ) -> None:
         """
         Initialize the SLIM client.
@@ -53,6 +61,11 @@ class SLIMClient(SLIMBase):
             remote_organization: Remote organization identifier
             remote_namespace: Remote namespace identifier
             remote_mcp_agent: Remote MCP agent identifier
+            cache: Optional cache of tool results and listings, possibly shared
+                with other clients
+            multiplex: Carry all the MCP sessions over one SLIM session, rather
+                than creating a SLIM session per MCP session. The server must be
+                created with multiplex=True.
 
         Raises:
             ValueError: If any of the required parameters are empty or invalid
@@ -70,6 +83,21 @@ class SLIMClient(SLIMBase):
             message_retries=message_retries,
         )
 
+        self.cache = cache
+        self.multiplex = multiplex
+
+        self._multiplexer: SLIMMultiplexer | None = None
+        self._multiplexer_task: asyncio.Task | None = None
+        self._multiplexer_lock = asyncio.Lock()
+
+    @property
+    def server_id(self) -> str:
+        """Identifier of the remote MCP server, as used by the cache."""
+        return (
+            f"{self.remote_organization}/{self.remote_namespace}/"
+            f"{self.remote_mcp_agent}"
+        )
+
     async def _send_message(
         self,
         session: slim_bindings.PySessionInfo,
@@ -109,15 +137,17 @@ class SLIMClient(SLIMBase):
             logger.error("Failed to send message", exc_info=True)
             raise RuntimeError(f"Failed to send message: {str(e)}") from e
 
-    @asynccontextmanager
-    async def to_mcp_session(self, *args, **kwargs):
-        """Create a new MCP session.
+    async def __aexit__(self, exc_type: type[Any], exc_value: Any, traceback: Any):
+        if self._multiplexer_task is not None:
+            self._multiplexer_task.cancel()
+            await asyncio.gather(self._multiplexer_task, return_exceptions=True)
+            self._multiplexer_task = None
+            self._multiplexer = None
 
-        Returns:
-            slim_bindings.PySessionInfo: The new MCP session
-        """
-        # create session
-        session = await self.slim.create_session(
+        await super().__aexit__(exc_type, exc_value, traceback)
+
+    async def _create_session(self) -> slim_bindings.PySessionInfo:
+        return await self.slim.create_session(
             slim_bindings.PySessionConfiguration.FireAndForget(
                 timeout=self.message_timeout,
                 max_retries=self.message_retries,
@@ -125,9 +155,47 @@ class SLIMClient(SLIMBase):
             )
         )
 
+    async def _shared_session(self) -> SLIMMultiplexer:
+        """Return the multiplexer of the shared SLIM session, creating it if needed."""
+        async with self._multiplexer_lock:
+            if self._multiplexer is None or self._multiplexer.closed:
+                session = await self._create_session()
+                logger.info(f"Created multiplexed session: {session.id}")
+                self._multiplexer = SLIMMultiplexer(self, session)
+                self._multiplexer_task = asyncio.create_task(
+                    run_multiplexer(self, self._multiplexer)
+                )
+            return self._multiplexer
+
+    @asynccontextmanager
+    async def to_mcp_session(self, *args, **kwargs):
+        """Create a new MCP session.
+
+        If the client has a cache, the session is a CachingClientSession
+        answering tool calls and listings from it when it can.
+
+        Returns:
+            slim_bindings.PySessionInfo: The new MCP session
+        """
+        if self.multiplex:
+            # a new stream of the shared session
+            session = (await self._shared_session()).new_stream()
+        else:
+            session = await self._create_session()
+
         # create streams
         async with self.new_streams(session) as (read_stream, write_stream):
-            async with ClientSession(
-                read_stream, write_stream, *args, **kwargs
-            ) as mcp_session:
+            if self.cache is not None:
+                mcp_session = CachingClientSession(
+                    read_stream,
+                    write_stream,
+                    *args,
+                    cache=self.cache,
+                    server=self.server_id,
+                    **kwargs,
+                )
+            else:
+                mcp_session = ClientSession(read_stream, write_stream, *args, **kwargs)
+
+            async with mcp_session:
                 yield mcp_session
@@ -0,0 +1,34 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import mcp.types as types
+
+# Serializes the messages straight to bytes, rather than to a str to encode
+_serializer = types.JSONRPCMessage.__pydantic_serializer__
+
+
+def encode_message(message: types.JSONRPCMessage) -> bytes:
+    """Serialize a JSON-RPC message to be published on a SLIM session.
+
+    Args:
+        message: The message
+
+    Returns:
+        bytes: The message as compact JSON
+    """
+    return _serializer.to_json(message, by_alias=True, exclude_none=True)
+
+
+def decode_message(data: bytes) -> types.JSONRPCMessage:
+    """Validate a JSON-RPC message received on a SLIM session, without decoding it first.
+
+    Args:
+        data: The message as JSON
+
+    Returns:
+        types.JSONRPCMessage: The message
+
+    Raises:
+        pydantic.ValidationError: If the message is not a valid JSON-RPC message
+    """
+    return types.JSONRPCMessage.model_validate_json(data)
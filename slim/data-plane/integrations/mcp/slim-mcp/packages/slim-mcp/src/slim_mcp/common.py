@@ -13,6 +13,9 @@ import anyio
 import mcp.types as types
 from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 
+from slim_mcp.codec import decode_message, encode_message
+from slim_mcp.multiplex import MultiplexedStream
+
 logger = logging.getLogger(__name__)
 
 # Configuration constants
@@ -80,6 +83,9 @@ class SLIMBase(ABC):
         self.message_timeout = message_timeout
         self.message_retries = message_retries
 
+        # first messages of the sessions already received, by session id
+        self._first_messages: dict[int, bytes] = {}
+
     def is_connected(self) -> bool:
         """Check if the client is connected to slim.
 
@@ -253,12 +259,13 @@ class SLIMBase(ABC):
     @asynccontextmanager
     async def new_streams(
         self,
-        accepted_session: slim_bindings.PySessionInfo,
+        accepted_session: slim_bindings.PySessionInfo | MultiplexedStream,
     ):
         """Create a new session for message exchange.
 
         Args:
-            accepted_session: Optional session info to use instead of the default session
+            accepted_session: Optional session info to use instead of the default session,
+                or a stream of a multiplexed session
 
         Yields:
             Tuple[MemoryObjectReceiveStream, MemoryObjectSendStream]: Streams for reading and writing messages
@@ -266,6 +273,12 @@ class SLIMBase(ABC):
         Raises:
             ValueError: If no valid session is available
         """
+        if isinstance(accepted_session, MultiplexedStream):
+            multiplexer = accepted_session.multiplexer
+            async with multiplexer.streams(accepted_session) as streams:
+                yield streams
+            return
+
         # initialize streams
         read_stream: MemoryObjectReceiveStream[types.JSONRPCMessage | Exception]
         read_stream_writer: MemoryObjectSendStream[types.JSONRPCMessage | Exception]
@@ -280,15 +293,17 @@ class SLIMBase(ABC):
 
         async def slim_reader():
             session = accepted_session
+            first_message = self._first_messages.pop(session.id, None)
             try:
                 while True:
                     try:
-                        session, msg = await self.slim.receive(session=session.id)
-                        logger.debug(
-                            "Received message", extra={"message": msg.decode()}
-                        )
+                        if first_message is not None:
+                            msg, first_message = first_message, None
+                        else:
+                            session, msg = await self.slim.receive(session=session.id)
+                        logger.debug("Received message: %r", msg)
 
-                        message = types.JSONRPCMessage.model_validate_json(msg.decode())
+                        message = decode_message(msg)
                         if not self._filter_message(
                             accepted_session, message, pending_pings
                         ):
@@ -304,9 +319,9 @@ class SLIMBase(ABC):
             try:
                 async for message in write_stream_reader:
                     try:
-                        json = message.model_dump_json(by_alias=True, exclude_none=True)
-                        logger.debug("Sending message", extra={"message": json})
-                        await self._send_message(accepted_session, json.encode())
+                        data = encode_message(message)
+                        logger.debug("Sending message: %r", data)
+                        await self._send_message(accepted_session, data)
                     except Exception:
                         logger.error("Error sending message", exc_info=True)
                         raise
@@ -0,0 +1,374 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import itertools
+import logging
+from collections.abc import Callable
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any
+
+import anyio
+import mcp.types as types
+import slim_bindings
+from anyio.abc import TaskGroup
+from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+
+from slim_mcp.codec import decode_message, encode_message
+
+if TYPE_CHECKING:
+    from slim_mcp.common import SLIMBase
+
+logger = logging.getLogger(__name__)
+
+# Messages of multiplexed MCP sessions are framed as
+# MULTIPLEX_MARKER + stream id + MULTIPLEX_MARKER + JSON-RPC message.
+# JSON never starts with the marker, so that plain messages, e.g. the pings
+# of the SLIM session, can share it. A frame without message ends a stream.
+MULTIPLEX_MARKER = b"\x1e"
+
+# Messages buffered per stream, so that a slow MCP session does not hold back
+# the others sharing the SLIM session. A stream falling further behind is ended.
+STREAM_BUFFER_SIZE = 64
+
+
+def encode_frame(stream_id: str, message: bytes) -> bytes:
+    """Frame a message of a multiplexed stream.
+
+    Args:
+        stream_id: Identifier of the stream
+        message: Serialized JSON-RPC message, empty to end the stream
+
+    Returns:
+        bytes: The frame
+    """
+    return MULTIPLEX_MARKER + stream_id.encode() + MULTIPLEX_MARKER + message
+
+
+def decode_frame(data: bytes) -> tuple[str | None, bytes]:
+    """Split a frame into its stream id and message.
+
+    Args:
+        data: Frame, or plain message
+
+    Returns:
+        Tuple[Optional[str], bytes]: The stream id, None for a plain message,
+            and the message
+
+    Raises:
+        ValueError: If the frame is malformed
+    """
+    if not data.startswith(MULTIPLEX_MARKER):
+        return None, data
+
+    end = data.index(MULTIPLEX_MARKER, 1)
+    return data[1:end].decode(), data[end + 1 :]
+
+
+def is_frame(data: bytes | None) -> bool:
+    """Check if a message is a frame of a multiplexed stream."""
+    return data is not None and data.startswith(MULTIPLEX_MARKER)
+
+
+class MultiplexedStream:
+    """A logical MCP session carried by a multiplexed SLIM session.
+
+    Attributes:
+        multiplexer (SLIMMultiplexer): The multiplexer of the SLIM session
+        stream_id (str): Identifier of the stream within the SLIM session
+        accepted (bool): Whether the stream was opened by the other side
+    """
+
+    def __init__(
+        self, multiplexer: "SLIMMultiplexer", stream_id: str, accepted: bool = False
+    ):
+        self.multiplexer = multiplexer
+        self.stream_id = stream_id
+        self.accepted = accepted
+
+        self.read_stream_writer: MemoryObjectSendStream[
+            types.JSONRPCMessage | Exception
+        ]
+        self.read_stream: MemoryObjectReceiveStream[types.JSONRPCMessage | Exception]
+        self.read_stream_writer, self.read_stream = anyio.create_memory_object_stream(
+            STREAM_BUFFER_SIZE
+        )
+        # set once either side ended the stream
+        self.ended = False
+        self._cancel_scope: anyio.CancelScope | None = None
+
+    def end(self, error: Exception | None = None) -> None:
+        """End the stream, once the other side did or the SLIM session is over.
+
+        The MCP session of an accepted stream is cancelled, as an MCP server
+        does not stop when its read stream is closed.
+        """
+        self.ended = True
+        if error is not None:
+            try:
+                self.read_stream_writer.send_nowait(error)
+            except (
+                anyio.WouldBlock,
+                anyio.BrokenResourceError,
+                anyio.ClosedResourceError,
+            ):
+                # the MCP session is busy or already done with the stream
+                pass
+        self.read_stream_writer.close()
+        if self.accepted and self._cancel_scope is not None:
+            self._cancel_scope.cancel()
+
+    @property
+    def id(self) -> str:
+        """Identifier of the stream, unique across SLIM sessions."""
+        return f"{self.multiplexer.session.id}/{self.stream_id}"
+
+
+class _StreamWriter:
+    """Write stream of a multiplexed MCP session.
+
+    Messages are published as they are sent, rather than through a memory
+    stream drained by a task of the session.
+    """
+
+    def __init__(self, stream: MultiplexedStream):
+        self._stream = stream
+
+    async def send(self, message: types.JSONRPCMessage) -> None:
+        if self._stream.ended:
+            raise anyio.ClosedResourceError
+
+        await self._stream.multiplexer.send(
+            self._stream.stream_id, encode_message(message)
+        )
+
+    async def aclose(self) -> None:
+        # the stream is ended once the MCP session is done with it
+        pass
+
+    async def __aenter__(self) -> "_StreamWriter":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+
+class SLIMMultiplexer:
+    """Many MCP sessions sharing one SLIM session.
+
+    Each MCP session is a stream, whose id is carried in the envelope of its
+    messages. A single task dispatches the messages received on the SLIM
+    session to the streams, and the pings of the SLIM session are shared by
+    all of them.
+
+    Attributes:
+        base (SLIMBase): The SLIM client or server the session belongs to
+        session (slim_bindings.PySessionInfo): The shared SLIM session
+        closed (bool): Whether the SLIM session is over
+    """
+
+    def __init__(
+        self,
+        base: "SLIMBase",
+        session: slim_bindings.PySessionInfo,
+        on_stream: Callable[[MultiplexedStream], None] | None = None,
+    ):
+        """Initialize the multiplexer.
+
+        Args:
+            base: The SLIM client or server the session belongs to
+            session: The shared SLIM session
+            on_stream: Called with the streams opened by the other side, None
+                to drop their messages
+        """
+        self.base = base
+        self.session = session
+        self.closed = False
+
+        self._on_stream = on_stream
+        self._streams: dict[str, MultiplexedStream] = {}
+        self._task_group: TaskGroup | None = None
+        self._ids = itertools.count()
+        self._pending_pings: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self._streams)
+
+    def new_stream(self) -> MultiplexedStream:
+        """Open a stream to the other side.
+
+        Raises:
+            ConnectionError: If the SLIM session is over
+        """
+        if self.closed:
+            raise ConnectionError(f"SLIM session {self.session.id} is closed")
+
+        stream = MultiplexedStream(self, str(next(self._ids)))
+        self._streams[stream.stream_id] = stream
+        return stream
+
+    @asynccontextmanager
+    async def streams(self, stream: MultiplexedStream):
+        """Use a stream as the read and write streams of an MCP session.
+
+        The stream is ended on exit.
+
+        Yields:
+            Tuple[MemoryObjectReceiveStream, _StreamWriter]: Streams for reading
+                and writing messages
+        """
+        try:
+            with anyio.CancelScope() as stream._cancel_scope:
+                if stream.ended and stream.accepted:
+                    stream._cancel_scope.cancel()
+                yield stream.read_stream, _StreamWriter(stream)
+        finally:
+            self._streams.pop(stream.stream_id, None)
+            if not stream.ended and not self.closed:
+                stream.ended = True
+                with anyio.CancelScope(shield=True):
+                    await self._send_end(stream)
+            stream.read_stream_writer.close()
+
+    async def send(self, stream_id: str, message: bytes) -> None:
+        """Publish a message of a stream on the SLIM session."""
+        await self.base._send_message(self.session, encode_frame(stream_id, message))
+
+    async def _send_end(self, stream: MultiplexedStream) -> None:
+        """Tell the other side that a stream is over."""
+        try:
+            await self.send(stream.stream_id, b"")
+        except Exception:
+            logger.debug(f"Failed to end stream {stream.id}", exc_info=True)
+
+    async def run(self, first_message: bytes | None = None) -> None:
+        """Dispatch the messages of the SLIM session until it is over.
+
+        Args:
+            first_message: Message already received on the session, if any
+        """
+        error: Exception = ConnectionError(f"SLIM session {self.session.id} is closed")
+        try:
+            async with anyio.create_task_group() as tg:
+                self._task_group = tg
+
+                async def ping():
+                    await self.base._ping(self.session, self._pending_pings)
+                    if len(self._pending_pings) != 0:
+                        logger.info(f"SLIM session {self.session.id} is unresponsive")
+                        tg.cancel_scope.cancel()
+
+                tg.start_soon(ping)
+
+                if first_message is not None:
+                    await self._dispatch(first_message)
+                while True:
+                    _, message = await self.base.slim.receive(session=self.session.id)
+                    await self._dispatch(message)
+        except Exception as exc:
+            logger.error(f"Error receiving on SLIM session {self.session.id}: {exc}")
+            error = exc
+        finally:
+            self.closed = True
+            streams, self._streams = self._streams, {}
+            for stream in streams.values():
+                try:
+                    stream.end(error)
+                except Exception:
+                    logger.debug(f"Failed to end stream {stream.id}", exc_info=True)
+
+    async def _dispatch(self, data: bytes) -> None:
+        try:
+            stream_id, message = decode_frame(data)
+        except ValueError:
+            # a malformed frame must not end the other streams
+            logger.error(
+                f"Dropping malformed frame on SLIM session {self.session.id}",
+                exc_info=True,
+            )
+            return
+
+        if stream_id is None:
+            await self._control(message)
+            return
+
+        stream = self._streams.get(stream_id)
+        if not message:
+            # the other side ended the stream
+            if stream is not None:
+                stream.end()
+            return
+
+        if stream is None:
+            if self._on_stream is None:
+                logger.debug(f"Dropping message of unknown stream {stream_id}")
+                return
+            stream = MultiplexedStream(self, stream_id, accepted=True)
+            self._streams[stream_id] = stream
+            self._on_stream(stream)
+
+        try:
+            parsed = decode_message(message)
+        except Exception as exc:
+            logger.error(f"Invalid message on stream {stream.id}", exc_info=True)
+            self._deliver(stream, exc)
+            return
+
+        self._deliver(stream, parsed)
+
+    def _deliver(
+        self, stream: MultiplexedStream, item: types.JSONRPCMessage | Exception
+    ) -> None:
+        """Hand a message to a stream, without waiting on its MCP session."""
+        try:
+            stream.read_stream_writer.send_nowait(item)
+        except (anyio.BrokenResourceError, anyio.ClosedResourceError):
+            # the MCP session is gone, its stream ends on its own
+            pass
+        except anyio.WouldBlock:
+            # waiting would hold back every other stream of the SLIM session
+            logger.error(
+                f"Ending stream {stream.id}, "
+                f"{STREAM_BUFFER_SIZE} messages are waiting for its MCP session"
+            )
+            stream.end()
+            if self._task_group is not None:
+                self._task_group.start_soon(self._send_end, stream)
+
+    async def _control(self, message: bytes) -> None:
+        try:
+            parsed = decode_message(message)
+        except Exception:
+            logger.error(
+                f"Dropping invalid message of SLIM session {self.session.id}",
+                exc_info=True,
+            )
+            return
+
+        if self.base._filter_message(self.session, parsed, self._pending_pings):
+            return
+
+        request = parsed.root
+        if isinstance(request, types.JSONRPCRequest) and request.method == "ping":
+            # pings of the SLIM session are answered once for all the streams
+            response = types.JSONRPCMessage(
+                root=types.JSONRPCResponse(jsonrpc="2.0", id=request.id, result={})
+            )
+            await self.base._send_message(self.session, encode_message(response))
+            return
+
+        logger.debug(f"Dropping {type(request).__name__} of SLIM session")
+
+
+async def run_multiplexer(
+    base: "SLIMBase", multiplexer: SLIMMultiplexer, first_message: bytes | None = None
+) -> None:
+    """Run a multiplexer, then delete its SLIM session."""
+    try:
+        await multiplexer.run(first_message)
+    finally:
+        logger.info(f"Closing multiplexed session: {multiplexer.session.id}")
+        with anyio.CancelScope(shield=True):
+            try:
+                await base.slim.delete_session(multiplexer.session.id)
+            except Exception:
+                logger.debug("Failed to delete SLIM session", exc_info=True)
@@ -10,7 +10,14 @@ import sys
 import slim_bindings
 import mcp.types as types
 
+from slim_mcp.codec import encode_message
 from slim_mcp.common import SLIMBase
+from slim_mcp.multiplex import (
+    MultiplexedStream,
+    SLIMMultiplexer,
+    is_frame,
+    run_multiplexer,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +34,7 @@ class SLIMServer(SLIMBase):
         local_agent: str,
         message_timeout: datetime.timedelta = datetime.timedelta(seconds=15),
         message_retries: int = 2,
+        multiplex: bool = False,
     ):
         """
         SLIM transport Server for MCP (Model Context Protocol) communication.
@@ -39,6 +47,10 @@ class SLIMServer(SLIMBase):
             local_organization (str): Identifier for the organization running this server.
             local_namespace (str): Logical grouping identifier for resources in the local organization.
             local_agent (str): Identifier for this server instance.
+            multiplex (bool): Also accept clients multiplexing many MCP sessions
+                over one SLIM session. Each of their MCP sessions is returned by
+                the iterator as a MultiplexedStream, to pass to new_streams()
+                like any session.
 
         Note:
             This server should be used with a context manager (with statement) to ensure
@@ -52,6 +64,10 @@ class SLIMServer(SLIMBase):
             local_agent,
         )
 
+        self.multiplex = multiplex
+        self._accepted: asyncio.Queue | None = None
+        self._tasks: set[asyncio.Task] = set()
+
     async def _send_message(
         self,
         session: slim_bindings.PySessionInfo,
@@ -109,8 +125,7 @@ class SLIMServer(SLIMBase):
             message = types.JSONRPCMessage(
                 root=types.JSONRPCRequest(jsonrpc="2.0", id=id, method="ping")
             )
-            json = message.model_dump_json(by_alias=True, exclude_none=True)
-            await self._send_message(session, json.encode())
+            await self._send_message(session, encode_message(message))
             await asyncio.sleep(PING_INTERVAL)
 
     def __aiter__(self):
@@ -137,10 +152,59 @@ class SLIMServer(SLIMBase):
         and receives the next session from the SLIM.
 
         Returns:
-            slim_bindings.PySessionInfo: The received session.
+            slim_bindings.PySessionInfo | MultiplexedStream: The received session.
         """
 
-        session, _ = await self.slim.receive()
-        logger.debug(f"Received session: {session.id}")
+        if not self.multiplex:
+            session, _ = await self.slim.receive()
+            logger.debug(f"Received session: {session.id}")
+
+            return session
+
+        if self._accepted is None:
+            self._accepted = asyncio.Queue()
+            self._spawn(self._accept())
+
+        return await self._accepted.get()
 
-        return session
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        tasks, self._tasks = self._tasks, set()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._accepted = None
+
+        await super().__aexit__(exc_type, exc_value, traceback)
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _accept(self):
+        while True:
+            session, _ = await self.slim.receive()
+            logger.debug(f"Received session: {session.id}")
+            self._spawn(self._route(session))
+
+    async def _route(self, session: slim_bindings.PySessionInfo):
+        # the first message tells multiplexed sessions from plain ones
+        try:
+            _, first_message = await self.slim.receive(session=session.id)
+        except Exception:
+            logger.error(f"Error receiving on session {session.id}", exc_info=True)
+            return
+
+        if not is_frame(first_message):
+            self._first_messages[session.id] = first_message
+            await self._accepted.put(session)
+            return
+
+        logger.debug(f"Session {session.id} is multiplexed")
+
+        def on_stream(stream: MultiplexedStream):
+            logger.debug(f"Received stream: {stream.id}")
+            self._accepted.put_nowait(stream)
+
+        multiplexer = SLIMMultiplexer(self, session, on_stream=on_stream)
+        await run_multiplexer(self, multiplexer, first_message)
@@ -0,0 +1,163 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+from collections import Counter
+from contextlib import asynccontextmanager
+
+import anyio
+import mcp.types as types
+import pytest
+from mcp.server.lowlevel import Server
+from mcp.shared.memory import create_client_server_memory_streams
+
+from slim_mcp import CachingClientSession, ToolCache
+
+TEST_SERVER = "org/default/mcp1"
+
+
+@pytest.fixture
+def calls() -> Counter:
+    return Counter()
+
+
+@pytest.fixture
+def mcp_app(calls: Counter) -> Server:
+    """Create an MCP server counting the requests it handles."""
+    app: Server = Server("example-server")
+
+    def tool(name: str, **annotations) -> types.Tool:
+        return types.Tool(
+            name=name,
+            inputSchema={"type": "object"},
+            annotations=annotations or None,
+        )
+
+    @app.list_tools()
+    async def list_tools() -> list[types.Tool]:
+        calls["list_tools"] += 1
+        return [
+            tool("lookup", readOnlyHint=True, openWorldHint=False),
+            tool("fetch", readOnlyHint=True),
+            tool("search", readOnlyHint=True, openWorldHint=True),
+            tool("update", idempotentHint=True, openWorldHint=False),
+            tool("now"),
+            tool("fail", readOnlyHint=True, openWorldHint=False),
+        ]
+
+    @app.call_tool()
+    async def call_tool(name: str, arguments: dict) -> list[types.TextContent]:
+        calls[name] += 1
+        if name == "fail":
+            raise ValueError("failed")
+        return [types.TextContent(type="text", text=f"{name} {calls[name]}")]
+
+    return app
+
+
+@asynccontextmanager
+async def connect(mcp_app: Server, cache: ToolCache):
+    async with create_client_server_memory_streams() as (client, server):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(
+                mcp_app.run,
+                server[0],
+                server[1],
+                mcp_app.create_initialization_options(),
+            )
+            async with CachingClientSession(
+                client[0], client[1], cache=cache, server=TEST_SERVER
+            ) as session:
+                await session.initialize()
+                yield session
+            tg.cancel_scope.cancel()
+
+
+def text(result: types.CallToolResult) -> str:
+    return result.content[0].text
+
+
+@pytest.mark.asyncio
+async def test_tool_results_follow_server_hints(mcp_app, calls):
+    cache = ToolCache()
+
+    async with connect(mcp_app, cache) as session:
+        first = await session.call_tool("lookup", {"a": 1, "b": [1, 2]})
+        again = await session.call_tool("lookup", {"b": [1, 2], "a": 1})
+        other = await session.call_tool("lookup", {"a": 2})
+        assert (text(first), text(again), text(other)) == (
+            "lookup 1",
+            "lookup 1",
+            "lookup 2",
+        )
+
+        # open world, possibly by default, or idempotent but destructive by default
+        for name in ("now", "fetch", "search", "update"):
+            await session.call_tool(name)
+            assert text(await session.call_tool(name)) == f"{name} 2"
+
+        # errors are not cached
+        for _ in range(2):
+            assert (await session.call_tool("fail")).isError
+        assert calls["fail"] == 2
+
+    assert calls["list_tools"] == 1
+    assert len(cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_tool_ttls_override_hints_and_lru_bound(mcp_app, calls):
+    cache = ToolCache(maxsize=2, tool_ttls={"now": 0.2, "lookup": 0})
+
+    async with connect(mcp_app, cache) as session:
+        await session.call_tool("now", {"city": "Rome"})
+        assert text(await session.call_tool("now", {"city": "Rome"})) == "now 1"
+        await session.call_tool("lookup")
+        assert text(await session.call_tool("lookup")) == "lookup 2"
+
+        await session.call_tool("now", {"city": "Paris"})
+        await session.call_tool("now", {"city": "Oslo"})
+        # the least recently used result was evicted
+        assert text(await session.call_tool("now", {"city": "Rome"})) == "now 4"
+
+        await asyncio.sleep(0.3)
+        assert text(await session.call_tool("now", {"city": "Rome"})) == "now 5"
+
+        results = await asyncio.gather(
+            *(session.call_tool("now", {"city": "Lima"}) for _ in range(5))
+        )
+        # concurrent calls share one request
+        assert {text(r) for r in results} == {"now 6"}
+
+    # hints are not needed with explicit ttls
+    assert calls["list_tools"] == 0
+
+
+@pytest.mark.asyncio
+async def test_stale_listing_is_refreshed_in_background(mcp_app, calls):
+    cache = ToolCache(listing_ttl=0.1)
+
+    async with connect(mcp_app, cache) as session:
+        tools = await session.list_tools()
+        assert await session.list_tools() is tools
+        assert calls["list_tools"] == 1
+
+    # the snapshot is shared by the next sessions
+    async with connect(mcp_app, cache) as session:
+        assert await session.list_tools() is tools
+
+        await asyncio.sleep(0.2)
+        assert await session.list_tools() is tools
+        await asyncio.sleep(0.1)
+        assert calls["list_tools"] == 2
+        assert await session.list_tools() is not tools
+
+        await session._received_notification(
+            types.ServerNotification(
+                types.ToolListChangedNotification(
+                    method="notifications/tools/list_changed"
+                )
+            )
+        )
+        await session.list_tools()
+        assert calls["list_tools"] == 3
@@ -9,7 +9,7 @@ import mcp.types as types
 import pytest
 from mcp.server.lowlevel import Server
 
-from slim_mcp import SLIMClient, SLIMServer
+from slim_mcp import SLIMClient, SLIMServer, ToolCache
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -287,3 +287,101 @@ async def test_mcp_client_server_reconnection(server, mcp_app):
                 await handler_task
             except asyncio.CancelledError:
                 pass
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("server", ["127.0.0.1:12347"], indirect=True)
+async def test_mcp_client_cache(server, mcp_app):
+    """Test that the sessions of a client share its cache."""
+    config = get_test_config(12347)
+
+    async with (
+        SLIMServer(config, TEST_ORG, TEST_NS, TEST_MCP_SERVER) as slim_server,
+        SLIMClient(
+            config,
+            TEST_ORG,
+            TEST_NS,
+            TEST_CLIENT_ID,
+            TEST_ORG,
+            TEST_NS,
+            TEST_MCP_SERVER,
+            cache=ToolCache(),
+        ) as slim_client,
+    ):
+        handler_task = asyncio.create_task(handle_sessions(mcp_app, slim_server))
+
+        try:
+            async with slim_client.to_mcp_session() as mcp_session:
+                await mcp_session.initialize()
+                tools = await mcp_session.list_tools()
+                assert [tool.name for tool in tools.tools] == ["example"]
+
+            async with slim_client.to_mcp_session() as mcp_session:
+                await mcp_session.initialize()
+                assert await mcp_session.list_tools() is tools
+        finally:
+            handler_task.cancel()
+            try:
+                await handler_task
+            except asyncio.CancelledError:
+                pass
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("server", ["127.0.0.1:12348"], indirect=True)
+async def test_mcp_client_server_multiplexing(server, mcp_app):
+    """Test many MCP sessions sharing one SLIM session."""
+    config = get_test_config(12348)
+
+    async with (
+        SLIMServer(
+            config, TEST_ORG, TEST_NS, TEST_MCP_SERVER, multiplex=True
+        ) as slim_server,
+        SLIMClient(
+            config,
+            TEST_ORG,
+            TEST_NS,
+            TEST_CLIENT_ID,
+            TEST_ORG,
+            TEST_NS,
+            TEST_MCP_SERVER,
+            multiplex=True,
+        ) as slim_client,
+        SLIMClient(
+            config,
+            TEST_ORG,
+            TEST_NS,
+            "client2",
+            TEST_ORG,
+            TEST_NS,
+            TEST_MCP_SERVER,
+        ) as plain_client,
+    ):
+        handler_task = asyncio.create_task(handle_sessions(mcp_app, slim_server))
+
+        async def list_tools(client):
+            async with client.to_mcp_session() as mcp_session:
+                await mcp_session.initialize()
+                tools = await mcp_session.list_tools()
+                return [tool.name for tool in tools.tools]
+
+        try:
+            results = await asyncio.gather(
+                *(list_tools(slim_client) for _ in range(20))
+            )
+            assert results == [["example"]] * 20
+
+            # one SLIM session carried all the MCP sessions
+            multiplexer = slim_client._multiplexer
+            assert len(multiplexer) == 0
+            assert await list_tools(slim_client) == ["example"]
+            assert slim_client._multiplexer is multiplexer
+
+            # clients that do not multiplex are still served
+            assert await list_tools(plain_client) == ["example"]
+        finally:
+            handler_task.cancel()
+            try:
+                await handler_task
+            except asyncio.CancelledError:
+                pass
@@ -0,0 +1,30 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import mcp.types as types
+import pydantic
+import pytest
+
+from slim_mcp.codec import decode_message, encode_message
+
+
+def test_messages_round_trip_as_bytes():
+    message = types.JSONRPCMessage(
+        types.JSONRPCRequest(
+            jsonrpc="2.0",
+            id=1,
+            method="tools/call",
+            params={"name": "convert", "arguments": {"city": "Zürich"}},
+        )
+    )
+
+    data = encode_message(message)
+    assert isinstance(data, bytes)
+    # same wire format as before
+    assert data == message.model_dump_json(by_alias=True, exclude_none=True).encode()
+    assert decode_message(data) == message
+
+
+def test_invalid_message_is_rejected():
+    with pytest.raises(pydantic.ValidationError):
+        decode_message(b'{"jsonrpc": "2.0", "id": 1}')
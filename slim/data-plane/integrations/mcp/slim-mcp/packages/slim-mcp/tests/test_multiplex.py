@@ -0,0 +1,82 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+from types import SimpleNamespace
+
+import anyio
+import mcp.types as types
+import pytest
+
+from slim_mcp.codec import encode_message
+from slim_mcp.multiplex import STREAM_BUFFER_SIZE, SLIMMultiplexer, encode_frame
+
+
+class _ClosedSlim:
+    async def receive(self, session=None):
+        raise ConnectionError("SLIM session is gone")
+
+
+class _ReplaySlim:
+    def __init__(self, messages):
+        self._messages = list(messages)
+
+    async def receive(self, session=None):
+        if not self._messages:
+            raise ConnectionError("SLIM session is gone")
+        return None, self._messages.pop(0)
+
+
+async def _no_ping(session, pending_pings):
+    pass
+
+
+def _ping_request(id: int) -> bytes:
+    return encode_message(
+        types.JSONRPCMessage(types.JSONRPCRequest(jsonrpc="2.0", id=id, method="ping"))
+    )
+
+
+@pytest.mark.asyncio
+async def test_all_streams_end_with_the_session():
+    base = SimpleNamespace(slim=_ClosedSlim(), _ping=_no_ping)
+    multiplexer = SLIMMultiplexer(base, SimpleNamespace(id=1))
+    done = multiplexer.new_stream()
+    waiting = multiplexer.new_stream()
+    # the MCP session of the first stream is already over
+    await done.read_stream.aclose()
+
+    await multiplexer.run()
+
+    assert multiplexer.closed
+    assert done.ended and waiting.ended
+    assert isinstance(await waiting.read_stream.receive(), Exception)
+    with pytest.raises(anyio.EndOfStream):
+        await waiting.read_stream.receive()
+
+
+@pytest.mark.asyncio
+async def test_slow_stream_does_not_hold_back_the_others():
+    messages = [
+        *(encode_frame("0", _ping_request(i)) for i in range(STREAM_BUFFER_SIZE + 1)),
+        encode_frame("1", _ping_request(0)),
+    ]
+    sent = []
+
+    async def send_message(session, message):
+        sent.append(message)
+
+    base = SimpleNamespace(
+        slim=_ReplaySlim(messages), _ping=_no_ping, _send_message=send_message
+    )
+    multiplexer = SLIMMultiplexer(base, SimpleNamespace(id=1))
+    slow = multiplexer.new_stream()
+    fast = multiplexer.new_stream()
+
+    # a malformed frame is dropped, the slow stream is ended once its buffer is
+    # full, and the other stream still gets its message
+    with anyio.fail_after(1):
+        await multiplexer.run(first_message=b"\x1e0")
+
+    assert slow.ended
+    assert encode_frame("0", b"") in sent
+    assert isinstance(await fast.read_stream.receive(), types.JSONRPCMessage)
@@ -3,10 +3,13 @@
 
 import asyncio
 import datetime
-from typing import Optional
+import itertools
+import time
+from enum import Enum
+from typing import Optional, Union
 
 from ._slim_bindings import (  # type: ignore[attr-defined]
-    SESSION_UNSPECIFIED,
+    SESSION_UNSPECIFIED as SESSION_UNSPECIFIED,
     PyAgentType,
     PyIdentityProvider,
     PyIdentityVerifier,
@@ -26,7 +29,8 @@ from ._slim_bindings import (  # type: ignore[attr-defined]
     get_session_config,
     invite,
     publish,
-    receive,
+    publish_many,
+    receive_many,
     remove_route,
     run_server,
     set_default_session_config,
@@ -39,6 +43,9 @@ from ._slim_bindings import (  # type: ignore[attr-defined]
 from ._slim_bindings import (
     PyAlgorithm as PyAlgorithm,
 )
+from ._slim_bindings import (
+    receive as receive,
+)
 from ._slim_bindings import (
     PyKey as PyKey,
 )
@@ -134,6 +141,342 @@ class SLIMTimeoutError(TimeoutError):
         )
 
 
+class SLIMSessionOverflowError(Exception):
+    """
+    Exception raised when messages were discarded because a session queue was full.
+
+    This exception is delivered to the receiver of a session configured with the
+    ``SessionOverflowPolicy.ERROR`` policy, on the first receive after the overflow.
+
+    Attributes:
+        session_id (int): The identifier of the session that overflowed.
+        dropped (int): The number of messages discarded since the last receive.
+    """
+
+    def __init__(self, session_id: int, dropped: int):
+        self.session_id = session_id
+        self.dropped = dropped
+        super().__init__(
+            f"session {session_id} queue is full, {dropped} message(s) dropped"
+        )
+
+
+class SessionOverflowPolicy(Enum):
+    """
+    Policy applied when a message arrives for a session whose queue is full.
+
+    BLOCK: wait until the application consumes a message (backpressure). The
+        messages of all sessions are received by a single loop, so a full
+        session queue holds back every other session until it has room.
+    DROP_OLDEST: discard the oldest queued message to make room.
+    ERROR: discard the incoming message and raise SLIMSessionOverflowError
+        on the next receive for that session.
+    """
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    ERROR = "error"
+
+
+class PublishPolicy(Enum):
+    """
+    How the connection a message is published on is picked, when several
+    connections have a route to the destination.
+
+    ROUTE: leave it to the routing table of the service.
+    ROUND_ROBIN: rotate over the connections routing to the destination.
+    HASH: pick one by session and destination, so that the messages of a
+        session towards a destination keep their order.
+    """
+
+    ROUTE = "route"
+    ROUND_ROBIN = "round_robin"
+    HASH = "hash"
+
+
+# Default bound of the per-session queues
+DEFAULT_SESSION_QUEUE_SIZE = 1024
+
+# Default idle time after which sessions opened by remote agents are forgotten,
+# None as a session may legitimately stay silent while its request is handled
+DEFAULT_IDLE_SESSION_TIMEOUT: Optional[datetime.timedelta] = None
+
+# Default maximum number of messages fetched from the service per wakeup
+DEFAULT_RECEIVE_BATCH_SIZE = 128
+
+# Maximum number of destination names kept by a Slim instance for reuse
+MAX_CACHED_AGENT_NAMES = 1024
+
+
+class _SessionEntry:
+    __slots__ = (
+        "info",
+        "queue",
+        "local",
+        "last_activity",
+        "receivers",
+        "overflowed",
+        "stashed",
+    )
+
+    def __init__(self, info: Optional[PySessionInfo], queue_size: int, local: bool):
+        self.info = info
+        self.queue: asyncio.Queue = asyncio.Queue(queue_size)
+        # sessions created by the local app are only removed by delete_session
+        self.local = local
+        self.last_activity = time.monotonic()
+        self.receivers = 0
+        self.overflowed = 0
+        # error held back by get_many to deliver the messages preceding it first
+        self.stashed: Optional[Exception] = None
+
+
+class SessionDispatcher:
+    """
+    Demultiplex messages received from the SLIM service into per-session queues.
+
+    New sessions opened by remote agents are announced once on the new-session
+    queue (see Slim.receive() without a session ID), while their messages are
+    only delivered to the per-session queue. The new-session queue is unbounded,
+    so that the overflow policy only applies to messages. Sessions opened by remote agents
+    can be forgotten after nothing was sent nor received on them for idle_timeout,
+    unless a receiver is waiting on them or they still hold undelivered messages.
+
+    Attributes:
+        dropped (int): Messages discarded because of a full queue.
+        backpressured (int): Messages that had to wait for room in a full queue.
+        reaped (int): Idle sessions removed from the dispatcher.
+    """
+
+    def __init__(
+        self,
+        queue_size: int = DEFAULT_SESSION_QUEUE_SIZE,
+        overflow_policy: SessionOverflowPolicy = SessionOverflowPolicy.BLOCK,
+        idle_timeout: Optional[datetime.timedelta] = DEFAULT_IDLE_SESSION_TIMEOUT,
+    ):
+        """
+        Args:
+            queue_size (int): The bound of the per-session queues. 0 means unbounded.
+            overflow_policy (SessionOverflowPolicy): What to do when a queue is full.
+            idle_timeout (datetime.timedelta): Time without sending nor receiving
+                after which sessions opened by remote agents are removed. None,
+                the default, disables reaping.
+        """
+
+        self.queue_size = queue_size
+        self.overflow_policy = SessionOverflowPolicy(overflow_policy)
+        self.idle_timeout = idle_timeout
+
+        self._sessions: dict[int, _SessionEntry] = {}
+        # announcements are never dropped, nor hold back the other sessions
+        self._new_sessions = _SessionEntry(None, 0, local=True)
+
+        self.dropped = 0
+        self.backpressured = 0
+        self.reaped = 0
+
+    def __contains__(self, session_id: int) -> bool:
+        return session_id in self._sessions
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def add(
+        self,
+        session_info: PySessionInfo,
+        queue_size: Optional[int] = None,
+        local: bool = True,
+    ):
+        """
+        Register a session.
+
+        Args:
+            session_info (PySessionInfo): The session to register.
+            queue_size (int): Optional bound overriding the dispatcher default.
+            local (bool): Whether the session was created by the local app.
+        """
+
+        self._sessions[session_info.id] = _SessionEntry(
+            session_info,
+            self.queue_size if queue_size is None else queue_size,
+            local,
+        )
+
+    def touch(self, session_id: int):
+        """
+        Record activity on a session, e.g. a message sent on it, so that it is not
+        reaped while in use.
+        """
+
+        entry = self._sessions.get(session_id)
+        if entry is not None:
+            entry.last_activity = time.monotonic()
+
+    def remove(self, session_id: int):
+        """
+        Unregister a session.
+
+        Raises:
+            ValueError: If the session ID is not found.
+        """
+
+        if self._sessions.pop(session_id, None) is None:
+            raise ValueError(f"session not found: {session_id}")
+
+    async def dispatch(self, session_info: PySessionInfo, msg: bytes):
+        """
+        Deliver a message to the queue of its session, registering the session
+        and announcing it on the new-session queue if it is unknown.
+        """
+
+        entry = self._sessions.get(session_info.id)
+        if entry is None:
+            entry = _SessionEntry(session_info, self.queue_size, local=False)
+            self._sessions[session_info.id] = entry
+
+            # announce the new session, the message itself goes to the session queue
+            self._new_sessions.queue.put_nowait((session_info, None))
+            self._new_sessions.last_activity = time.monotonic()
+
+        await self._put(entry, (session_info, msg))
+
+    async def dispatch_error(self, session_id: int, err: Exception) -> bool:
+        """
+        Deliver an error to the queue of a session.
+
+        Returns:
+            bool: False if the session is unknown.
+        """
+
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            return False
+
+        await self._put(entry, err)
+        return True
+
+    async def get(
+        self, session_id: Optional[int] = None
+    ) -> Union[tuple[PySessionInfo, Optional[bytes]], Exception]:
+        """
+        Wait for the next item of a session, or for a new session if session_id is None.
+
+        Raises:
+            ValueError: If the session ID is not found.
+            SLIMSessionOverflowError: If messages were dropped with the ERROR policy.
+        """
+
+        entry = self._entry(session_id)
+
+        if entry.stashed is not None:
+            err, entry.stashed = entry.stashed, None
+            return err
+
+        entry.receivers += 1
+        try:
+            return await entry.queue.get()
+        finally:
+            entry.receivers -= 1
+            entry.last_activity = time.monotonic()
+
+    async def get_many(
+        self, session_id: int, max_messages: int
+    ) -> Union[list[tuple[PySessionInfo, bytes]], Exception]:
+        """
+        Wait for the next message of a session, then return it together with
+        the messages already queued, up to max_messages. An error queued after
+        some messages is held back and returned by the next get or get_many.
+
+        Raises:
+            ValueError: If the session ID is not found.
+            SLIMSessionOverflowError: If messages were dropped with the ERROR policy.
+        """
+
+        if max_messages < 1:
+            raise ValueError("max_messages must be greater than 0")
+
+        first = await self.get(session_id)
+        if isinstance(first, Exception):
+            return first
+
+        entry = self._sessions.get(session_id)
+        batch = [first]
+        while entry is not None and len(batch) < max_messages:
+            try:
+                item = entry.queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+
+            if isinstance(item, Exception):
+                entry.stashed = item
+                break
+
+            batch.append(item)
+
+        return batch
+
+    def _entry(self, session_id: Optional[int]) -> _SessionEntry:
+        if session_id is None:
+            entry = self._new_sessions
+        else:
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                raise ValueError(f"session not found: {session_id}")
+
+        if entry.overflowed:
+            dropped, entry.overflowed = entry.overflowed, 0
+            raise SLIMSessionOverflowError(session_id, dropped)
+
+        return entry
+
+    def reap_idle(self) -> list[int]:
+        """
+        Remove the sessions opened by remote agents on which nothing was sent
+        nor received for longer than idle_timeout.
+
+        Returns:
+            list[int]: The IDs of the removed sessions.
+        """
+
+        if self.idle_timeout is None:
+            return []
+
+        deadline = time.monotonic() - self.idle_timeout.total_seconds()
+        idle = [
+            session_id
+            for session_id, entry in self._sessions.items()
+            if not entry.local
+            and entry.receivers == 0
+            and entry.queue.empty()
+            and entry.stashed is None
+            and entry.last_activity <= deadline
+        ]
+
+        for session_id in idle:
+            del self._sessions[session_id]
+
+        self.reaped += len(idle)
+        return idle
+
+    async def _put(self, entry: _SessionEntry, item):
+        entry.last_activity = time.monotonic()
+
+        if not entry.queue.full():
+            entry.queue.put_nowait(item)
+            return
+
+        if self.overflow_policy == SessionOverflowPolicy.BLOCK:
+            self.backpressured += 1
+            await entry.queue.put(item)
+        elif self.overflow_policy == SessionOverflowPolicy.DROP_OLDEST:
+            entry.queue.get_nowait()
+            entry.queue.put_nowait(item)
+            self.dropped += 1
+        else:
+            entry.overflowed += 1
+            self.dropped += 1
+
+
 class Slim:
     def __init__(
         self,
@@ -141,6 +484,13 @@ class Slim:
         organization: str,
         namespace: str,
         agent: str,
+        queue_size: int = DEFAULT_SESSION_QUEUE_SIZE,
+        overflow_policy: SessionOverflowPolicy = SessionOverflowPolicy.BLOCK,
+        idle_session_timeout: Optional[
+            datetime.timedelta
+        ] = DEFAULT_IDLE_SESSION_TIMEOUT,
+        receive_batch_size: int = DEFAULT_RECEIVE_BATCH_SIZE,
+        publish_policy: PublishPolicy = PublishPolicy.ROUTE,
     ):
         """
         Initialize a new SLIM instance. A SLIM instance is associated with a single
@@ -152,22 +502,44 @@ class Slim:
             organization (str): The organization of the agent.
             namespace (str): The namespace of the agent.
             agent (str): The name of the agent.
+            queue_size (int): The default bound of the per-session queues. 0 means unbounded.
+            overflow_policy (SessionOverflowPolicy): What to do when a session queue
+                is full. BLOCK holds back the messages of every session meanwhile.
+            idle_session_timeout (datetime.timedelta): Time without sending nor
+                receiving after which sessions opened by remote agents are
+                forgotten. None, the default, disables reaping.
+            receive_batch_size (int): Maximum number of messages fetched from the
+                service on each wakeup of the receiver loop.
+            publish_policy (PublishPolicy): How publishes are spread over the
+                connections that have a route to their destination.
         """
 
         # Initialize service
         self.svc = svc
 
-        # Create sessions map
-        self.sessions: dict[int, tuple[Optional[PySessionInfo], asyncio.Queue]] = {
-            SESSION_UNSPECIFIED: (None, asyncio.Queue()),
-        }
+        # Create the session dispatcher
+        self.dispatcher = SessionDispatcher(
+            queue_size=queue_size,
+            overflow_policy=overflow_policy,
+            idle_timeout=idle_session_timeout,
+        )
+        self.receive_batch_size = receive_batch_size
+
+        # Destination names, reused across publishes
+        self._agent_names: dict[tuple[str, str, str], PyAgentType] = {}
 
         # Save local names
         self.local_name = PyAgentType(organization, namespace, agent)
         self.local_id = self.svc.id
 
-        # Create connection ID map
+        # Create connection ID map, conn_id is the default connection
         self.conn_ids: dict[str, int] = {}
+        self.conn_id: Optional[int] = None
+
+        # Connections each route was set on, to spread publishes over them
+        self.publish_policy = publish_policy
+        self._route_conns: dict[tuple[str, str, str, Optional[int]], list[int]] = {}
+        self._publish_counter = itertools.count()
 
     async def __aenter__(self):
         """
@@ -185,6 +557,12 @@ class Slim:
 
         # Run receiver loop in the background
         self.task = asyncio.create_task(self._receive_loop())
+
+        # Periodically forget idle sessions
+        self.reaper_task = None
+        if self.dispatcher.idle_timeout is not None:
+            self.reaper_task = asyncio.create_task(self._reap_loop())
+
         return self
 
     async def __aexit__(self, exc_type, exc_value, traceback):
@@ -201,14 +579,17 @@ class Slim:
             None
         """
 
-        # Cancel the receiver loop task
-        self.task.cancel()
+        # Cancel the receiver and reaper tasks
+        tasks = [t for t in (self.task, self.reaper_task) if t is not None]
+        for task in tasks:
+            task.cancel()
 
-        # Wait for the task to finish
-        try:
-            await self.task
-        except asyncio.CancelledError:
-            pass
+        # Wait for the tasks to finish
+        for task in tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
 
     @classmethod
     async def new(
@@ -218,6 +599,7 @@ class Slim:
         agent: str,
         provider: PyIdentityProvider,
         verifier: PyIdentityVerifier,
+        **kwargs,
     ) -> "Slim":
         """
         Create a new SLIM instance. A SLIM instamce is associated to one single
@@ -229,6 +611,7 @@ class Slim:
             namespace (str): The namespace of the agent.
             agent (str): The name of the agent.
             agent_id (int): The ID of the agent. If not provided, a new ID will be created.
+            kwargs: Session dispatching options, see Slim.__init__.
 
         Returns:
             Slim: A new SLIM instance
@@ -239,6 +622,7 @@ class Slim:
             organization,
             namespace,
             agent,
+            **kwargs,
         )
 
     def get_agent_id(self) -> int:
@@ -257,7 +641,7 @@ class Slim:
     async def create_session(
         self,
         session_config: PySessionConfiguration,
-        queue_size: int = 0,
+        queue_size: Optional[int] = None,
     ) -> PySessionInfo:
         """
         Create a new streaming session.
@@ -265,6 +649,7 @@ class Slim:
         Args:
             session_config (PySessionConfiguration): The session configuration.
             queue_size (int): The size of the queue for the session.
+                                If None, the default size of the instance is used.
                                 If 0, the queue will be unbounded.
                                 If a positive integer, the queue will be bounded to that size.
 
@@ -273,7 +658,7 @@ class Slim:
         """
 
         session = await create_session(self.svc, session_config)
-        self.sessions[session.id] = (session, asyncio.Queue(queue_size))
+        self.dispatcher.add(session, queue_size)
         return session
 
     async def delete_session(self, session_id: int):
@@ -290,12 +675,8 @@ class Slim:
             ValueError: If the session ID is not found.
         """
 
-        # Check if the session ID is in the sessions map
-        if session_id not in self.sessions:
-            raise ValueError(f"session not found: {session_id}")
-
-        # Remove the session from the map
-        del self.sessions[session_id]
+        # Remove the session from the dispatcher
+        self.dispatcher.remove(session_id)
 
         # Remove the session from SLIM
         await delete_session(self.svc, session_id)
@@ -319,8 +700,8 @@ class Slim:
             ValueError: If the session ID is not found.
         """
 
-        # Check if the session ID is in the sessions map
-        if session_id not in self.sessions:
+        # Check if the session ID is in the dispatcher
+        if session_id not in self.dispatcher:
             raise ValueError(f"session not found: {session_id}")
 
         # Set the session configuration
@@ -343,8 +724,8 @@ class Slim:
             ValueError: If the session ID is not found.
         """
 
-        # Check if the session ID is in the sessions map
-        if session_id not in self.sessions:
+        # Check if the session ID is in the dispatcher
+        if session_id not in self.dispatcher:
             raise ValueError(f"session not found: {session_id}")
 
         # Get the session configuration
@@ -409,13 +790,17 @@ class Slim:
 
         await stop_server(self.svc, endpoint)
 
-    async def connect(self, client_config: dict) -> int:
+    async def connect(self, client_config: dict, default: bool = False) -> int:
         """
         Connect to a remote SLIM service.
         This function will block until the connection is established.
+        Several connections can be open at the same time, e.g. to different
+        SLIM nodes. The first one is the default connection.
 
         Args:
-            None
+            client_config (dict): The client configuration.
+            default (bool): Make this connection the default one, used by the
+                methods called without an explicit connection.
 
         Returns:
             int: The connection ID.
@@ -428,9 +813,8 @@ class Slim:
 
         # Save the connection ID
         self.conn_ids[client_config["endpoint"]] = conn_id
-
-        # For the moment we manage one connection only
-        self.conn_id = conn_id
+        if self.conn_id is None or default:
+            self.conn_id = conn_id
 
         # Subscribe to the local name
         await subscribe(self.svc, conn_id, self.local_name, self.local_id)
@@ -442,42 +826,67 @@ class Slim:
         """
         Disconnect from a remote SLIM service.
         This function will block until the disconnection is complete.
+        The routes set on the connection are forgotten and, if it was the
+        default connection, another open connection becomes the default.
 
         Args:
-            None
+            endpoint (str): The endpoint the connection was opened to.
 
         Returns:
             None
 
         """
-        conn = self.conn_ids[endpoint]
+        conn = self.conn_ids.pop(endpoint)
         await disconnect(self.svc, conn)
 
+        for key, conns in list(self._route_conns.items()):
+            if conn in conns:
+                conns.remove(conn)
+                if not conns:
+                    del self._route_conns[key]
+
+        if self.conn_id == conn:
+            self.conn_id = next(iter(self.conn_ids.values()), None)
+
     async def set_route(
         self,
         organization: str,
         namespace: str,
         agent: str,
         id: Optional[int] = None,
+        conn_id: Optional[int] = None,
     ):
         """
         Set route for outgoing messages via the connected SLIM instance.
+        Setting a route to the same agent on several connections lets
+        publishes to it be spread over them, see PublishPolicy.
 
         Args:
             organization (str): The organization of the agent.
             namespace (str): The namespace of the agent.
             agent (str): The name of the agent.
             id (int): Optional ID of the agent.
+            conn_id (int): Connection to route through, the default one if None.
 
         Returns:
             None
         """
 
+        conn = self._conn(conn_id)
         name = PyAgentType(organization, namespace, agent)
-        await set_route(self.svc, self.conn_id, name, id)
+        await set_route(self.svc, conn, name, id)
+
+        conns = self._route_conns.setdefault((organization, namespace, agent, id), [])
+        if conn not in conns:
+            conns.append(conn)
 
     async def remove_route(
-        self, organization: str, namespace: str, agent: str, id: Optional[int] = None
+        self,
+        organization: str,
+        namespace: str,
+        agent: str,
+        id: Optional[int] = None,
+        conn_id: Optional[int] = None,
     ):
         """
         Remove route for outgoing messages via the connected SLIM instance.
@@ -487,16 +896,30 @@ class Slim:
             namespace (str): The namespace of the agent.
             agent (str): The name of the agent.
             id (int): Optional ID of the agent.
+            conn_id (int): Connection the route was set on, the default one if None.
 
         Returns:
             None
         """
 
+        conn = self._conn(conn_id)
         name = PyAgentType(organization, namespace, agent)
-        await remove_route(self.svc, self.conn_id, name, id)
+        await remove_route(self.svc, conn, name, id)
+
+        key = (organization, namespace, agent, id)
+        conns = self._route_conns.get(key, [])
+        if conn in conns:
+            conns.remove(conn)
+            if not conns:
+                del self._route_conns[key]
 
     async def subscribe(
-        self, organization: str, namespace: str, agent: str, id: Optional[int] = None
+        self,
+        organization: str,
+        namespace: str,
+        agent: str,
+        id: Optional[int] = None,
+        conn_id: Optional[int] = None,
     ):
         """
         Subscribe to receive messages for the given agent.
@@ -506,16 +929,22 @@ class Slim:
             namespace (str): The namespace of the agent.
             agent (str): The name of the agent.
             id (int): Optional ID of the agent.
+            conn_id (int): Connection to subscribe on, the default one if None.
 
         Returns:
             None
         """
 
         sub = PyAgentType(organization, namespace, agent)
-        await subscribe(self.svc, self.conn_id, sub, id)
+        await subscribe(self.svc, self._conn(conn_id), sub, id)
 
     async def unsubscribe(
-        self, organization: str, namespace: str, agent: str, id: Optional[int] = None
+        self,
+        organization: str,
+        namespace: str,
+        agent: str,
+        id: Optional[int] = None,
+        conn_id: Optional[int] = None,
     ):
         """
         Unsubscribe from receiving messages for the given agent.
@@ -525,13 +954,56 @@ class Slim:
             namespace (str): The namespace of the agent.
             agent (str): The name of the agent.
             id (int): Optional ID of the agent.
+            conn_id (int): Connection the subscription was made on, the
+                default one if None.
 
         Returns:
             None
         """
 
         unsub = PyAgentType(organization, namespace, agent)
-        await unsubscribe(self.svc, self.conn_id, unsub, id)
+        await unsubscribe(self.svc, self._conn(conn_id), unsub, id)
+
+    def _conn(self, conn_id: Optional[int]) -> int:
+        """
+        Get the connection to use, the default one if conn_id is None.
+        """
+
+        conn = self.conn_id if conn_id is None else conn_id
+        if conn is None:
+            raise Exception("not connected to any SLIM service")
+        return conn
+
+    def _publish_conn(
+        self,
+        session: PySessionInfo,
+        organization: str,
+        namespace: str,
+        agent: str,
+        agent_id: Optional[int],
+    ) -> Optional[int]:
+        """
+        Pick the connection to publish on according to the publish policy.
+        None leaves the choice to the routing table of the service.
+        """
+
+        if self.publish_policy is PublishPolicy.ROUTE:
+            return None
+
+        # routes to a specific agent first, then routes to any agent of that name
+        conns = self._route_conns.get(
+            (organization, namespace, agent, agent_id)
+        ) or self._route_conns.get((organization, namespace, agent, None))
+        if not conns:
+            return None
+        if len(conns) == 1:
+            return conns[0]
+
+        if self.publish_policy is PublishPolicy.ROUND_ROBIN:
+            index = next(self._publish_counter)
+        else:
+            index = hash((session.id, organization, namespace, agent, agent_id))
+        return conns[index % len(conns)]
 
     async def publish(
         self,
@@ -541,6 +1013,7 @@ class Slim:
         namespace: str,
         agent: str,
         agent_id: Optional[int] = None,
+        conn_id: Optional[int] = None,
     ):
         """
         Publish a message to an agent via normal matching in subscription table.
@@ -552,17 +1025,78 @@ class Slim:
             namespace (str): The namespace of the agent.
             agent (str): The name of the agent.
             agent_id (int): Optional ID of the agent.
+            conn_id (int): Connection to publish on, picked according to the
+                publish policy if None.
 
         Returns:
             None
         """
 
         # Make sure the sessions exists
-        if session.id not in self.sessions:
+        if session.id not in self.dispatcher:
             raise Exception("session not found", session.id)
 
-        dest = PyAgentType(organization, namespace, agent)
-        await publish(self.svc, session, 1, msg, dest, agent_id)
+        if conn_id is None:
+            conn_id = self._publish_conn(
+                session, organization, namespace, agent, agent_id
+            )
+
+        dest = self._agent_name(organization, namespace, agent)
+        await publish(self.svc, session, 1, msg, dest, agent_id, conn_id)
+        self.dispatcher.touch(session.id)
+
+    async def publish_many(
+        self,
+        session: PySessionInfo,
+        messages: list[
+            tuple[bytes, Union[tuple[str, str, str], tuple[str, str, str, int], None]]
+        ],
+    ) -> list[Optional[Exception]]:
+        """
+        Publish a batch of messages in a single call to the service.
+
+        Args:
+            session (PySessionInfo): The session information.
+            messages (list): (payload, destination) tuples. The destination is
+                (organization, namespace, agent) or (organization, namespace,
+                agent, agent_id), or None to send the message back to the agent
+                that sent the last message of the session (as publish_to).
+
+        Returns:
+            list: For each message, None if it was published, the error otherwise.
+        """
+
+        # Make sure the sessions exists
+        if session.id not in self.dispatcher:
+            raise Exception("session not found", session.id)
+
+        batch = []
+        for msg, dest in messages:
+            if dest is None:
+                batch.append((msg, None, None, None))
+            else:
+                agent_id = dest[3] if len(dest) > 3 else None
+                conn_id = self._publish_conn(session, *dest[:3], agent_id)
+                batch.append((msg, self._agent_name(*dest[:3]), agent_id, conn_id))
+
+        errors = await publish_many(self.svc, session, 1, batch)
+        self.dispatcher.touch(session.id)
+        return [None if err is None else Exception(err) for err in errors]
+
+    def _agent_name(self, organization: str, namespace: str, agent: str) -> PyAgentType:
+        """
+        Get the name of an agent, reusing the instance created for earlier messages.
+        """
+
+        key = (organization, namespace, agent)
+        name = self._agent_names.get(key)
+        if name is None:
+            if len(self._agent_names) >= MAX_CACHED_AGENT_NAMES:
+                self._agent_names.clear()
+            name = PyAgentType(organization, namespace, agent)
+            self._agent_names[key] = name
+
+        return name
 
     async def invite(
         self,
@@ -570,7 +1104,7 @@ class Slim:
         name: PyAgentType,
     ):
         # Make sure the sessions exists
-        if session.id not in self.sessions:
+        if session.id not in self.dispatcher:
             raise Exception("session not found", session.id)
 
         await invite(self.svc, session, name)
@@ -601,11 +1135,13 @@ class Slim:
         """
 
         # Make sure the sessions exists
-        if session.id not in self.sessions:
+        if session.id not in self.dispatcher:
             raise Exception("Session ID not found")
 
-        dest = PyAgentType(organization, namespace, agent)
-        await publish(self.svc, session, 1, msg, dest, agent_id)
+        conn_id = self._publish_conn(session, organization, namespace, agent, agent_id)
+        dest = self._agent_name(organization, namespace, agent)
+        await publish(self.svc, session, 1, msg, dest, agent_id, conn_id)
+        self.dispatcher.touch(session.id)
 
         # Wait for a reply in the corresponding session queue with timeout
         if timeout is not None:
@@ -631,6 +1167,7 @@ class Slim:
         """
 
         await publish(self.svc, session, 1, msg)
+        self.dispatcher.touch(session.id)
 
     async def receive(
         self, session: Optional[int] = None
@@ -645,59 +1182,79 @@ class Slim:
             session (int): The session ID. If None, the function will wait for any message.
 
         Returns:
-            tuple: The PySessionInfo and the message.
+            tuple: The PySessionInfo and the message. When waiting for a new session,
+                the message is None: the first message of the session is delivered
+                by receiving on the session ID.
 
         Raise:
             Exception: If the session ID is not found.
+            SLIMSessionOverflowError: If messages of the session were dropped.
         """
 
-        # If session is None, wait for any message
+        # If session is None, wait for new sessions
         if session is None:
-            return await self.sessions[SESSION_UNSPECIFIED][1].get()
-        else:
-            # Check if the session ID is in the sessions map
-            if session not in self.sessions:
-                raise Exception("Session ID not found")
+            return await self.dispatcher.get()
 
-            # Get the queue for the session
-            queue = self.sessions[session][1]
+        # Check if the session ID is in the dispatcher
+        if session not in self.dispatcher:
+            raise Exception("Session ID not found")
 
-            # Wait for a message from the queue
-            ret = await queue.get()
+        # Wait for a message from the session queue
+        ret = await self.dispatcher.get(session)
 
-            # If message is am exception, raise it
-            if isinstance(ret, Exception):
-                raise ret
+        # If message is am exception, raise it
+        if isinstance(ret, Exception):
+            raise ret
 
-            # Otherwise, return the message
-            return ret
+        # Otherwise, return the message
+        return ret
 
-    async def _receive_loop(self) -> None:
+    async def receive_batch(
+        self, session: int, n: int
+    ) -> list[tuple[PySessionInfo, bytes]]:
         """
-        Receive messages in a loop running in the background.
+        Receive up to n messages of a session in one call.
+        This function will block until at least one message is received, then
+        return it together with the messages already queued for the session.
+
+        Args:
+            session (int): The session ID.
+            n (int): The maximum number of messages to return.
 
         Returns:
-            None
+            list: The (PySessionInfo, message) tuples, in order of arrival.
+
+        Raise:
+            Exception: If the session ID is not found.
+            SLIMSessionOverflowError: If messages of the session were dropped.
         """
 
-        while True:
-            try:
-                session_info_msg = await receive(self.svc)
+        # Check if the session ID is in the dispatcher
+        if session not in self.dispatcher:
+            raise Exception("Session ID not found")
 
-                id: int = session_info_msg[0].id
+        ret = await self.dispatcher.get_many(session, n)
 
-                # Check if the session ID is in the sessions map
-                if id not in self.sessions:
-                    # Create the entry in the sessions map
-                    self.sessions[id] = (
-                        session_info_msg,
-                        asyncio.Queue(),
-                    )
+        # If the session received an error, raise it
+        if isinstance(ret, Exception):
+            raise ret
 
-                    # Also add a queue for the session
-                    await self.sessions[SESSION_UNSPECIFIED][1].put(session_info_msg)
+        return ret
 
-                await self.sessions[id][1].put(session_info_msg)
+    async def _receive_loop(self) -> None:
+        """
+        Receive messages in a loop running in the background. Messages are
+        fetched from the service in batches, so a burst costs a single wakeup.
+
+        Returns:
+            None
+        """
+
+        while True:
+            try:
+                batch = await receive_many(self.svc, self.receive_batch_size)
+                for session_info, msg in batch:
+                    await self.dispatcher.dispatch(session_info, msg)
             except asyncio.CancelledError:
                 raise
             except Exception as e:
@@ -713,15 +1270,25 @@ class Slim:
                         # we don't know the reason, just raise the original exception
                         raise e
 
-                    if session_id in self.sessions:
-                        await self.sessions[session_id][1].put(
-                            err,
-                        )
-                    else:
-                        print(self.sessions.keys())
+                    if not await self.dispatcher.dispatch_error(session_id, err):
+                        print("Error for unknown session:", session_id)
                 except Exception:
                     raise e
 
+    async def _reap_loop(self) -> None:
+        """
+        Forget idle sessions opened by remote agents, in a loop running in the background.
+
+        Returns:
+            None
+        """
+
+        # check a few times per timeout period, at most once per second
+        interval = max(self.dispatcher.idle_timeout.total_seconds() / 4, 1.0)
+        while True:
+            await asyncio.sleep(interval)
+            self.dispatcher.reap_idle()
+
 
 def parse_error_message(error_message):
     import re
@@ -2,6 +2,7 @@
 # ruff: noqa: E501, F401
 
 import builtins
+import datetime
 import typing
 from enum import Enum, auto
 
@@ -104,12 +105,18 @@ def init_tracing(config:dict) -> typing.Any:
 def invite(svc:PyService, session_info:PySessionInfo, name:PyAgentType) -> typing.Any:
     ...
 
-def publish(svc:PyService, session_info:PySessionInfo, fanout:builtins.int, blob:typing.Sequence[builtins.int], name:typing.Optional[PyAgentType]=None, id:typing.Optional[builtins.int]=None) -> typing.Any:
+def publish(svc:PyService, session_info:PySessionInfo, fanout:builtins.int, blob:typing.Sequence[builtins.int], name:typing.Optional[PyAgentType]=None, id:typing.Optional[builtins.int]=None, conn:typing.Optional[builtins.int]=None) -> typing.Any:
+    ...
+
+def publish_many(svc:PyService, session_info:PySessionInfo, fanout:builtins.int, messages:typing.Sequence[tuple[typing.Sequence[builtins.int], typing.Optional[PyAgentType], typing.Optional[builtins.int], typing.Optional[builtins.int]]]) -> typing.Any:
     ...
 
 def receive(svc:PyService) -> typing.Any:
     ...
 
+def receive_many(svc:PyService, max_messages:builtins.int, max_wait:typing.Optional[datetime.timedelta]=None) -> typing.Any:
+    ...
+
 def remove(svc:PyService, session_info:PySessionInfo, name:PyAgentType, id:builtins.int) -> typing.Any:
     ...
 
@@ -17,9 +17,9 @@ mod _slim_bindings {
     #[pymodule_export]
     use pyservice::{
         PyService, connect, create_pyservice, create_session, delete_session, disconnect,
-        get_default_session_config, get_session_config, invite, publish, receive, remove,
-        remove_route, run_server, set_default_session_config, set_route, set_session_config,
-        stop_server, subscribe, unsubscribe,
+        get_default_session_config, get_session_config, invite, publish, publish_many, receive,
+        receive_many, remove, remove_route, run_server, set_default_session_config, set_route,
+        set_session_config, stop_server, subscribe, unsubscribe,
     };
 
     #[pymodule_export]
@@ -19,6 +19,7 @@ use slim_service::errors::SessionError;
 use slim_service::session;
 use slim_service::{Service, ServiceError};
 use tokio::sync::RwLock;
+use tokio::sync::mpsc::error::TryRecvError;
 
 use crate::pyidentity::IdentityProvider;
 use crate::pyidentity::IdentityVerifier;
@@ -45,7 +46,62 @@ where
     app: App<P, V>,
     service: Service,
     agent: Agent,
-    rx: RwLock<session::AppChannelReceiver>,
+    rx: RwLock<AppReceiver>,
+}
+
+/// A message of a publish_many batch: payload, destination name and id, and
+/// the connection to send it on (None to match it against the routes).
+type PublishRequest = (Vec<u8>, Option<PyAgentType>, Option<u64>, Option<u64>);
+
+/// Receiving side of the app channel.
+///
+/// A batch stops at the first error received after some messages, so that
+/// the messages are delivered first: the error is stashed and returned by
+/// the next receive call.
+struct AppReceiver {
+    rx: session::AppChannelReceiver,
+    stashed: Option<Result<session::SessionMessage, SessionError>>,
+}
+
+impl AppReceiver {
+    async fn recv(&mut self) -> Option<Result<session::SessionMessage, SessionError>> {
+        match self.stashed.take() {
+            Some(msg) => Some(msg),
+            None => self.rx.recv().await,
+        }
+    }
+}
+
+/// Extract the session info and the payload from a message received from the app channel.
+fn session_payload(
+    msg: &session::SessionMessage,
+) -> Result<(PySessionInfo, Vec<u8>), ServiceError> {
+    // extract agent and payload
+    let content = match msg.message.message_type {
+        Some(ref msg_type) => match msg_type {
+            slim_datapath::api::ProtoPublishType(publish) => &publish.get_payload().blob,
+            _ => Err(ServiceError::ReceiveError(
+                "receive publish message type".to_string(),
+            ))?,
+        },
+        _ => Err(ServiceError::ReceiveError(
+            "no message received".to_string(),
+        ))?,
+    };
+
+    Ok((PySessionInfo::from(msg.info.clone()), content.to_vec()))
+}
+
+fn into_session_payload(
+    msg: Option<Result<session::SessionMessage, SessionError>>,
+) -> Result<(PySessionInfo, Vec<u8>), ServiceError> {
+    match msg {
+        None => Err(ServiceError::ReceiveError(
+            "no message received".to_string(),
+        )),
+        Some(Err(e)) => Err(ServiceError::ReceiveError(e.to_string())),
+        Some(Ok(msg)) => session_payload(&msg),
+    }
 }
 
 #[gen_stub_pymethods]
@@ -96,7 +152,7 @@ impl PyService {
             service: svc,
             app,
             agent,
-            rx: RwLock::new(rx),
+            rx: RwLock::new(AppReceiver { rx, stashed: None }),
         });
 
         Ok(PyService { sdk })
@@ -173,30 +229,42 @@ impl PyService {
         self.sdk.app.remove_route(&class, id, conn).await
     }
 
-    async fn publish(
-        &self,
-        session_info: session::Info,
-        fanout: u32,
-        blob: Vec<u8>,
-        name: Option<PyAgentType>,
+    /// Resolve the destination of a message. Without a name, the message goes
+    /// back to the source of the session, via the connection it came from.
+    /// Otherwise it is sent on conn if given, or matched against the routes.
+    fn destination(
+        session_info: &session::Info,
+        name: Option<AgentType>,
         id: Option<u64>,
-    ) -> Result<(), ServiceError> {
-        let (agent_type, agent_id, conn_out) = match name {
-            Some(name) => (name.into(), id, None),
+        conn: Option<u64>,
+    ) -> Result<(AgentType, Option<u64>, Option<u64>), ServiceError> {
+        match name {
+            Some(name) => Ok((name, id, conn)),
             None => {
                 // use the session_info to set a name
                 match &session_info.message_source {
-                    Some(agent) => (
+                    Some(agent) => Ok((
                         agent.agent_type().clone(),
                         Some(agent.agent_id()),
                         session_info.input_connection,
-                    ),
-                    None => {
-                        return Err(ServiceError::ConfigError("no agent specified".to_string()));
-                    }
+                    )),
+                    None => Err(ServiceError::ConfigError("no agent specified".to_string())),
                 }
             }
-        };
+        }
+    }
+
+    async fn publish(
+        &self,
+        session_info: session::Info,
+        fanout: u32,
+        blob: Vec<u8>,
+        name: Option<PyAgentType>,
+        id: Option<u64>,
+        conn: Option<u64>,
+    ) -> Result<(), ServiceError> {
+        let (agent_type, agent_id, conn_out) =
+            Self::destination(&session_info, name.map(Into::into), id, conn)?;
 
         // set flags
         let flags = SlimHeaderFlags::new(fanout, None, conn_out, None, None);
@@ -207,6 +275,50 @@ impl PyService {
             .await
     }
 
+    async fn publish_many(
+        &self,
+        session_info: session::Info,
+        fanout: u32,
+        messages: Vec<PublishRequest>,
+    ) -> Vec<Option<String>> {
+        let mut results = Vec::with_capacity(messages.len());
+
+        // consecutive messages to the same destination reuse the converted name
+        let mut last_name: Option<(PyAgentType, AgentType)> = None;
+
+        for (blob, name, id, conn) in messages {
+            let name = name.map(|name| match &last_name {
+                Some((py_name, agent_type)) if *py_name == name => agent_type.clone(),
+                _ => {
+                    let agent_type = AgentType::from(&name);
+                    last_name = Some((name, agent_type.clone()));
+                    agent_type
+                }
+            });
+
+            let res = match Self::destination(&session_info, name, id, conn) {
+                Ok((agent_type, agent_id, conn_out)) => {
+                    let flags = SlimHeaderFlags::new(fanout, None, conn_out, None, None);
+                    self.sdk
+                        .app
+                        .publish_with_flags(
+                            session_info.clone(),
+                            &agent_type,
+                            agent_id,
+                            flags,
+                            blob,
+                        )
+                        .await
+                }
+                Err(e) => Err(e),
+            };
+
+            results.push(res.err().map(|e| e.to_string()));
+        }
+
+        results
+    }
+
     async fn invite(
         &self,
         session_info: session::Info,
@@ -231,31 +343,51 @@ impl PyService {
     async fn receive(&self) -> Result<(PySessionInfo, Vec<u8>), ServiceError> {
         let mut rx = self.sdk.rx.write().await;
 
-        // tokio select
-        tokio::select! {
-            msg = rx.recv() => {
-                if msg.is_none() {
-                    return Err(ServiceError::ReceiveError("no message received".to_string()));
-                }
+        into_session_payload(rx.recv().await)
+    }
+
+    async fn receive_many(
+        &self,
+        max_messages: usize,
+        max_wait: Option<std::time::Duration>,
+    ) -> Result<Vec<(PySessionInfo, Vec<u8>)>, ServiceError> {
+        let mut rx = self.sdk.rx.write().await;
 
-                let msg = msg.unwrap().map_err(|e| ServiceError::ReceiveError(e.to_string()))?;
+        // block until the first message is available
+        let mut batch = vec![into_session_payload(rx.recv().await)?];
 
-                // extract agent and payload
-                let content = match msg.message.message_type {
-                    Some(ref msg_type) => match msg_type {
-                        slim_datapath::api::ProtoPublishType(publish) => &publish.get_payload().blob,
-                        _ => Err(ServiceError::ReceiveError(
-                            "receive publish message type".to_string(),
-                        ))?,
-                    },
-                    _ => Err(ServiceError::ReceiveError(
-                        "no message received".to_string(),
-                    ))?,
-                };
+        let deadline = max_wait.map(|wait| tokio::time::Instant::now() + wait);
 
-                Ok((PySessionInfo::from(msg.info), content.to_vec()))
+        while batch.len() < max_messages {
+            // drain what is already queued, then wait for more until the deadline
+            let msg = match rx.rx.try_recv() {
+                Ok(msg) => msg,
+                Err(TryRecvError::Empty) => match deadline {
+                    Some(deadline) => match tokio::time::timeout_at(deadline, rx.rx.recv()).await {
+                        Ok(Some(msg)) => msg,
+                        _ => break,
+                    },
+                    None => break,
+                },
+                Err(TryRecvError::Disconnected) => break,
+            };
+
+            let item = match &msg {
+                Ok(msg) => session_payload(msg).ok(),
+                Err(_) => None,
+            };
+
+            match item {
+                Some(item) => batch.push(item),
+                None => {
+                    // deliver the batch first, the error is returned on the next call
+                    rx.stashed = Some(msg);
+                    break;
+                }
             }
         }
+
+        Ok(batch)
     }
 
     async fn set_session_config(
@@ -507,7 +639,8 @@ pub fn remove_route(
 
 #[gen_stub_pyfunction]
 #[pyfunction]
-#[pyo3(signature = (svc, session_info, fanout, blob, name=None, id=None))]
+#[pyo3(signature = (svc, session_info, fanout, blob, name=None, id=None, conn=None))]
+#[allow(clippy::too_many_arguments)]
 pub fn publish(
     py: Python,
     svc: PyService,
@@ -516,14 +649,32 @@ pub fn publish(
     blob: Vec<u8>,
     name: Option<PyAgentType>,
     id: Option<u64>,
+    conn: Option<u64>,
 ) -> PyResult<Bound<PyAny>> {
     pyo3_async_runtimes::tokio::future_into_py(py, async move {
-        svc.publish(session_info.session_info, fanout, blob, name, id)
+        svc.publish(session_info.session_info, fanout, blob, name, id, conn)
             .await
             .map_err(|e| PyErr::new::<PyException, _>(e.to_string()))
     })
 }
 
+#[gen_stub_pyfunction]
+#[pyfunction]
+#[pyo3(signature = (svc, session_info, fanout, messages))]
+pub fn publish_many(
+    py: Python,
+    svc: PyService,
+    session_info: PySessionInfo,
+    fanout: u32,
+    messages: Vec<PublishRequest>,
+) -> PyResult<Bound<PyAny>> {
+    pyo3_async_runtimes::tokio::future_into_py(py, async move {
+        Ok(svc
+            .publish_many(session_info.session_info, fanout, messages)
+            .await)
+    })
+}
+
 #[gen_stub_pyfunction]
 #[pyfunction]
 #[pyo3(signature = (svc, session_info, name))]
@@ -572,6 +723,32 @@ pub fn receive(py: Python, svc: PyService) -> PyResult<Bound<PyAny>> {
     )
 }
 
+#[gen_stub_pyfunction]
+#[pyfunction]
+#[pyo3(signature = (svc, max_messages, max_wait=None))]
+pub fn receive_many(
+    py: Python,
+    svc: PyService,
+    max_messages: usize,
+    max_wait: Option<std::time::Duration>,
+) -> PyResult<Bound<PyAny>> {
+    if max_messages == 0 {
+        return Err(PyErr::new::<PyException, _>(
+            "max_messages must be greater than 0",
+        ));
+    }
+
+    pyo3_async_runtimes::tokio::future_into_py_with_locals(
+        py,
+        pyo3_async_runtimes::tokio::get_current_locals(py)?,
+        async move {
+            svc.receive_many(max_messages, max_wait)
+                .await
+                .map_err(|e| PyErr::new::<PyException, _>(e.to_string()))
+        },
+    )
+}
+
 #[gen_stub_pyfunction]
 #[pyfunction]
 #[pyo3(signature = (organization, namespace, agent_type, provider, verifier))]
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import asyncio
+import datetime
 
 import pytest
 from common import create_slim, create_svc
@@ -87,6 +88,62 @@ async def test_end_to_end(server):
         assert "session not found" in str(e)
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("server", ["127.0.0.1:12348"], indirect=True)
+async def test_receive_many(server):
+    svc_alice = await create_svc("org", "default", "alice", "secret")
+    svc_bob = await create_svc("org", "default", "bob", "secret")
+
+    # connect to the service
+    conn_id_alice = await slim_bindings.connect(
+        svc_alice,
+        {"endpoint": "http://127.0.0.1:12348", "tls": {"insecure": True}},
+    )
+    conn_id_bob = await slim_bindings.connect(
+        svc_bob,
+        {"endpoint": "http://127.0.0.1:12348", "tls": {"insecure": True}},
+    )
+
+    # subscribe alice and bob
+    alice_class = slim_bindings.PyAgentType("org", "default", "alice")
+    bob_class = slim_bindings.PyAgentType("org", "default", "bob")
+    await slim_bindings.subscribe(svc_alice, conn_id_alice, alice_class, svc_alice.id)
+    await slim_bindings.subscribe(svc_bob, conn_id_bob, bob_class, svc_bob.id)
+
+    await asyncio.sleep(1)
+
+    # set routes
+    await slim_bindings.set_route(svc_alice, conn_id_alice, bob_class, None)
+
+    # create fire and forget session
+    session_info = await slim_bindings.create_session(
+        svc_alice, slim_bindings.PySessionConfiguration.FireAndForget()
+    )
+
+    # send a burst of messages from Alice to Bob
+    count = 10
+    for i in range(count):
+        await slim_bindings.publish(svc_alice, session_info, 1, [i], bob_class, None)
+
+    # drain them in batches of at most 4 messages
+    received = []
+    while len(received) < count:
+        batch = await slim_bindings.receive_many(
+            svc_bob, 4, datetime.timedelta(milliseconds=100)
+        )
+        assert 1 <= len(batch) <= 4
+        for session_info_ret, msg_rcv in batch:
+            assert session_info_ret.id == session_info.id
+            received.append(msg_rcv)
+
+    # messages are delivered in order
+    assert received == [bytes([i]) for i in range(count)]
+
+    # disconnect alice and bob
+    await slim_bindings.disconnect(svc_alice, conn_id_alice)
+    await slim_bindings.disconnect(svc_bob, conn_id_bob)
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize("server", ["127.0.0.1:12344"], indirect=True)
 async def test_session_config(server):
@@ -260,6 +317,117 @@ async def test_slim_wrapper(server):
         assert "session not found" in str(e), f"Unexpected error message: {str(e)}"
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("server", ["127.0.0.1:12349"], indirect=True)
+async def test_publish_many(server):
+    org = "org"
+    ns = "default"
+
+    # create two local agents connected to the same server
+    sender = await create_slim(org, ns, "sender", "secret")
+    _ = await sender.connect(
+        {"endpoint": "http://127.0.0.1:12349", "tls": {"insecure": True}}
+    )
+    receiver = await create_slim(org, ns, "receiver", "secret")
+    _ = await receiver.connect(
+        {"endpoint": "http://127.0.0.1:12349", "tls": {"insecure": True}}
+    )
+
+    # Wait for routes to propagate
+    await asyncio.sleep(1)
+
+    await sender.set_route(org, ns, "receiver")
+
+    session_info = await sender.create_session(
+        slim_bindings.PySessionConfiguration.FireAndForget()
+    )
+
+    async with sender, receiver:
+        # publish a batch of messages in a single call
+        count = 20
+        results = await sender.publish_many(
+            session_info,
+            [(bytes([i]), (org, ns, "receiver")) for i in range(count)],
+        )
+        assert results == [None] * count
+
+        # wait for the new session
+        session_info_rec, _ = await receiver.receive()
+
+        received = []
+        while len(received) < count:
+            batch = await receiver.receive_batch(session_info_rec.id, count)
+            received.extend(msg for _, msg in batch)
+
+        assert received == [bytes([i]) for i in range(count)]
+
+        # reply to the sender in one batch
+        results = await receiver.publish_many(
+            session_info_rec, [(b"ack-1", None), (b"ack-2", None)]
+        )
+        assert results == [None, None]
+
+        _, msg = await sender.receive(session=session_info.id)
+        assert msg == b"ack-1"
+        _, msg = await sender.receive(session=session_info.id)
+        assert msg == b"ack-2"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("server", ["127.0.0.1:12350"], indirect=True)
+async def test_multiple_connections(server):
+    org = "org"
+    ns = "default"
+
+    # the sender opens two connections, the receiver a single one
+    sender = await create_slim(org, ns, "sender", "secret")
+    sender.publish_policy = slim_bindings.PublishPolicy.ROUND_ROBIN
+    conn_1 = await sender.connect(
+        {"endpoint": "http://127.0.0.1:12350", "tls": {"insecure": True}}
+    )
+    conn_2 = await sender.connect(
+        {"endpoint": "http://localhost:12350", "tls": {"insecure": True}}
+    )
+    assert conn_1 != conn_2
+    assert sender.conn_id == conn_1
+
+    receiver = await create_slim(org, ns, "receiver", "secret")
+    _ = await receiver.connect(
+        {"endpoint": "http://127.0.0.1:12350", "tls": {"insecure": True}}
+    )
+
+    # Wait for routes to propagate
+    await asyncio.sleep(1)
+
+    # route to the receiver over both connections
+    await sender.set_route(org, ns, "receiver", conn_id=conn_1)
+    await sender.set_route(org, ns, "receiver", conn_id=conn_2)
+
+    session_info = await sender.create_session(
+        slim_bindings.PySessionConfiguration.FireAndForget()
+    )
+
+    async with sender, receiver:
+        count = 10
+        for i in range(count):
+            await sender.publish(session_info, bytes([i]), org, ns, "receiver")
+
+        session_info_rec, _ = await receiver.receive()
+        received = set()
+        while len(received) < count:
+            _, msg = await receiver.receive(session=session_info_rec.id)
+            received.add(msg)
+        assert received == {bytes([i]) for i in range(count)}
+
+        # the remaining connection becomes the default and keeps the route
+        await sender.disconnect("http://127.0.0.1:12350")
+        assert sender.conn_id == conn_2
+
+        await sender.publish(session_info, b"after", org, ns, "receiver")
+        _, msg = await receiver.receive(session=session_info_rec.id)
+        assert msg == b"after"
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize("server", ["127.0.0.1:12346"], indirect=True)
 async def test_auto_reconnect_after_server_restart(server):
@@ -0,0 +1,165 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import datetime
+
+import pytest
+
+import slim_bindings
+
+
+@pytest.mark.asyncio
+async def test_new_session_is_announced_once():
+    dispatcher = slim_bindings.SessionDispatcher()
+    session = slim_bindings.PySessionInfo(1)
+
+    await dispatcher.dispatch(session, b"first")
+    await dispatcher.dispatch(session, b"second")
+
+    # the new session is announced without its payload
+    session_info, msg = await dispatcher.get()
+    assert session_info.id == 1
+    assert msg is None
+
+    # and every message is delivered exactly once on the session queue
+    assert await dispatcher.get(1) == (session, b"first")
+    assert await dispatcher.get(1) == (session, b"second")
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(dispatcher.get(), timeout=0.1)
+
+
+@pytest.mark.asyncio
+async def test_overflow_drop_oldest():
+    dispatcher = slim_bindings.SessionDispatcher(
+        queue_size=2,
+        overflow_policy=slim_bindings.SessionOverflowPolicy.DROP_OLDEST,
+    )
+    session = slim_bindings.PySessionInfo(2)
+
+    for i in range(5):
+        await dispatcher.dispatch(session, bytes([i]))
+
+    assert dispatcher.dropped == 3
+    assert (await dispatcher.get(2))[1] == bytes([3])
+    assert (await dispatcher.get(2))[1] == bytes([4])
+
+
+@pytest.mark.asyncio
+async def test_overflow_error():
+    dispatcher = slim_bindings.SessionDispatcher(
+        queue_size=1,
+        overflow_policy=slim_bindings.SessionOverflowPolicy.ERROR,
+    )
+    session = slim_bindings.PySessionInfo(3)
+
+    for i in range(3):
+        await dispatcher.dispatch(session, bytes([i]))
+
+    assert dispatcher.dropped == 2
+    with pytest.raises(slim_bindings.SLIMSessionOverflowError) as exc_info:
+        await dispatcher.get(3)
+    assert exc_info.value.dropped == 2
+
+    # the queued message is still delivered after the error
+    assert (await dispatcher.get(3))[1] == bytes([0])
+
+
+@pytest.mark.asyncio
+async def test_overflow_block():
+    dispatcher = slim_bindings.SessionDispatcher(queue_size=1)
+    session = slim_bindings.PySessionInfo(4)
+
+    await dispatcher.dispatch(session, b"a")
+    blocked = asyncio.create_task(dispatcher.dispatch(session, b"b"))
+    await asyncio.sleep(0.1)
+    assert not blocked.done()
+    assert dispatcher.backpressured == 1
+
+    assert (await dispatcher.get(4))[1] == b"a"
+    await blocked
+    assert (await dispatcher.get(4))[1] == b"b"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("policy", list(slim_bindings.SessionOverflowPolicy))
+async def test_new_sessions_are_not_bounded(policy):
+    dispatcher = slim_bindings.SessionDispatcher(queue_size=1, overflow_policy=policy)
+
+    # announcements are not drained, yet neither block nor get dropped
+    for i in range(5):
+        await asyncio.wait_for(
+            dispatcher.dispatch(slim_bindings.PySessionInfo(10 + i), b"msg"),
+            timeout=0.1,
+        )
+
+    assert dispatcher.dropped == 0
+    assert dispatcher.backpressured == 0
+    for i in range(5):
+        session_info, msg = await dispatcher.get()
+        assert (session_info.id, msg) == (10 + i, None)
+
+
+@pytest.mark.asyncio
+async def test_reap_idle_sessions():
+    dispatcher = slim_bindings.SessionDispatcher(
+        idle_timeout=datetime.timedelta(seconds=0)
+    )
+
+    # sessions created locally are never reaped
+    dispatcher.add(slim_bindings.PySessionInfo(10))
+
+    # remote session with a pending message is kept until the message is consumed
+    remote = slim_bindings.PySessionInfo(11)
+    await dispatcher.dispatch(remote, b"msg")
+    assert dispatcher.reap_idle() == []
+
+    await dispatcher.get(11)
+    assert dispatcher.reap_idle() == [11]
+    assert 11 not in dispatcher
+    assert 10 in dispatcher
+    assert dispatcher.reaped == 1
+
+
+@pytest.mark.asyncio
+async def test_sessions_in_use_are_not_reaped():
+    # remote sessions are kept by default, however long they stay silent
+    dispatcher = slim_bindings.SessionDispatcher()
+    await dispatcher.dispatch(slim_bindings.PySessionInfo(12), b"msg")
+    await dispatcher.get(12)
+    assert dispatcher.reap_idle() == []
+
+    dispatcher = slim_bindings.SessionDispatcher(
+        idle_timeout=datetime.timedelta(seconds=0.2)
+    )
+    await dispatcher.dispatch(slim_bindings.PySessionInfo(13), b"request")
+    await dispatcher.get(13)
+
+    # the reply sent while handling the request counts as activity
+    await asyncio.sleep(0.15)
+    dispatcher.touch(13)
+    await asyncio.sleep(0.1)
+    assert dispatcher.reap_idle() == []
+
+    await asyncio.sleep(0.15)
+    assert dispatcher.reap_idle() == [13]
+
+
+@pytest.mark.asyncio
+async def test_get_many_holds_back_errors():
+    dispatcher = slim_bindings.SessionDispatcher()
+    session = slim_bindings.PySessionInfo(5)
+
+    for i in range(3):
+        await dispatcher.dispatch(session, bytes([i]))
+    err = slim_bindings.SLIMTimeoutError(1, 5)
+    await dispatcher.dispatch_error(5, err)
+    await dispatcher.dispatch(session, b"after")
+
+    batch = await dispatcher.get_many(5, 10)
+    assert [msg for _, msg in batch] == [bytes([0]), bytes([1]), bytes([2])]
+
+    # the error comes next, then the remaining messages
+    assert await dispatcher.get_many(5, 10) is err
+    assert [msg for _, msg in await dispatcher.get_many(5, 10)] == [b"after"]